@@ -0,0 +1,452 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2014 Evgeny Gridasov (evgeny.gridasov@gmail.com), http://egreex.com, https://awsreport.egreex.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+import argparse
+import copy
+import os
+import re
+import sys
+import time
+from itertools import izip
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+try:
+	import simplejson as json
+except ImportError:
+	import json
+
+import ec2instancespricing
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Sample documents in fixtures/, in the formats published by Amazon, served by FixtureTransport:
+#   name -> (file name, keys are quoted, predicate selecting the PRICING_SOURCES it stands in for)
+FIXTURES = [
+	("linux-od", "linux-od.min.js", False, lambda s: s.kind == "ondemand"),
+	("ri-v2", "linux-unix-shared.min.js", False, lambda s: s.model == "purchase-option"),
+	("ri-heavy", "linux-ri-heavy.min.js", False, lambda s: s.model == "utilization"),
+	("spot", "spot.js", True, lambda s: s.kind == "spot")
+]
+
+def legacy_parse(f):
+	""" The regex + eval decoder used by _load_data before the single-pass parser """
+	f = re.sub("/\\*[^\x00]+\\*/", "", f, 0, re.M)
+	f = re.sub("([a-zA-Z0-9]+):", "\"\\1\":", f)
+	f = re.sub(";", "\n", f)
+	f = re.sub("null", "None", f);
+	def callback(json):
+		return json
+	return eval(f, {"__builtins__" : None}, {"callback" : callback} )
+
+def legacy_reserved_regions(filter_region=None, filter_instance_type=None, filter_os_type=None):
+	""" The normalization loop of _iter_reserved_regions before it was reworked, for comparison """
+
+	get_specific_region = (filter_region is not None)
+	get_specific_instance_type = (filter_instance_type is not None)
+
+	currency = ec2instancespricing.DEFAULT_CURRENCY
+
+	sources = ec2instancespricing.plan_sources("reserved", filter_instance_type, filter_os_type)
+
+	for source, data in izip(sources, ec2instancespricing._load_data_many([s.url for s in sources], 1)):
+		os_type = source.os
+		reservation_type = source.reservation
+		if "config" in data and data["config"] and "regions" in data["config"] and data["config"]["regions"]:
+			for r in data["config"]["regions"]:
+				if "region" in r and r["region"]:
+					region_name = ec2instancespricing.JSON_NAME_TO_EC2_REGIONS_API[r["region"]]
+					if get_specific_region and filter_region != region_name:
+						continue
+
+					entries = []
+					if "instanceTypes" in r:
+						for it in r["instanceTypes"]:
+							# old reserved instances
+							if "sizes" in it:
+								for s in it["sizes"]:
+									_type = re.sub("[^a-z0-9.]*", "", s["size"])
+
+									if get_specific_instance_type and _type != filter_instance_type:
+										continue
+
+									upfront1 = hourly1 = upfront3 = hourly3 = None
+									for price_data in s["valueColumns"]:
+										price = None
+										try:
+											price = float(price_data["prices"][currency])
+										except ValueError:
+											price = None
+
+										if price_data["name"] == "yrTerm1":
+											upfront1 = price
+										elif price_data["name"] == "yrTerm1Hourly":
+											hourly1 = price
+										elif price_data["name"] == "yrTerm3":
+											upfront3 = price
+										elif price_data["name"] == "yrTerm3Hourly":
+											hourly3 = price
+									if upfront1 != None or hourly1 != None or upfront3 != None or hourly3 != None:
+										entries.append((_type, os_type, reservation_type, [("1year", hourly1, upfront1), ("3year", hourly3, upfront3)]))
+
+							# new reserved instances
+							if "type" in it and "terms" in it:
+								_type = it["type"]
+								if get_specific_instance_type and _type != filter_instance_type:
+										continue
+								for term in it["terms"]:
+									for purchaseOpt in term["purchaseOptions"]:
+										upfront = ""
+										hourly = ""
+										prices = []
+										for price_data in purchaseOpt["valueColumns"]:
+											if price_data["name"] == "upfront":
+												upfront = (price_data["prices"]["USD"]).replace(",", "")
+											if price_data["name"] == "monthlyStar":
+												hourly = round(float(str.replace(price_data["prices"]["USD"],",","")) * 12 / 365 / 24, 4)
+										if term["term"] == "yrTerm1Standard":
+											prices.append(("1year", hourly, upfront))
+										if term["term"] == "yrTerm3Standard":
+											prices.append(("3year", hourly, upfront))
+										if term["term"] == "yrTerm3Convertible":
+											prices.append(("c3year", hourly, upfront))
+										entries.append((_type, os_type, purchaseOpt["purchaseOption"], prices))
+
+					yield region_name, entries
+
+def legacy_product_pricing(page):
+	""" get_product_pricing before the single-pass extraction: a whole-page parse and one find() per region and type """
+	from BeautifulSoup import BeautifulSoup
+	import ec2marketplace
+
+	marketplace = BeautifulSoup(page)
+	monthly = marketplace.find('span', attrs={'id':'monthly-fee-text'})
+	m = 0
+	if monthly:
+		m = monthly.text.replace("$", "")
+	result = {"monthly" : m, "regions" : {}}
+	for region in ec2marketplace.EC2_REGIONS:
+		region_result = []
+		result["regions"][region] = region_result
+		region_table = marketplace.find('table', {'id': (region + '-pricing-matrix')})
+		if region_table:
+			headers = region_table.findAll('th')
+			for instance in ec2marketplace.EC2_INSTANCE_TYPES:
+				row = region_table.find('tr', {'id' : region + "-" + ec2marketplace.EC2_INSTANCE_TYPES[instance] + "-row"})
+				if row :
+					price_data = {}
+					region_result.append(price_data)
+					values = row.findAll('td')
+					if values :
+						price_data["instance"] = instance
+						for i, v in enumerate(values):
+							match = re.search("\$([0-9]+\.[0-9]+)/hr", v.text)
+							price_data[headers[i]['class']] = match.group(1) if match else v.text
+	return result
+
+def to_js(value, quote_keys=False):
+	""" Serialize a parsed document back to the JavaScript object literal syntax of the pricing documents """
+	if isinstance(value, dict):
+		return "{" + ",".join([(json.dumps(k) if quote_keys else k) + ":" + to_js(v, quote_keys) for k, v in value.iteritems()]) + "}"
+	if isinstance(value, list):
+		return "[" + ",".join([to_js(v, quote_keys) for v in value]) + "]"
+	return json.dumps(value)
+
+def _renamed(name, copy_number):
+	""" Name of the copy_number-th synthetic copy of an instance type ("m4.large" -> "m4x2.large") """
+	if copy_number == 0:
+		return name
+	family, dot, size = name.partition(".")
+	return "%sx%d%s%s" % (family, copy_number, dot, size)
+
+def scale_document(text, regions, types, quote_keys=False):
+	""" Build a synthetic document with the given number of regions and instance types per region
+	from a sample document. Sample regions and instance types are repeated under new names,
+	which are added to JSON_NAME_TO_EC2_REGIONS_API """
+	data = ec2instancespricing._parse_jsonp(text)
+	templates = data["config"]["regions"]
+	result = []
+	for r in xrange(regions):
+		region = copy.deepcopy(templates[r % len(templates)])
+		region_copy = r // len(templates)
+		if region_copy:
+			api_name = ec2instancespricing.JSON_NAME_TO_EC2_REGIONS_API[region["region"]]
+			region["region"] = "%s-%d" % (region["region"], region_copy)
+			ec2instancespricing.JSON_NAME_TO_EC2_REGIONS_API[region["region"]] = "%s-%d" % (api_name, region_copy)
+
+		groups = region["instanceTypes"]
+		if groups and "terms" in groups[0]:
+			# ri-v2: a list of instance types
+			region["instanceTypes"] = [dict(groups[t % len(groups)], type=_renamed(groups[t % len(groups)]["type"], t // len(groups))) for t in xrange(types)]
+		else:
+			# instance types listed as sizes of instance type groups
+			leaves = [(g, s) for g in groups for s in g["sizes"]]
+			for g in groups:
+				g["sizes"] = []
+			for t in xrange(types):
+				g, s = leaves[t % len(leaves)]
+				g["sizes"].append(dict(s, size=_renamed(s["size"], t // len(leaves))))
+			region["instanceTypes"] = [g for g in groups if g["sizes"]]
+		result.append(region)
+	data["config"]["regions"] = result
+	return "callback(" + to_js(data, quote_keys) + ");"
+
+def load_fixtures(directory, regions=None, types=None):
+	""" Read the sample documents, scaled to regions x types when both are given.
+	Returns a list of (name, document, predicate) """
+	result = []
+	for name, filename, quote_keys, predicate in FIXTURES:
+		with open(os.path.join(directory, filename), "rb") as f:
+			document = f.read()
+		if regions and types:
+			document = scale_document(document, regions, types, quote_keys)
+		result.append((name, document, predicate))
+	return result
+
+class FixtureTransport(ec2instancespricing.Transport):
+	""" Answers every pricing document url with the matching fixture """
+
+	def __init__(self, fixtures):
+		self.documents = {}
+		for source in ec2instancespricing.PRICING_SOURCES:
+			for name, document, predicate in fixtures:
+				if predicate(source):
+					self.documents[source.url] = document
+					break
+
+	def get(self, url, request_headers=None):
+		return 200, {}, self.documents[url]
+
+def install_fixtures(fixtures):
+	""" Serve the pricing documents from the fixtures, and turn off the in-process memo so that every load is parsed again """
+	ec2instancespricing.TRANSPORT = FixtureTransport(fixtures)
+	ec2instancespricing.CACHE_DIR = None
+	ec2instancespricing.MEMO_MAX_DOCUMENTS = 0
+	ec2instancespricing.invalidate()
+
+class NullOutput(object):
+	""" A file which only counts the bytes written to it """
+
+	def __init__(self):
+		self.size = 0
+
+	def write(self, s):
+		self.size += len(s)
+
+	def flush(self):
+		pass
+
+def peak_memory():
+	""" Peak resident set size of this process in MB, None if it is not available """
+	if resource is None:
+		return None
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# kilobytes on Linux, bytes on OS X
+	return peak / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0)
+
+def _timed(setup, fn):
+	arg = setup() if setup is not None else None
+	start = time.time()
+	rows, size = fn(arg)
+	return time.time() - start, rows, size
+
+def isolated(setup, fn):
+	""" Run fn(setup()) in a forked child process, so that the peak memory reported belongs to this benchmark only.
+	fn returns a (rows, bytes) tuple, setup is not timed. Returns (seconds, rows, bytes, peak MB) """
+	if not hasattr(os, "fork"):
+		return _timed(setup, fn) + (peak_memory(),)
+
+	read_fd, write_fd = os.pipe()
+	pid = os.fork()
+	if pid == 0:
+		os.close(read_fd)
+		status = 0
+		try:
+			result = list(_timed(setup, fn)) + [peak_memory()]
+		except BaseException, e:
+			result = {"error" : "%s: %s" % (e.__class__.__name__, e)}
+			status = 1
+		os.write(write_fd, json.dumps(result))
+		os._exit(status)
+
+	os.close(write_fd)
+	chunks = []
+	while True:
+		chunk = os.read(read_fd, 65536)
+		if not chunk:
+			break
+		chunks.append(chunk)
+	os.close(read_fd)
+	os.waitpid(pid, 0)
+	result = json.loads("".join(chunks) or "null")
+	if not isinstance(result, list):
+		raise RuntimeError((result or {}).get("error", "benchmark process failed"))
+	return tuple(result)
+
+def measure(setup, fn, repeat):
+	""" Best of repeat isolated runs of fn, see isolated() """
+	best = None
+	for i in xrange(repeat):
+		result = isolated(setup, fn)
+		if best is None or result[0] < best[0]:
+			best = result
+	return best
+
+def report(name, result):
+	elapsed, rows, size, peak = result
+	columns = ["%-34s %8.3f s" % (name, elapsed)]
+	columns.append("%12.0f rows/s" % (rows / elapsed) if rows else " " * 19)
+	columns.append("%8.2f MB/s" % (size / elapsed / 1024.0 / 1024.0) if size else " " * 13)
+	if peak is not None:
+		columns.append("%8.1f MB peak" % peak)
+	print " ".join(columns)
+
+def parse_benchmarks(fixtures):
+	""" _load_data of every fixture, whole and for a single region, and the legacy decoder on the ri-v2 document """
+	for name, document, predicate in fixtures:
+		url = [s.url for s in ec2instancespricing.PRICING_SOURCES if predicate(s)][0]
+		yield "load %s" % name, None, lambda arg, url=url, document=document: (ec2instancespricing._load_data(url) and 0, len(document))
+		yield "load %s (us-east-1 only)" % name, None, lambda arg, url=url, document=document: (ec2instancespricing._load_data(url, "us-east-1") and 0, len(document))
+		if name == "ri-v2":
+			yield "load %s (regex + eval)" % name, None, lambda arg, document=document: (legacy_parse(document) and 0, len(document))
+
+def getter_benchmarks():
+	""" Every getter end to end, for all pricing documents of a type """
+	def count_rows(data):
+		return sum([len(r["instanceTypes"]) for r in data["regions"]])
+	for pricing_type in ["ondemand", "spot"]:
+		yield "get %s" % pricing_type, None, lambda arg, t=pricing_type: (count_rows(ec2instancespricing.get_ec2_ondemand_instances_prices(pricing_type=t)), 0)
+		yield "get %s (records)" % pricing_type, None, lambda arg, t=pricing_type: (len(ec2instancespricing.get_ec2_ondemand_instances_prices(pricing_type=t, as_records=True)), 0)
+		yield "iter %s" % pricing_type, None, lambda arg, t=pricing_type: (sum(1 for row in ec2instancespricing.iter_ec2_ondemand_instances_prices(pricing_type=t)), 0)
+	yield "get reserved", None, lambda arg: (count_rows(ec2instancespricing.get_ec2_reserved_instances_prices()), 0)
+	yield "get reserved (records)", None, lambda arg: (len(ec2instancespricing.get_ec2_reserved_instances_prices(as_records=True)), 0)
+	yield "iter reserved", None, lambda arg: (sum(1 for row in ec2instancespricing.iter_ec2_reserved_instances_prices()), 0)
+	yield "iter reserved (us-east-1 only)", None, lambda arg: (sum(1 for row in ec2instancespricing.iter_ec2_reserved_instances_prices("us-east-1")), 0)
+
+def normalize_benchmarks():
+	""" The normalization loops alone, on documents parsed in advance (kept in the in-process memo) """
+	def parsed(pricing_type):
+		def setup():
+			ec2instancespricing.MEMO_MAX_DOCUMENTS = len(ec2instancespricing.PRICING_SOURCES)
+			ec2instancespricing.warm([s.url for s in ec2instancespricing.plan_sources(pricing_type)])
+		return setup
+	def count_rows(regions):
+		return sum([len(entries) for region, entries in regions]), 0
+	yield "normalize ondemand", parsed("ondemand"), lambda arg: count_rows(ec2instancespricing._iter_ondemand_regions(concurrency=1))
+	yield "normalize spot", parsed("spot"), lambda arg: count_rows(ec2instancespricing._iter_ondemand_regions(pricing_type="spot", concurrency=1))
+	yield "normalize reserved", parsed("reserved"), lambda arg: count_rows(ec2instancespricing._iter_reserved_regions(concurrency=1))
+	yield "normalize reserved (legacy loop)", parsed("reserved"), lambda arg: count_rows(legacy_reserved_regions())
+
+def output_benchmarks(pricing_type):
+	""" Every output format of the CLI, writing already loaded records """
+	def load():
+		if pricing_type == "reserved":
+			return ec2instancespricing.get_ec2_reserved_instances_prices(as_records=True)
+		return ec2instancespricing.get_ec2_ondemand_instances_prices(pricing_type=pricing_type, as_records=True)
+
+	def write_rows(table, writer_class):
+		out = NullOutput()
+		writer = writer_class(out, pricing_type)
+		writer.write_all(table)
+		writer.close()
+		return writer.count, out.size
+
+	# -f json prints the getters' output, records are only written as rows
+	def load_json():
+		if pricing_type == "reserved":
+			return ec2instancespricing.get_ec2_reserved_instances_prices()
+		return ec2instancespricing.get_ec2_ondemand_instances_prices(pricing_type=pricing_type)
+
+	def write_json(data):
+		out = NullOutput()
+		out.write(json.dumps(data))
+		rows = 0
+		for region in data["regions"]:
+			for it in region["instanceTypes"]:
+				rows += len(it["prices"]) if pricing_type == "reserved" else 1
+		return rows, out.size
+
+	yield "write %s json" % pricing_type, load_json, write_json
+	for name in sorted(ec2instancespricing.ROW_WRITERS):
+		yield "write %s %s" % (pricing_type, name), load, lambda table, writer_class=ec2instancespricing.ROW_WRITERS[name]: write_rows(table, writer_class)
+
+def marketplace_benchmarks(directory):
+	""" ec2marketplace.parse_product_pricing on the saved product pages (marketplace-*.html). Needs BeautifulSoup, not boto """
+	try:
+		import ec2marketplace
+	except ImportError, e:
+		print "Skipping the marketplace benchmarks: %s" % e
+		return
+	for name in sorted(os.listdir(directory)):
+		if not (name.startswith("marketplace-") and name.endswith(".html")):
+			continue
+		f = open(os.path.join(directory, name))
+		try:
+			page = f.read()
+		finally:
+			f.close()
+		def count_prices(result):
+			return sum([len(prices) for prices in result["regions"].values()])
+		yield "extract %s" % name[:-5], None, lambda arg, page=page: (count_prices(ec2marketplace.parse_product_pricing(page)), len(page))
+		yield "extract %s (legacy)" % name[:-5], None, lambda arg, page=page: (count_prices(legacy_product_pricing(page)), len(page))
+
+BENCHMARKS = ["parse", "getters", "normalize", "output", "marketplace"]
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(add_help=True, description="Measure parsing, getter and output throughput offline, on the sample documents in the fixtures directory")
+	parser.add_argument("--fixtures", help="Directory with the sample pricing documents", default=FIXTURES_DIR)
+	parser.add_argument("--regions", help="Scale every sample document to this many regions (requires --types)", type=int)
+	parser.add_argument("--types", help="Scale every sample document to this many instance types per region (requires --regions)", type=int)
+	parser.add_argument("--repeat", help="Number of runs, the best one is reported", type=int, default=3)
+	parser.add_argument("--only", help="Run only these benchmarks", choices=BENCHMARKS, nargs="+", default=BENCHMARKS)
+	parser.add_argument("--output-type", help="Pricing type of the records written by the output benchmarks", choices=["ondemand", "spot", "reserved"], default="reserved")
+	args = parser.parse_args()
+
+	if (args.regions is None) != (args.types is None):
+		parser.error("--regions and --types must be given together")
+
+	fixtures = load_fixtures(args.fixtures, args.regions, args.types)
+	install_fixtures(fixtures)
+
+	for name, document, predicate in fixtures:
+		print "%-10s %8.2f MB" % (name, len(document) / 1024.0 / 1024.0)
+	if peak_memory() is not None:
+		print "%-10s %8.1f MB peak before the benchmarks" % ("baseline", peak_memory())
+	print
+
+	benchmarks = []
+	if "parse" in args.only:
+		benchmarks.extend(parse_benchmarks(fixtures))
+	if "getters" in args.only:
+		benchmarks.extend(getter_benchmarks())
+	if "normalize" in args.only:
+		benchmarks.extend(normalize_benchmarks())
+	if "output" in args.only:
+		benchmarks.extend(output_benchmarks(args.output_type))
+	if "marketplace" in args.only:
+		benchmarks.extend(marketplace_benchmarks(args.fixtures))
+	for name, setup, fn in benchmarks:
+		report(name, measure(setup, fn, args.repeat))
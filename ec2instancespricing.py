@@ -23,12 +23,41 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #
 import argparse
+import atexit
+import httplib
+import socket
+import urllib
 import urllib2
+import urlparse
+import BaseHTTPServer
+import SocketServer
+import bisect
+import cPickle
+import errno
+import hashlib
+import heapq
+import mmap
+import os
 import re
+import struct
+import sys
+import tempfile
+import time
+import threading
+import zlib
+import Queue
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from itertools import chain, groupby, islice, izip, izip_longest, repeat
 try:
 	import simplejson as json
 except ImportError:
 	import json
+# optional, only needed by PriceMatrix
+try:
+	import numpy
+except ImportError:
+	numpy = None
 
 EC2_REGIONS = [
 	"us-east-1",
@@ -226,329 +255,2007 @@ INSTANCES_RESERVED_V2_WINSQL_URL = "http://a0.awsstatic.com/pricing/1/ec2/ri-v2/
 INSTANCES_RESERVED_V2_WINSQLWEB_URL = "http://a0.awsstatic.com/pricing/1/ec2/ri-v2/windows-with-sql-server-web-shared.min.js"
 INSTANCES_RESERVED_V2_WINSQLENT_URL = "http://a0.awsstatic.com/pricing/1/ec2/ri-v2/windows-with-sql-server-enterprise-shared.min.js"
 
-INSTANCES_ONDEMAND_OS_TYPE_BY_URL = {
-	INSTANCES_ON_DEMAND_LINUX_URL : "linux",
-	INSTANCES_ON_DEMAND_RHEL_URL : "rhel",
-	INSTANCES_ON_DEMAND_SLES_URL : "sles",
-	INSTANCES_ON_DEMAND_WINDOWS_URL : "mswin",
-	INSTANCES_ON_DEMAND_WINSQL_URL : "mswinSQL",
-	INSTANCES_ON_DEMAND_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_ON_DEMAND_WINSQLENT_URL : "mswinSQLEnt",
-
-	INSTANCES_OLD_ON_DEMAND_LINUX_URL : "linux",
-	INSTANCES_OLD_ON_DEMAND_RHEL_URL : "rhel",
-	INSTANCES_OLD_ON_DEMAND_SLES_URL : "sles",
-	INSTANCES_OLD_ON_DEMAND_WINDOWS_URL : "mswin",
-	INSTANCES_OLD_ON_DEMAND_WINSQL_URL : "mswinSQL",
-	INSTANCES_OLD_ON_DEMAND_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_OLD_ON_DEMAND_WINSQLENT_URL : "mswinSQLEnt",
-}
+# Instance families which may appear in a pricing document, see PRICING_SOURCES.
+# Previous generation families (and ones listed in both generations while
+# they were being phased out)
+PREVIOUS_GENERATION_FAMILIES = frozenset(["t1", "m1", "m2", "m3", "c1", "c3", "cc1", "cc2", "cg1", "cr1", "hi1", "hs1", "g2", "i2", "r3"])
+# Families sold with light/medium/heavy utilization reservations, which were
+# retired before the newer families were launched
+UTILIZATION_RESERVATION_FAMILIES = PREVIOUS_GENERATION_FAMILIES | frozenset(["t2"])
 
-INSTANCES_RESERVED_OS_TYPE_BY_URL = {
-	INSTANCES_RESERVED_LIGHT_RESERVATION_LINUX_URL : "linux",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_RHEL_URL : "rhel",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_SLES_URL : "sles",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_WINDOWS_URL :  "mswin",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQL_URL : "mswinSQL",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_LINUX_URL : "linux",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_RHEL_URL : "rhel",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_SLES_URL : "sles",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL :  "mswin",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQL_URL : "mswinSQL",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_LINUX_URL : "linux",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_RHEL_URL : "rhel",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_SLES_URL : "sles",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_WINDOWS_URL :  "mswin",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQL_URL : "mswinSQL",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL : "mswinSQLWeb",
-	
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_LINUX_URL : "linux",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_RHEL_URL : "rhel",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_SLES_URL : "sles",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINDOWS_URL :  "mswin",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQL_URL : "mswinSQL",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_LINUX_URL : "linux",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_RHEL_URL : "rhel",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_SLES_URL : "sles",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL :  "mswin",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQL_URL : "mswinSQL",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_LINUX_URL : "linux",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_RHEL_URL : "rhel",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_SLES_URL : "sles",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINDOWS_URL :  "mswin",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQL_URL : "mswinSQL",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL : "mswinSQLWeb",
-	
-	INSTANCES_RESERVED_V2_LINUX_URL : "linux",
-	INSTANCES_RESERVED_V2_RHEL_URL : "rhel",
-	INSTANCES_RESERVED_V2_SUSE_URL : "suse",
-	INSTANCES_RESERVED_V2_WINDOWS_URL : "mswin",
-	INSTANCES_RESERVED_V2_WINSQL_URL : "mswinSQL",
-	INSTANCES_RESERVED_V2_WINSQLWEB_URL : "mswinSQLWeb",
-	INSTANCES_RESERVED_V2_WINSQLENT_URL : "mswinSQLEnt"
+# Catalog of all pricing documents:
+#   kind        - "ondemand", "reserved" or "spot"
+#   os          - os type of all prices in the document ("" if it has a column per os type)
+#   model       - "ondemand", "spot", "utilization" (light/medium/heavy reservations)
+#                 or "purchase-option" (no/partial/all upfront reservations)
+#   reservation - utilization level of a "utilization" document
+#   generation  - "current" or "previous"
+#   families    - instance families that can appear in the document, None if any
+PricingSource = namedtuple("PricingSource", ["url", "kind", "os", "model", "reservation", "generation", "families"])
 
-}
+PRICING_SOURCES = [
+	PricingSource(INSTANCES_ON_DEMAND_LINUX_URL, "ondemand", "linux", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_ON_DEMAND_RHEL_URL, "ondemand", "rhel", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_ON_DEMAND_SLES_URL, "ondemand", "sles", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_ON_DEMAND_WINDOWS_URL, "ondemand", "mswin", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_ON_DEMAND_WINSQL_URL, "ondemand", "mswinSQL", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_ON_DEMAND_WINSQLWEB_URL, "ondemand", "mswinSQLWeb", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_ON_DEMAND_WINSQLENT_URL, "ondemand", "mswinSQLEnt", "ondemand", "", "current", None),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_LINUX_URL, "ondemand", "linux", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_RHEL_URL, "ondemand", "rhel", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_SLES_URL, "ondemand", "sles", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_WINDOWS_URL, "ondemand", "mswin", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_WINSQL_URL, "ondemand", "mswinSQL", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_WINSQLWEB_URL, "ondemand", "mswinSQLWeb", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_ON_DEMAND_WINSQLENT_URL, "ondemand", "mswinSQLEnt", "ondemand", "", "previous", PREVIOUS_GENERATION_FAMILIES),
 
-INSTANCES_RESERVED_RESERVATION_TYPE_BY_URL = {
-	INSTANCES_RESERVED_LIGHT_RESERVATION_LINUX_URL : "light",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_RHEL_URL : "light",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_SLES_URL : "light",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_WINDOWS_URL : "light",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQL_URL : "light",
-	INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL : "light",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_LINUX_URL : "medium",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_RHEL_URL : "medium",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_SLES_URL : "medium",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL : "medium",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQL_URL : "medium",
-	INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL : "medium",	
-	INSTANCES_RESERVED_HEAVY_RESERVATION_LINUX_URL : "heavy",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_RHEL_URL : "heavy",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_SLES_URL : "heavy",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_WINDOWS_URL : "heavy",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQL_URL : "heavy",
-	INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL : "heavy",
-	
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_LINUX_URL : "light",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_RHEL_URL : "light",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_SLES_URL : "light",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINDOWS_URL : "light",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQL_URL : "light",
-	INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL : "light",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_LINUX_URL : "medium",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_RHEL_URL : "medium",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_SLES_URL : "medium",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL : "medium",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQL_URL : "medium",
-	INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL : "medium",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_LINUX_URL : "heavy",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_RHEL_URL : "heavy",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_SLES_URL : "heavy",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINDOWS_URL : "heavy",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQL_URL : "heavy",
-	INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL : "heavy",
-	
-}
+	PricingSource(INSTANCES_RESERVED_LIGHT_RESERVATION_LINUX_URL, "reserved", "linux", "utilization", "light", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_LIGHT_RESERVATION_RHEL_URL, "reserved", "rhel", "utilization", "light", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_LIGHT_RESERVATION_SLES_URL, "reserved", "sles", "utilization", "light", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_LIGHT_RESERVATION_WINDOWS_URL, "reserved", "mswin", "utilization", "light", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQL_URL, "reserved", "mswinSQL", "utilization", "light", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "utilization", "light", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_MEDIUM_RESERVATION_LINUX_URL, "reserved", "linux", "utilization", "medium", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_MEDIUM_RESERVATION_RHEL_URL, "reserved", "rhel", "utilization", "medium", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_MEDIUM_RESERVATION_SLES_URL, "reserved", "sles", "utilization", "medium", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL, "reserved", "mswin", "utilization", "medium", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQL_URL, "reserved", "mswinSQL", "utilization", "medium", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "utilization", "medium", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_HEAVY_RESERVATION_LINUX_URL, "reserved", "linux", "utilization", "heavy", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_HEAVY_RESERVATION_RHEL_URL, "reserved", "rhel", "utilization", "heavy", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_HEAVY_RESERVATION_SLES_URL, "reserved", "sles", "utilization", "heavy", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_HEAVY_RESERVATION_WINDOWS_URL, "reserved", "mswin", "utilization", "heavy", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQL_URL, "reserved", "mswinSQL", "utilization", "heavy", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "utilization", "heavy", "current", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_LINUX_URL, "reserved", "linux", "utilization", "light", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_RHEL_URL, "reserved", "rhel", "utilization", "light", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_SLES_URL, "reserved", "sles", "utilization", "light", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINDOWS_URL, "reserved", "mswin", "utilization", "light", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQL_URL, "reserved", "mswinSQL", "utilization", "light", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "utilization", "light", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_LINUX_URL, "reserved", "linux", "utilization", "medium", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_RHEL_URL, "reserved", "rhel", "utilization", "medium", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_SLES_URL, "reserved", "sles", "utilization", "medium", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL, "reserved", "mswin", "utilization", "medium", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQL_URL, "reserved", "mswinSQL", "utilization", "medium", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "utilization", "medium", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_LINUX_URL, "reserved", "linux", "utilization", "heavy", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_RHEL_URL, "reserved", "rhel", "utilization", "heavy", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_SLES_URL, "reserved", "sles", "utilization", "heavy", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINDOWS_URL, "reserved", "mswin", "utilization", "heavy", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQL_URL, "reserved", "mswinSQL", "utilization", "heavy", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "utilization", "heavy", "previous", UTILIZATION_RESERVATION_FAMILIES),
+	PricingSource(INSTANCES_RESERVED_V2_LINUX_URL, "reserved", "linux", "purchase-option", "", "current", None),
+	PricingSource(INSTANCES_RESERVED_V2_RHEL_URL, "reserved", "rhel", "purchase-option", "", "current", None),
+	PricingSource(INSTANCES_RESERVED_V2_SUSE_URL, "reserved", "suse", "purchase-option", "", "current", None),
+	PricingSource(INSTANCES_RESERVED_V2_WINDOWS_URL, "reserved", "mswin", "purchase-option", "", "current", None),
+	PricingSource(INSTANCES_RESERVED_V2_WINSQL_URL, "reserved", "mswinSQL", "purchase-option", "", "current", None),
+	PricingSource(INSTANCES_RESERVED_V2_WINSQLWEB_URL, "reserved", "mswinSQLWeb", "purchase-option", "", "current", None),
+	PricingSource(INSTANCES_RESERVED_V2_WINSQLENT_URL, "reserved", "mswinSQLEnt", "purchase-option", "", "current", None),
+
+	PricingSource(INSTANCES_SPOT_URL, "spot", "", "spot", "", "current", None)
+]
+
+# url -> os/reservation mappings, kept for backwards compatibility
+INSTANCES_ONDEMAND_OS_TYPE_BY_URL = dict((s.url, s.os) for s in PRICING_SOURCES if s.kind == "ondemand")
+INSTANCES_RESERVED_OS_TYPE_BY_URL = dict((s.url, s.os) for s in PRICING_SOURCES if s.kind == "reserved")
+INSTANCES_RESERVED_RESERVATION_TYPE_BY_URL = dict((s.url, s.reservation) for s in PRICING_SOURCES if s.model == "utilization")
 
 DEFAULT_CURRENCY = "USD"
 
-def _load_data(url):
-	f = urllib2.urlopen(url).read()
-	# remove comments
-	f = re.sub("/\\*[^\x00]+\\*/", "", f, 0, re.M)
-	# quote field names
-	f = re.sub("([a-zA-Z0-9]+):", "\"\\1\":", f)
-	# lf in the end
-	f = re.sub(";", "\n", f)
-	# null values -> None
-	f = re.sub("null", "None", f);
-	def callback(json):
-		return json
-	data = eval(f, {"__builtins__" : None}, {"callback" : callback} )
+DEFAULT_CONCURRENCY = 8
+
+# On-disk cache of the raw pricing documents, disabled when CACHE_DIR is None
+CACHE_DIR = None
+CACHE_MAX_AGE = 3600
+OFFLINE = False
+
+# In-process memo of parsed documents shared by all get_ec2_* calls. Documents
+# are reused for MEMO_TTL seconds and at most MEMO_MAX_DOCUMENTS are kept, the
+# least recently used ones are dropped first. Set MEMO_MAX_DOCUMENTS to 0 to disable.
+MEMO_TTL = 600
+MEMO_MAX_DOCUMENTS = 64
+_MEMO = OrderedDict()
+_MEMO_LOCK = threading.Lock()
+
+# Fetches the pricing documents, see Transport. Set by default_transport() below
+# the transport classes, HTTP_TIMEOUT is the socket timeout in seconds
+TRANSPORT = None
+HTTP_TIMEOUT = 30
+
+# Instrumentation, disabled when STATS is None. See PricingStats and collect_stats()
+STATS = None
+
+# Pricing documents are JavaScript object literals wrapped in a callback call
+# (JSONP) with unquoted field names and an optional leading comment block.
+# They are parsed in a single pass by matching one token at a time. Whitespace,
+# comments and the ',' and ':' separators in front of a token are skipped by the
+# same match, since the container being filled already tells keys from values.
+_JS_SKIP = r'(?:[\s,:]+|/\*.*?\*/|//[^\n]*)*'
+_JS_TOKEN = re.compile(_JS_SKIP + r'''(?:
+	([{}\[\]])                                  # 1 brackets
+	|"([^"\\]*)"                                # 2 plain string
+	|("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')      # 3 string with escapes
+	|(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)   # 4 number
+	|([A-Za-z_$][\w$]*)                         # 5 identifier
+	)''', re.S | re.X)
+_JS_CALL = re.compile(_JS_SKIP + r'[A-Za-z_$][\w$.]*\s*\(', re.S)
+_JS_END = re.compile(_JS_SKIP + r'\)?(?:\s+|/\*.*?\*/|//[^\n]*|;)*$', re.S)
+_JS_CONSTANTS = {"null" : None, "true" : True, "false" : False}
+
+def _js_string(token):
+	if token[0] == "'":
+		token = '"' + re.sub(r'(?<!\\)"', r'\\"', token[1:-1]).replace("\\'", "'") + '"'
+	value = json.loads(token)
+	if isinstance(value, unicode):
+		value = value.encode("utf-8")
+	return value
+
+def _js_number(token):
+	if "." in token or "e" in token or "E" in token:
+		return float(token)
+	return int(token)
+
+def _parse_js_value(text, pos=0):
+	""" Parse a JavaScript object literal starting at pos. Returns the value and the position right after it """
+	match = _JS_TOKEN.match
+	stack = []
+	container = None
+	key = None
+	while True:
+		m = match(text, pos)
+		if m is None:
+			raise ValueError("Unexpected character at position %d" % pos)
+		pos = m.end()
+		group = m.lastindex
+		if group == 5:
+			value = m.group(5)
+			if key is None and container.__class__ is dict:
+				pass
+			elif value in _JS_CONSTANTS:
+				value = _JS_CONSTANTS[value]
+			else:
+				raise ValueError("Unexpected identifier '%s' at position %d" % (value, m.start(5)))
+		elif group == 2:
+			value = m.group(2)
+		elif group == 1:
+			c = m.group(1)
+			if c == "{" or c == "[":
+				stack.append((container, key))
+				container = {} if c == "{" else []
+				key = None
+				continue
+			if not stack:
+				raise ValueError("Unbalanced '%s' at position %d" % (c, pos - 1))
+			value = container
+			container, key = stack.pop()
+		elif group == 4:
+			value = _js_number(m.group(4))
+		else:
+			value = _js_string(m.group(3))
+
+		if container is None:
+			return value, pos
+		if container.__class__ is dict:
+			if key is None:
+				key = value
+			else:
+				container[key] = value
+				key = None
+		else:
+			container.append(value)
+
+# Region filtered loads only parse the elements of the regions array of the wanted
+# regions. Elements are located by their leading region name, the ones of other
+# regions are cut out of the text after checking, with the strings and comments
+# removed, that they hold balanced brackets. The end of the last element is found by
+# scanning its brackets (strings and comments are matched whole so brackets inside
+# them do not count). Documents of another layout are parsed whole.
+_JS_REGIONS = re.compile(r"""["']?\bregions["']?\s*:\s*\[""")
+_JS_REGION_START = re.compile(r"""\{\s*["']?region["']?\s*:\s*["']([^"'\\]*)["']""")
+_JS_STRINGS = re.compile(r'''"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*'|/\*.*?\*/|//[^\n]*''', re.S)
+_JS_SCAN = re.compile(r'''"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*'|/\*.*?\*/|//[^\n]*|[{}\[\]]''', re.S)
+
+def _js_value_end(text, pos):
+	""" Position right after the object or array starting at pos, None if it is not closed """
+	depth = 0
+	for t in _JS_SCAN.finditer(text, pos):
+		c = t.group()
+		if c == "{" or c == "[":
+			depth += 1
+		elif c == "}" or c == "]":
+			depth -= 1
+			if depth == 0:
+				return t.end()
+	return None
+
+def _balanced(text, start, end):
+	stripped = _JS_STRINGS.sub("", text[start:end])
+	return stripped.count("{") == stripped.count("}") and stripped.count("[") == stripped.count("]")
+
+def _select_regions(text, names):
+	""" Copy of a pricing document without the elements of its regions array whose region is not in names.
+	Returns None if the regions array or its elements can't be located """
+	m = _JS_REGIONS.search(text)
+	if m is None:
+		return None
+	starts = [(r.start(), r.group(1)) for r in _JS_REGION_START.finditer(text, m.end())]
+	if not starts or text[m.end():starts[0][0]].strip(" \t\r\n,"):
+		return None
+	end = _js_value_end(text, starts[-1][0])
+	if end is None:
+		return None
+	pieces = [text[:m.end()]]
+	for (start, name), stop in izip(starts, [s for s, n in starts[1:]] + [end]):
+		if stop != end and not _balanced(text, start, stop):
+			return None
+		if name in names:
+			# the separators after the element are kept, the parser skips a trailing comma
+			pieces.append(text[start:stop])
+	pieces.append(text[end:])
+	return "".join(pieces)
+
+def _parse_jsonp(text, regions=None):
+	""" Parse a pricing document of the form callback({...}); without evaluating it.
+	If regions (a set of region names as used in the document) is given, other regions may be skipped unparsed """
+	if regions is not None:
+		selected = _select_regions(text, regions)
+		if selected is not None:
+			try:
+				return _parse_jsonp(selected)
+			except ValueError:
+				# cut in the wrong place, parse everything
+				pass
+	m = _JS_CALL.match(text)
+	pos = m.end() if m else 0
+	data, pos = _parse_js_value(text, pos)
+	if not _JS_END.match(text, pos):
+		raise ValueError("Unexpected trailing data at position %d" % pos)
 	return data
 
-def get_ec2_reserved_instances_prices(filter_region=None, filter_instance_type=None, filter_os_type=None):
-	""" Get EC2 reserved instances prices. Results can be filtered by region """
+def _cache_paths(url):
+	name = hashlib.sha1(url).hexdigest()
+	return os.path.join(CACHE_DIR, name + ".js"), os.path.join(CACHE_DIR, name + ".json")
+
+def _cache_read(url):
+	""" Returns (body, metadata) of the cached copy of url or (None, None) """
+	body_path, meta_path = _cache_paths(url)
+	try:
+		with open(meta_path, "rb") as f:
+			meta = json.load(f)
+		with open(body_path, "rb") as f:
+			return f.read(), meta
+	except (IOError, OSError, ValueError):
+		return None, None
+
+def _cache_write(url, body, meta):
+	body_path, meta_path = _cache_paths(url)
+	if not os.path.isdir(CACHE_DIR):
+		try:
+			os.makedirs(CACHE_DIR)
+		except OSError:
+			if not os.path.isdir(CACHE_DIR):
+				raise
+	# write to a temporary file and rename, so concurrent readers never see partial files
+	suffix = ".%d.%d.tmp" % (os.getpid(), threading.current_thread().ident)
+	for path, content in [(body_path, body), (meta_path, json.dumps(meta))]:
+		if content is None:
+			continue
+		with open(path + suffix, "wb") as f:
+			f.write(content)
+		os.rename(path + suffix, path)
+
+class Transport(object):
+	""" Fetches pricing documents for _fetch. get() returns a (status, headers, body) tuple for url,
+	headers being a dict with lower case names. request_headers are extra request headers,
+	e.g. for a conditional GET """
+
+	def get(self, url, request_headers=None):
+		raise NotImplementedError
+
+	def close(self):
+		pass
+
+class HttpTransport(Transport):
+	""" HTTP(S) transport keeping up to max_idle persistent connections per host for reuse.
+	Responses are requested gzip compressed and decompressed while they are read """
+
+	def __init__(self, timeout=None, max_idle=DEFAULT_CONCURRENCY, max_redirects=5):
+		self.timeout = timeout
+		self.max_idle = max_idle
+		self.max_redirects = max_redirects
+		self.idle = {}
+		self.lock = threading.Lock()
+
+	def _new_connection(self, key):
+		scheme, host, port = key
+		connection_class = httplib.HTTPSConnection if scheme == "https" else httplib.HTTPConnection
+		return connection_class(host, port, timeout=self.timeout if self.timeout is not None else HTTP_TIMEOUT)
+
+	def _connection(self, key):
+		""" Returns (connection, True) for an idle connection to key, (connection, False) for a new one """
+		with self.lock:
+			connections = self.idle.get(key)
+			if connections:
+				return connections.pop(), True
+		return self._new_connection(key), False
+
+	def _release(self, key, connection):
+		with self.lock:
+			connections = self.idle.setdefault(key, [])
+			if len(connections) < self.max_idle:
+				connections.append(connection)
+				return
+		connection.close()
+
+	def _request(self, url, request_headers):
+		parts = urlparse.urlsplit(url)
+		key = (parts.scheme, parts.hostname, parts.port)
+		path = urlparse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+		headers = {"Accept-Encoding" : "gzip", "User-Agent" : "ec2instancespricing"}
+		headers.update(request_headers or {})
+		connection, reused = self._connection(key)
+		try:
+			try:
+				connection.request("GET", path, headers=headers)
+				response = connection.getresponse()
+			except (httplib.HTTPException, socket.error):
+				if not reused:
+					raise
+				# the server closed an idle connection, retry once on a new one
+				connection.close()
+				connection = self._new_connection(key)
+				connection.request("GET", path, headers=headers)
+				response = connection.getresponse()
+
+			response_headers = dict((k.lower(), v) for k, v in response.getheaders())
+			decompressor = None
+			if response_headers.get("content-encoding", "").lower() == "gzip":
+				# wbits 16 + MAX_WBITS makes zlib expect a gzip header
+				decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+			chunks = []
+			while True:
+				chunk = response.read(65536)
+				if not chunk:
+					break
+				chunks.append(decompressor.decompress(chunk) if decompressor else chunk)
+			if decompressor:
+				chunks.append(decompressor.flush())
+		except:
+			connection.close()
+			raise
+		if response.will_close:
+			connection.close()
+		else:
+			self._release(key, connection)
+		return response.status, response_headers, "".join(chunks)
+
+	def get(self, url, request_headers=None):
+		for i in xrange(self.max_redirects + 1):
+			status, headers, body = self._request(url, request_headers)
+			if status not in (301, 302, 303, 307, 308) or "location" not in headers:
+				break
+			url = urlparse.urljoin(url, headers["location"])
+		return status, headers, body
+
+	def close(self):
+		with self.lock:
+			idle = self.idle
+			self.idle = {}
+		for connections in idle.itervalues():
+			for connection in connections:
+				connection.close()
+
+class UrllibTransport(Transport):
+	""" Transport using urllib2.urlopen, which honours the http_proxy / https_proxy environment variables
+	but opens a new connection for every document """
+
+	def __init__(self, timeout=None):
+		self.timeout = timeout
+
+	def get(self, url, request_headers=None):
+		request = urllib2.Request(url, headers=request_headers or {})
+		try:
+			response = urllib2.urlopen(request, timeout=self.timeout if self.timeout is not None else HTTP_TIMEOUT)
+		except urllib2.HTTPError, e:
+			return e.code, dict((k.lower(), v) for k, v in (e.info() or {}).items()), ""
+		return response.getcode() or 200, dict((k.lower(), v) for k, v in response.info().items()), response.read()
+
+class FileTransport(Transport):
+	""" Replays pricing documents from a directory holding them under their host name and path,
+	e.g. DIR/a0.awsstatic.com/pricing/1/ec2/linux-od.min.js (the layout of wget --force-directories) """
+
+	def __init__(self, directory):
+		self.directory = directory
+
+	def path(self, url):
+		parts = urlparse.urlsplit(url)
+		return os.path.join(self.directory, parts.hostname, *[p for p in parts.path.split("/") if p])
+
+	def get(self, url, request_headers=None):
+		try:
+			with open(self.path(url), "rb") as f:
+				return 200, {}, f.read()
+		except IOError, e:
+			if e.errno != errno.ENOENT:
+				raise
+			return 404, {}, ""
+
+def default_transport():
+	""" HttpTransport, or UrllibTransport when a proxy is configured in the environment """
+	if urllib.getproxies():
+		return UrllibTransport()
+	return HttpTransport()
+
+TRANSPORT = default_transport()
+
+def _fetch(url):
+	""" Download url. When CACHE_DIR is set, documents younger than CACHE_MAX_AGE seconds are served
+	from the cache and older ones are revalidated with a conditional GET (ETag / Last-Modified).
+	In OFFLINE mode only cached copies are served. Documents are downloaded through TRANSPORT """
+	if CACHE_DIR is None:
+		if OFFLINE:
+			raise IOError("Offline mode requires a cache directory")
+		status, headers, body = TRANSPORT.get(url)
+		_check_status(url, status, headers)
+		return body
+
+	body, meta = _cache_read(url)
+	if body is not None and (OFFLINE or time.time() - meta["fetched"] < CACHE_MAX_AGE):
+		return body
+	if OFFLINE:
+		raise IOError("%s is not cached in %s (offline mode)" % (url, CACHE_DIR))
+
+	request_headers = {}
+	if body is not None:
+		if meta.get("etag"):
+			request_headers["If-None-Match"] = meta["etag"]
+		if meta.get("last_modified"):
+			request_headers["If-Modified-Since"] = meta["last_modified"]
+	status, headers, new_body = TRANSPORT.get(url, request_headers)
+	if status == 304 and body is not None:
+		meta["fetched"] = time.time()
+		_cache_write(url, None, meta)
+		return body
+	_check_status(url, status, headers)
+
+	_cache_write(url, new_body, {
+		"url" : url,
+		"etag" : headers.get("etag"),
+		"last_modified" : headers.get("last-modified"),
+		"fetched" : time.time()
+	})
+	return new_body
+
+def _check_status(url, status, headers):
+	if status != 200:
+		raise urllib2.HTTPError(url, status, httplib.responses.get(status, "HTTP error"), headers, None)
+
+def _memo_get(url):
+	with _MEMO_LOCK:
+		entry = _MEMO.pop(url, None)
+		if entry is None or time.time() - entry[0] >= MEMO_TTL:
+			return None
+		# re-insert to mark the document as the most recently used one
+		_MEMO[url] = entry
+		return entry[1]
+
+def _memo_put(url, data):
+	with _MEMO_LOCK:
+		_MEMO.pop(url, None)
+		if MEMO_MAX_DOCUMENTS <= 0:
+			return
+		_MEMO[url] = (time.time(), data)
+		while len(_MEMO) > MEMO_MAX_DOCUMENTS:
+			_MEMO.popitem(last=False)
+
+def invalidate(url=None):
+	""" Drop a parsed document (or all of them if url is None) from the in-process memo """
+	with _MEMO_LOCK:
+		if url is None:
+			_MEMO.clear()
+		else:
+			# region filtered copies are memoized as (url, region)
+			for key in [k for k in _MEMO if k == url or (k.__class__ is tuple and k[0] == url)]:
+				del _MEMO[key]
+
+def warm(urls=None, concurrency=DEFAULT_CONCURRENCY):
+	""" Load pricing documents into the in-process memo ahead of time. By default all documents are loaded """
+	if urls is None:
+		urls = [s.url for s in PRICING_SOURCES]
+	for u in urls:
+		invalidate(u)
+	for data in _load_data_many(urls, concurrency):
+		pass
+
+def _load_data(url, filter_region=None, memoize=True):
+	""" Parsed pricing document. With filter_region (an EC2 API region name) the regions array may only
+	hold that region: the other ones are skipped unparsed unless the whole document is already memoized.
+	With memoize False a memoized document is still used, but a newly loaded one is not kept """
+	data = _memo_get(url)
+	key = url
+	if data is None and filter_region is not None:
+		key = (url, filter_region)
+		data = _memo_get(key)
+	stats = STATS
+	if data is not None:
+		if stats is not None:
+			stats.add(url, memo_hits=1)
+		return data
+
+	regions = None
+	if filter_region is not None:
+		regions = set([k for k, v in JSON_NAME_TO_EC2_REGIONS_API.iteritems() if v == filter_region])
+	start = time.time()
+	body = _fetch(url)
+	fetched = time.time()
+	data = _parse_jsonp(body, regions)
+	if stats is not None:
+		stats.add(url, download=fetched - start, bytes=len(body), parse=time.time() - fetched)
+	if memoize:
+		_memo_put(key, data)
+	return data
+
+def _load_data_many(urls, concurrency=DEFAULT_CONCURRENCY, filter_region=None, memoize=True):
+	""" Load several pricing documents using a bounded pool of worker threads.
+	Documents are yielded in the same order as urls, each one as soon as it and all preceding documents are available.
+	At most concurrency documents are loading or waiting to be yielded at any time. filter_region and memoize are passed on to _load_data """
+
+	urls = list(urls)
+	if not urls:
+		return
+	concurrency = max(1, min(int(concurrency), len(urls)))
+	if concurrency == 1:
+		for u in urls:
+			yield _load_data(u, filter_region, memoize)
+		return
+
+	tasks = Queue.Queue()
+	for i, u in enumerate(urls):
+		tasks.put((i, u))
+	results = {}
+	done = threading.Condition()
+	# one slot per document loading or parked in results, released when it is yielded
+	slots = threading.Semaphore(concurrency)
+	cancelled = []
+
+	def worker():
+		while True:
+			slots.acquire()
+			if cancelled:
+				return
+			try:
+				i, u = tasks.get_nowait()
+			except Queue.Empty:
+				return
+			try:
+				r = (True, _load_data(u, filter_region, memoize))
+			except Exception:
+				r = (False, sys.exc_info())
+			done.acquire()
+			try:
+				results[i] = r
+				done.notify_all()
+			finally:
+				done.release()
+
+	threads = []
+	for n in xrange(concurrency):
+		t = threading.Thread(target=worker, name="ec2pricing-fetch-%d" % n)
+		t.daemon = True
+		t.start()
+		threads.append(t)
+
+	try:
+		for i in xrange(len(urls)):
+			done.acquire()
+			try:
+				while i not in results:
+					done.wait(1)
+				ok, value = results.pop(i)
+			finally:
+				done.release()
+			slots.release()
+			if not ok:
+				raise value[0], value[1], value[2]
+			yield value
+	finally:
+		cancelled.append(True)
+		# wake up workers waiting for a slot, and wait for the ones still loading
+		for t in threads:
+			slots.release()
+		for t in threads:
+			t.join()
+
+STAT_STAGES = ["download", "parse", "normalize", "output"]
+STAT_URL_FIELDS = ["download", "bytes", "parse", "normalize", "rows", "filtered", "memo_hits"]
+
+class PricingStats(object):
+	""" Timings and counters of a run per pricing document url: download and parse seconds, bytes
+	downloaded, normalization seconds, rows produced and rows dropped by the filters, and documents
+	served from the in-process memo. Seconds are also summed per stage (STAT_STAGES). Documents are
+	downloaded and parsed by several threads, so stage totals can add up to more than the elapsed time """
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.started = time.time()
+		self.urls = OrderedDict()
+		self.stages = OrderedDict((stage, 0.0) for stage in STAT_STAGES)
+
+	def add(self, url, **values):
+		""" Add values (STAT_URL_FIELDS or STAT_STAGES keys) to the counters of url, url can be None for stage times only """
+		with self.lock:
+			if url is not None:
+				counters = self.urls.get(url)
+				if counters is None:
+					counters = self.urls[url] = dict((f, 0.0 if f in self.stages else 0) for f in STAT_URL_FIELDS)
+				for k, v in values.iteritems():
+					counters[k] += v
+			for k, v in values.iteritems():
+				if k in self.stages:
+					self.stages[k] += v
+
+	def to_dict(self):
+		with self.lock:
+			return {
+				"elapsed" : time.time() - self.started,
+				"stages" : dict(self.stages),
+				"urls" : [dict(counters, url=url) for url, counters in self.urls.iteritems()]
+			}
+
+	def report(self, out, format="table"):
+		""" Write the collected numbers to out as tables or as a JSON object (format "json") """
+		data = self.to_dict()
+		if format == "json":
+			out.write(json.dumps(data) + "\n")
+			return
+		url_fields = ["url"] + STAT_URL_FIELDS
+		writer = TableRowWriter(out, None, fields=url_fields)
+		for counters in data["urls"]:
+			writer.write(_StatsRow(url_fields, counters))
+		writer.close()
+		stage_fields = ["stage", "seconds"]
+		writer = TableRowWriter(out, None, fields=stage_fields)
+		for stage in STAT_STAGES + ["elapsed"]:
+			writer.write(_StatsRow(stage_fields, {"stage" : stage, "seconds" : data["stages"].get(stage, data["elapsed"])}))
+		writer.close()
+
+class _StatsRow(object):
+	""" A row of the --stats tables, with times rounded to milliseconds """
+
+	def __init__(self, fields, values):
+		for f in fields:
+			v = values[f]
+			setattr(self, f, "%.3f" % v if isinstance(v, float) else v)
+
+@contextmanager
+def collect_stats(stats=None):
+	""" Install a PricingStats (a new one unless given) as STATS for the duration of a with block """
+	global STATS
+	if stats is None:
+		stats = PricingStats()
+	previous = STATS
+	STATS = stats
+	try:
+		yield stats
+	finally:
+		STATS = previous
+
+def _source_skip_reason(source, filter_instance_type=None, filter_os_type=None):
+	""" Returns why a pricing document can't contain prices matching the filters, None if it may contain some """
+	if filter_os_type is not None and source.os and source.os != filter_os_type:
+		return "os type is %s" % source.os
+	if filter_instance_type is not None and source.families is not None:
+		family = filter_instance_type.split(".")[0]
+		if family not in source.families:
+			return "%s generation %s documents do not list %s instances" % (source.generation, source.model, family)
+	return None
+
+def plan_sources(pricing_type, filter_instance_type=None, filter_os_type=None):
+	""" Get the minimal list of pricing documents (PRICING_SOURCES entries) needed to answer a query.
+	pricing_type is one of "ondemand", "reserved" or "spot" """
+	if pricing_type not in ("ondemand", "reserved", "spot"):
+		raise ValueError("plan_sources: pricing_type argument must be 'ondemand', 'reserved' or 'spot'")
+	return [s for s in PRICING_SOURCES if s.kind == pricing_type and _source_skip_reason(s, filter_instance_type, filter_os_type) is None]
+
+def explain_plan(pricing_type, filter_instance_type=None, filter_os_type=None):
+	""" Describe which pricing documents plan_sources() would fetch and why the others are skipped """
+	lines = []
+	count = 0
+	for s in PRICING_SOURCES:
+		if s.kind != pricing_type:
+			continue
+		reason = _source_skip_reason(s, filter_instance_type, filter_os_type)
+		if reason is None:
+			count += 1
+			lines.append("fetch %s" % s.url)
+		else:
+			lines.append("skip  %s (%s)" % (s.url, reason))
+	lines.append("%d of %d %s documents will be fetched" % (count, len(lines), pricing_type))
+	return "\n".join(lines)
+
+def _count_region_entries(region, per_column):
+	""" Number of entries listed for a region of a pricing document, for the filtered counter of STATS.
+	Sizes count once per value column if per_column is True """
+	count = 0
+	for it in region.get("instanceTypes") or []:
+		for s in it.get("sizes") or []:
+			count += len(s.get("valueColumns") or []) if per_column else 1
+		for term in it.get("terms") or []:
+			count += len(term.get("purchaseOptions") or [])
+	return count
+
+# Older documents name instance types with a "size" field that may carry other
+# characters, only lower case letters, digits and dots are kept. Normalized names
+# are memoized per size string (there are only a few hundred) and interned
+_INSTANCE_TYPE_JUNK = re.compile("[^a-z0-9.]+")
+_INSTANCE_TYPES = {}
+
+def _instance_type(size):
+	_type = _INSTANCE_TYPES.get(size)
+	if _type is None:
+		_type = _INSTANCE_TYPES[size] = _intern(_INSTANCE_TYPE_JUNK.sub("", size))
+	return _type
+
+def _price_or_none(value):
+	try:
+		return float(value)
+	except (ValueError, TypeError):
+		return None
+
+# value column of a utilization reservation document -> position in (upfront1, hourly1, upfront3, hourly3)
+_UTILIZATION_COLUMNS = {"yrTerm1" : 0, "yrTerm1Hourly" : 1, "yrTerm3" : 2, "yrTerm3Hourly" : 3}
+_NO_UTILIZATION_PRICES = [None, None, None, None]
+# term of a purchase option reservation document -> term reported
+_PURCHASE_OPTION_TERMS = {"yrTerm1Standard" : "1year", "yrTerm3Standard" : "3year", "yrTerm3Convertible" : "c3year"}
+
+def _iter_reserved_regions(filter_region=None, filter_instance_type=None, filter_os_type=None, concurrency=DEFAULT_CONCURRENCY, sources=None, memoize=True):
+	""" Yields (region, entries) for every region of every reserved pricing document, in document order.
+	Each entry is a (type, os, reservation, prices) tuple where prices is a list of (term, hourly, upfront).
+	sources are the PRICING_SOURCES to read, by default the ones plan_sources() picks for the filters.
+	memoize is passed on to _load_data """
 
 	get_specific_region = (filter_region is not None)
 	get_specific_instance_type = (filter_instance_type is not None)
-	get_specific_os_type = (filter_os_type is not None)
 
 	currency = DEFAULT_CURRENCY
 
-	urls = [
-		INSTANCES_RESERVED_LIGHT_RESERVATION_LINUX_URL,
-		INSTANCES_RESERVED_LIGHT_RESERVATION_RHEL_URL,
-		INSTANCES_RESERVED_LIGHT_RESERVATION_SLES_URL,
-		INSTANCES_RESERVED_LIGHT_RESERVATION_WINDOWS_URL,
-		INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQL_URL,
-		INSTANCES_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL,
-		INSTANCES_RESERVED_MEDIUM_RESERVATION_LINUX_URL,
-		INSTANCES_RESERVED_MEDIUM_RESERVATION_RHEL_URL,
-		INSTANCES_RESERVED_MEDIUM_RESERVATION_SLES_URL,
-		INSTANCES_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL,
-		INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQL_URL,
-		INSTANCES_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL,
-		INSTANCES_RESERVED_HEAVY_RESERVATION_LINUX_URL,
-		INSTANCES_RESERVED_HEAVY_RESERVATION_RHEL_URL,
-		INSTANCES_RESERVED_HEAVY_RESERVATION_SLES_URL,
-		INSTANCES_RESERVED_HEAVY_RESERVATION_WINDOWS_URL,
-		INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQL_URL,
-		INSTANCES_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL,
-		
-		INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_LINUX_URL,
-		INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_RHEL_URL,
-		INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_SLES_URL,
-		INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINDOWS_URL,
-		INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQL_URL,
-		INSTANCES_OLD_RESERVED_LIGHT_RESERVATION_WINSQLWEB_URL,
-		INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_LINUX_URL,
-		INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_RHEL_URL,
-		INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_SLES_URL,
-		INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINDOWS_URL,
-		INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQL_URL,
-		INSTANCES_OLD_RESERVED_MEDIUM_RESERVATION_WINSQLWEB_URL,
-		INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_LINUX_URL,
-		INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_RHEL_URL,
-		INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_SLES_URL,
-		INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINDOWS_URL,
-		INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQL_URL,
-		INSTANCES_OLD_RESERVED_HEAVY_RESERVATION_WINSQLWEB_URL,
-		
-		INSTANCES_RESERVED_V2_LINUX_URL,
-		INSTANCES_RESERVED_V2_RHEL_URL,
-		INSTANCES_RESERVED_V2_SUSE_URL,
-		INSTANCES_RESERVED_V2_WINDOWS_URL,
-		INSTANCES_RESERVED_V2_WINSQL_URL,
-		INSTANCES_RESERVED_V2_WINSQLWEB_URL,
-		INSTANCES_RESERVED_V2_WINSQLENT_URL,
-	]
+	if sources is None:
+		sources = plan_sources("reserved", filter_instance_type, filter_os_type)
 
-	result_regions = []
-	result_regions_index = {}
-	result = {
-		"config" : {
-			"currency" : currency,
-		},
-		"regions" : result_regions
-	}
+	stats = STATS
 
-	for u in urls:
-		os_type = INSTANCES_RESERVED_OS_TYPE_BY_URL[u]
-		if get_specific_os_type and os_type != filter_os_type:
-			continue
-		reservation_type = ""
-		if u in INSTANCES_RESERVED_RESERVATION_TYPE_BY_URL:
-			reservation_type = INSTANCES_RESERVED_RESERVATION_TYPE_BY_URL[u]
-		data = _load_data(u)
+	# the same price strings come up again and again, convert each one once
+	prices_by_value = {}
+	hourly_by_monthly = {}
+
+	for source, data in izip(sources, _load_data_many([s.url for s in sources], concurrency, filter_region, memoize)):
+		os_type = source.os
+		reservation_type = source.reservation
 		if "config" in data and data["config"] and "regions" in data["config"] and data["config"]["regions"]:
 			for r in data["config"]["regions"]:
 				if "region" in r and r["region"]:
 					region_name = JSON_NAME_TO_EC2_REGIONS_API[r["region"]]
 					if get_specific_region and filter_region != region_name:
+						if stats is not None:
+							stats.add(source.url, filtered=_count_region_entries(r, False))
 						continue
 
-					if region_name in result_regions_index:
-						instance_types = result_regions_index[region_name]["instanceTypes"]
-					else:
-						instance_types = []
-						result_regions.append({
-							"region" : region_name,
-							"instanceTypes" : instance_types
-						})
-						result_regions_index[region_name] = result_regions[-1]
-						
-					if "instanceTypes" in r:
-						for it in r["instanceTypes"]:
-							# old reserved instances
-							if "sizes" in it:
-								for s in it["sizes"]:
-									_type = re.sub("[^a-z0-9.]*", "", s["size"])
-	
-									prices = {
-										"1year" : {
-											"hourly" : None,
-											"upfront" : None
-										},
-										"3year" : {
-											"hourly" : None,
-											"upfront" : None
-										}
-									}
-	
-									if get_specific_instance_type and _type != filter_instance_type:
-										continue
-	
-									for price_data in s["valueColumns"]:
-										price = None
-										try:
-											price = float(price_data["prices"][currency])
-										except ValueError:
-											price = None
-	
-										if price_data["name"] == "yrTerm1":
-											prices["1year"]["upfront"] = price
-										elif price_data["name"] == "yrTerm1Hourly":
-											prices["1year"]["hourly"] = price
-										elif price_data["name"] == "yrTerm3":
-											prices["3year"]["upfront"] = price
-										elif price_data["name"] == "yrTerm3Hourly":
-											prices["3year"]["hourly"] = price
-									if prices["1year"]["upfront"] != None or prices["1year"]["hourly"] != None or prices["3year"]["upfront"] != None or prices["3year"]["hourly"] != None:
-										instance_types.append({
-											"type" : _type,
-											"os" : os_type,
-											"reservation" : reservation_type,
-											"prices" : prices
-										})
-	
-											
-							# new reserved instances
-							if "type" in it and "terms" in it:
-								_type = it["type"]
+					start = time.time()
+					filtered = 0
+					entries = []
+					append = entries.append
+					for it in r.get("instanceTypes", ()):
+						# old reserved instances
+						if "sizes" in it:
+							for s in it["sizes"]:
+								_type = _instance_type(s["size"])
 								if get_specific_instance_type and _type != filter_instance_type:
+									filtered += 1
+									continue
+
+								columns = [None, None, None, None]
+								for price_data in s["valueColumns"]:
+									i = _UTILIZATION_COLUMNS.get(price_data["name"])
+									if i is None:
 										continue
-								for term in it["terms"]:
-									for purchaseOpt in term["purchaseOptions"]:
-										upfront = ""
-										hourly = ""
-										prices = {}
-										for price_data in purchaseOpt["valueColumns"]:
-											if price_data["name"] == "upfront":
-												upfront = (price_data["prices"]["USD"]).replace(",", "")
-											if price_data["name"] == "monthlyStar":
-												hourly = round(float(str.replace(price_data["prices"]["USD"],",","")) * 12 / 365 / 24, 4)
-										if term["term"] == "yrTerm1Standard":
-											prices["1year"] = {"upfront" :  upfront, "hourly" : hourly}
-										if term["term"] == "yrTerm3Standard":
-											prices["3year"] = {"upfront" :  upfront, "hourly" : hourly}
-										if term["term"] == "yrTerm3Convertible":
-											prices["c3year"] = {"upfront" :  upfront, "hourly" : hourly}
-										instance_types.append({
-													"type" : _type,
-													"os" : os_type,
-													"reservation" : purchaseOpt["purchaseOption"],
-													"prices" : prices
-												})
+									value = price_data["prices"][currency]
+									try:
+										columns[i] = prices_by_value[value]
+									except KeyError:
+										columns[i] = prices_by_value[value] = _price_or_none(value)
+								if columns != _NO_UTILIZATION_PRICES:
+									upfront1, hourly1, upfront3, hourly3 = columns
+									append((_type, os_type, reservation_type, [("1year", hourly1, upfront1), ("3year", hourly3, upfront3)]))
 
-	return result
+						# new reserved instances
+						if "type" in it and "terms" in it:
+							_type = it["type"]
+							if get_specific_instance_type and _type != filter_instance_type:
+								filtered += sum([len(term["purchaseOptions"]) for term in it["terms"]])
+								continue
+							_type = _intern(_type)
+							for term in it["terms"]:
+								term_name = _PURCHASE_OPTION_TERMS.get(term["term"])
+								for purchaseOpt in term["purchaseOptions"]:
+									upfront = ""
+									hourly = ""
+									for price_data in purchaseOpt["valueColumns"]:
+										name = price_data["name"]
+										if name == "upfront":
+											upfront = price_data["prices"][currency].replace(",", "")
+										elif name == "monthlyStar":
+											monthly = price_data["prices"][currency]
+											try:
+												hourly = hourly_by_monthly[monthly]
+											except KeyError:
+												hourly = hourly_by_monthly[monthly] = round(float(monthly.replace(",", "")) * 12 / 365 / 24, 4)
+									# unknown terms still get an entry, without prices
+									append((_type, os_type, _intern(purchaseOpt["purchaseOption"]), [(term_name, hourly, upfront)] if term_name else []))
+
+					if stats is not None:
+						stats.add(source.url, normalize=time.time() - start, rows=len(entries), filtered=filtered)
+					yield region_name, entries
 
-def get_ec2_ondemand_instances_prices(filter_region=None, filter_instance_type=None, filter_os_type=None, pricing_type="ondemand"):
-	""" Get EC2 on-demand or spot instances prices. Results can be filtered by region """
+def _iter_ondemand_regions(filter_region=None, filter_instance_type=None, filter_os_type=None, pricing_type="ondemand", concurrency=DEFAULT_CONCURRENCY, sources=None, memoize=True):
+	""" Yields (region, entries) for every region of every on-demand or spot pricing document, in document order.
+	Each entry is a (type, os, price) tuple. sources are the PRICING_SOURCES to read, by default the ones
+	plan_sources() picks for the filters. memoize is passed on to _load_data """
 
 	get_specific_region = (filter_region is not None)
 	get_specific_instance_type = (filter_instance_type is not None)
 	get_specific_os_type = (filter_os_type is not None)
+	spot = (pricing_type == "spot")
 
 	currency = DEFAULT_CURRENCY
-	
-	if pricing_type == "ondemand":
-		urls = [
-			INSTANCES_ON_DEMAND_LINUX_URL,
-			INSTANCES_ON_DEMAND_RHEL_URL,
-			INSTANCES_ON_DEMAND_SLES_URL,
-			INSTANCES_ON_DEMAND_WINDOWS_URL,
-			INSTANCES_ON_DEMAND_WINSQL_URL,
-			INSTANCES_ON_DEMAND_WINSQLWEB_URL,
-			INSTANCES_ON_DEMAND_WINSQLENT_URL,
-	
-			INSTANCES_OLD_ON_DEMAND_LINUX_URL,
-			INSTANCES_OLD_ON_DEMAND_RHEL_URL,
-			INSTANCES_OLD_ON_DEMAND_SLES_URL,
-			INSTANCES_OLD_ON_DEMAND_WINDOWS_URL,
-			INSTANCES_OLD_ON_DEMAND_WINSQL_URL,
-			INSTANCES_OLD_ON_DEMAND_WINSQLWEB_URL,
-			INSTANCES_OLD_ON_DEMAND_WINSQLENT_URL
-		]
-	elif pricing_type == "spot":
-		urls = [ INSTANCES_SPOT_URL ]
-	else:
+
+	if sources is None:
+		sources = plan_sources(pricing_type, filter_instance_type, filter_os_type)
+
+	stats = STATS
+
+	# the same price strings come up again and again, convert each one once
+	prices_by_value = {}
+
+	for source, data in izip(sources, _load_data_many([s.url for s in sources], concurrency, filter_region, memoize)):
+		os_type = None
+		if not spot:
+			os_type = source.os
+		if "config" in data and data["config"] and "regions" in data["config"] and data["config"]["regions"]:
+			for r in data["config"]["regions"]:
+				if "region" in r and r["region"]:
+					region_name = JSON_NAME_TO_EC2_REGIONS_API[r["region"]]
+
+					if get_specific_region and filter_region != region_name:
+						if stats is not None:
+							stats.add(source.url, filtered=_count_region_entries(r, True))
+						continue
+
+					start = time.time()
+					filtered = 0
+					entries = []
+					append = entries.append
+					for it in r.get("instanceTypes", ()):
+						if "sizes" not in it:
+							continue
+						for s in it["sizes"]:
+							_type = _instance_type(s["size"])
+							if get_specific_instance_type and _type != filter_instance_type:
+								filtered += len(s["valueColumns"])
+								continue
+
+							for price_data in s["valueColumns"]:
+								os_type_report = os_type
+								if spot:
+									os_type_report = price_data["name"]
+									if get_specific_os_type and os_type_report != filter_os_type:
+										filtered += 1
+										continue
+									os_type_report = _intern(os_type_report)
+
+								value = price_data["prices"][currency]
+								try:
+									price = prices_by_value[value]
+								except KeyError:
+									price = prices_by_value[value] = _price_or_none(value)
+								append((_type, os_type_report, price))
+
+					if stats is not None:
+						stats.add(source.url, normalize=time.time() - start, rows=len(entries), filtered=filtered)
+					yield region_name, entries
+
+def _intern(s):
+	if s.__class__ is str:
+		return intern(s)
+	return s
+
+class OnDemandPrice(object):
+	""" Hourly price of an on-demand or spot instance type in a region """
+	__slots__ = ("region", "type", "os", "price")
+
+	def __init__(self, region, type, os, price):
+		self.region = region
+		self.type = _intern(type)
+		self.os = _intern(os)
+		self.price = price
+
+	def __repr__(self):
+		return "OnDemandPrice(%r, %r, %r, %r)" % (self.region, self.type, self.os, self.price)
+
+class ReservedPrice(object):
+	""" Hourly and upfront price of an instance type reservation for a single term in a region.
+	starts_entry is True for the first term of a reservation, as grouped by get_ec2_reserved_instances_prices """
+	__slots__ = ("region", "type", "os", "reservation", "term", "hourly", "upfront", "starts_entry")
+
+	def __init__(self, region, type, os, reservation, term, hourly, upfront, starts_entry=True):
+		self.region = region
+		self.type = _intern(type)
+		self.os = _intern(os)
+		self.reservation = _intern(reservation)
+		self.term = term
+		self.hourly = hourly
+		self.upfront = upfront
+		self.starts_entry = starts_entry
+
+	def __repr__(self):
+		return "ReservedPrice(%r, %r, %r, %r, %r, %r, %r)" % (self.region, self.type, self.os, self.reservation, self.term, self.hourly, self.upfront)
+
+class PriceTable(object):
+	""" Compact list of OnDemandPrice or ReservedPrice records, returned by the getters when as_records is True """
+
+	def __init__(self, pricing_type, rows, currency=DEFAULT_CURRENCY):
+		self.pricing_type = pricing_type
+		self.currency = currency
+		self.rows = rows
+
+	def __iter__(self):
+		return iter(self.rows)
+
+	def __len__(self):
+		return len(self.rows)
+
+	def to_matrix(self, value=None):
+		""" Get a PriceMatrix of the effective hourly prices (or of value(row)), requires numpy """
+		return PriceMatrix.from_rows(self.rows, value or effective_hourly_price)
+
+	def to_dict(self):
+		""" Get the records grouped in the nested dict layout of the getters. This is not the getters' output:
+		all prices of a region are grouped under a single region entry (the getters add an entry per pricing
+		document), regions without prices are omitted, and so are reservations of terms other than those in
+		_PURCHASE_OPTION_TERMS, which have no records """
+		result_regions = []
+		result_regions_index = {}
+		result = {
+			"config" : {
+				"currency" : self.currency,
+			},
+			"regions" : result_regions
+		}
+		if self.pricing_type != "reserved":
+			result["config"]["unit"] = "perhr"
+
+		entry = None
+		entry_key = None
+		for row in self.rows:
+			if row.region in result_regions_index:
+				instance_types = result_regions_index[row.region]
+			else:
+				instance_types = []
+				result_regions.append({
+					"region" : row.region,
+					"instanceTypes" : instance_types
+				})
+				result_regions_index[row.region] = instance_types
+			if self.pricing_type != "reserved":
+				instance_types.append({
+					"type" : row.type,
+					"os" : row.os,
+					"price" : row.price
+				})
+				continue
+			key = (row.region, row.type, row.os, row.reservation)
+			if row.starts_entry or key != entry_key or row.term in entry["prices"]:
+				entry_key = key
+				entry = {
+					"type" : row.type,
+					"os" : row.os,
+					"reservation" : row.reservation,
+					"prices" : {}
+				}
+				instance_types.append(entry)
+			entry["prices"][row.term] = {"hourly" : row.hourly, "upfront" : row.upfront}
+		return result
+
+def _reserved_records(regions):
+	for region_name, entries in regions:
+		for _type, os_type, reservation, prices in entries:
+			starts_entry = True
+			for term, hourly, upfront in prices:
+				yield ReservedPrice(region_name, _type, os_type, reservation, term, hourly, upfront, starts_entry)
+				starts_entry = False
+
+def _ondemand_records(regions):
+	for region_name, entries in regions:
+		for _type, os_type, price in entries:
+			yield OnDemandPrice(region_name, _type, os_type, price)
+
+def iter_ec2_reserved_instances_prices(filter_region=None, filter_instance_type=None, filter_os_type=None, concurrency=DEFAULT_CONCURRENCY):
+	""" Generator variant of get_ec2_reserved_instances_prices. Yields a ReservedPrice per term,
+	the prices of each pricing document as soon as it is parsed. Documents are not added to the
+	in-process memo, so each one can be freed once its prices are yielded """
+	return _reserved_records(_iter_reserved_regions(filter_region, filter_instance_type, filter_os_type, concurrency, memoize=False))
+
+def iter_ec2_ondemand_instances_prices(filter_region=None, filter_instance_type=None, filter_os_type=None, pricing_type="ondemand", concurrency=DEFAULT_CONCURRENCY):
+	""" Generator variant of get_ec2_ondemand_instances_prices. Yields an OnDemandPrice per price,
+	the prices of each pricing document as soon as it is parsed. Documents are not added to the
+	in-process memo, so each one can be freed once its prices are yielded """
+	if pricing_type != "ondemand" and pricing_type != "spot":
+		raise ValueError("iter_ec2_ondemand_instances_prices: pricing_type argument must be 'ondemand' or 'spot'")
+	return _ondemand_records(_iter_ondemand_regions(filter_region, filter_instance_type, filter_os_type, pricing_type, concurrency, memoize=False))
+
+ONDEMAND_FIELDS = ["region", "type", "os", "price"]
+RESERVED_FIELDS = ["region", "type", "os", "reservation", "term", "hourly", "upfront"]
+
+class RowWriter(object):
+	""" Writes OnDemandPrice or ReservedPrice records (or any rows with the given fields as attributes)
+	to a file one by one. Output is collected in a buffer which is written out every buffer_size bytes and on close() """
+
+	def __init__(self, out, pricing_type, buffer_size=65536, fields=None):
+		self.out = out
+		if fields is None:
+			fields = RESERVED_FIELDS if pricing_type == "reserved" else ONDEMAND_FIELDS
+		self.fields = fields
+		self.titles = ["price" if f == "hourly" else f for f in fields]
+		self.buffer_size = buffer_size
+		self.buffer = []
+		self.buffered = 0
+		self.count = 0
+		self.header()
+
+	def _write(self, s):
+		self.buffer.append(s)
+		self.buffered += len(s)
+		if self.buffered >= self.buffer_size:
+			self.flush()
+
+	def flush(self):
+		self.out.write("".join(self.buffer))
+		self.out.flush()
+		self.buffer = []
+		self.buffered = 0
+
+	def header(self):
+		pass
+
+	def footer(self):
+		pass
+
+	def format(self, row):
+		raise NotImplementedError
+
+	def write(self, row):
+		self._write(self.format(row))
+		self.count += 1
+
+	def write_all(self, rows):
+		stats = STATS
+		if stats is None:
+			for row in rows:
+				self.write(row)
+			return
+		# only the time spent in write() counts, rows may be produced while they are written
+		elapsed = 0.0
+		for row in rows:
+			start = time.time()
+			self.write(row)
+			elapsed += time.time() - start
+		stats.add(None, output=elapsed)
+
+	def close(self):
+		start = time.time()
+		self.footer()
+		self.flush()
+		if STATS is not None:
+			STATS.add(None, output=time.time() - start)
+
+class CsvRowWriter(RowWriter):
+	""" Comma separated values with the same columns as the CSV output of the CLI """
+
+	def header(self):
+		self._write(",".join(self.titles) + "\n")
+
+	def format(self, row):
+		return ",".join([_csv_value(getattr(row, f)) for f in self.fields]) + "\n"
+
+class JsonRowWriter(RowWriter):
+	""" A JSON array with an object per row """
+
+	def header(self):
+		self._write("[")
+
+	def format(self, row):
+		return ("\n" if self.count == 0 else ",\n") + _json_row(row, self.fields)
+
+	def footer(self):
+		self._write("\n]\n" if self.count else "]\n")
+
+class NdjsonRowWriter(RowWriter):
+	""" Newline delimited JSON, an object per line """
+
+	def format(self, row):
+		return _json_row(row, self.fields) + "\n"
+
+class TableRowWriter(RowWriter):
+	""" A fixed width text table in the style of PrettyTable, with left aligned price columns.
+	By default rows are kept as formatted cells until close(), so that the columns fit every row.
+	With widths (a width per column) or sample (number of rows to size the columns from) rows are
+	written as they come, and cells wider than their column are not truncated """
+
+	def __init__(self, out, pricing_type, buffer_size=65536, fields=None, widths=None, sample=None):
+		self.widths = list(widths) if widths is not None else None
+		self.sample = sample
+		self.pending = []
+		RowWriter.__init__(self, out, pricing_type, buffer_size, fields)
+
+	def header(self):
+		self.left = [f.endswith(("price", "hourly", "upfront")) for f in self.fields]
+		if self.widths is not None:
+			self._write_header()
+
+	def _write_header(self):
+		self.separator = "+" + "+".join(["-" * (w + 2) for w in self.widths]) + "+\n"
+		self._write(self.separator)
+		self._write("| " + " | ".join([t.center(w) for t, w in izip(self.titles, self.widths)]) + " |\n")
+		self._write(self.separator)
+
+	def _line(self, cells):
+		return "| " + " | ".join([c.ljust(w) if left else c.center(w) for c, w, left in izip(cells, self.widths, self.left)]) + " |\n"
+
+	def write(self, row):
+		cells = [_csv_value(getattr(row, f)) for f in self.fields]
+		self.count += 1
+		if self.widths is not None:
+			self._write(self._line(cells))
+			return
+		self.pending.append(cells)
+		if self.sample is not None and len(self.pending) >= self.sample:
+			self._write_pending()
+
+	def _write_pending(self):
+		widths = [len(t) for t in self.titles]
+		for cells in self.pending:
+			widths = map(max, widths, map(len, cells))
+		self.widths = widths
+		self._write_header()
+		for cells in self.pending:
+			self._write(self._line(cells))
+		self.pending = []
+
+	def footer(self):
+		if self.widths is None:
+			self._write_pending()
+		self._write(self.separator)
+
+ROW_WRITERS = {
+	"table" : TableRowWriter,
+	"csv" : CsvRowWriter,
+	"json-rows" : JsonRowWriter,
+	"ndjson" : NdjsonRowWriter
+}
+
+def _csv_value(v):
+	if v == 0:
+		return "0"
+	if not v:
+		return ""
+	return "%s" % v
+
+def _json_row(row, fields):
+	return "{" + ", ".join(['"%s": %s' % (f, json.dumps(getattr(row, f))) for f in fields]) + "}"
+
+HOURS_PER_TERM = {"1year" : 365 * 24, "3year" : 3 * 365 * 24, "c3year" : 3 * 365 * 24}
+
+def _as_float(v):
+	if v is None or v == "":
+		return None
+	return float(v)
+
+def effective_hourly_price(row):
+	""" Hourly price of an OnDemandPrice, or of a ReservedPrice with its upfront payment spread over the term.
+	Returns None if the price is unknown """
+	if row.__class__ is OnDemandPrice:
+		return row.price
+	hourly = _as_float(row.hourly)
+	upfront = _as_float(row.upfront)
+	if hourly is None and upfront is None:
+		return None
+	return (hourly or 0.0) + (upfront or 0.0) / HOURS_PER_TERM.get(row.term, 365 * 24)
+
+class PriceIndex(object):
+	""" Index over the records of a PriceTable.
+	Point lookups by (region, type, os) or (region, type, os, reservation, term) for reserved prices are
+	dict lookups. Range and top-k queries use per (region, os[, reservation, term]) arrays of records
+	sorted by effective_hourly_price() """
+
+	def __init__(self, table):
+		self.pricing_type = table.pricing_type
+		self.reserved = (table.pricing_type == "reserved")
+		self.points = {}
+		groups = {}
+		for row in table:
+			if self.reserved:
+				key = (row.region, row.type, row.os, row.reservation, row.term)
+				group = (row.region, row.os, row.reservation, row.term)
+			else:
+				key = (row.region, row.type, row.os)
+				group = (row.region, row.os)
+			if key not in self.points:
+				self.points[key] = row
+			price = effective_hourly_price(row)
+			if price is not None:
+				groups.setdefault(group, []).append((price, row))
+		self.groups = {}
+		for group, items in groups.iteritems():
+			items.sort(key=lambda item: item[0])
+			self.groups[group] = ([item[0] for item in items], [item[1] for item in items])
+
+	def __len__(self):
+		return len(self.points)
+
+	def get(self, region, type, os, reservation=None, term=None):
+		""" Get the record for an instance type or None """
+		if self.reserved:
+			return self.points.get((region, type, os, reservation, term))
+		return self.points.get((region, type, os))
+
+	def _groups(self, region, os, reservation, term):
+		if self.reserved:
+			wanted = (region, os, reservation, term)
+		else:
+			wanted = (region, os)
+		if None not in wanted:
+			group = self.groups.get(wanted)
+			return [group] if group else []
+		return [g for k, g in self.groups.iteritems() if all(w is None or w == v for w, v in izip(wanted, k))]
+
+	def range(self, region=None, os=None, min_price=None, max_price=None, reservation=None, term=None, type=None):
+		""" Get records with min_price <= effective hourly price <= max_price, cheapest first.
+		region, os, reservation, term and type left as None match any value """
+		selected = []
+		for i, (prices, rows) in enumerate(self._groups(region, os, reservation, term)):
+			lo = 0 if min_price is None else bisect.bisect_left(prices, min_price)
+			hi = len(prices) if max_price is None else bisect.bisect_right(prices, max_price)
+			selected.append(izip(prices[lo:hi], repeat(i), xrange(lo, hi), rows[lo:hi]))
+		return [item[-1] for item in heapq.merge(*selected) if type is None or item[-1].type == type]
+
+	def cheapest(self, n, region=None, os=None, max_price=None, reservation=None, term=None, type=None):
+		""" Get the n records with the lowest effective hourly price, cheapest first. Only records of
+		instance type type are considered if it is given """
+		selected = []
+		for i, (prices, rows) in enumerate(self._groups(region, os, reservation, term)):
+			hi = len(prices) if max_price is None else bisect.bisect_right(prices, max_price)
+			if type is None:
+				# groups are not split by type, with a type any record of the group may be needed
+				hi = min(hi, n)
+			selected.append(izip(prices[:hi], repeat(i), xrange(hi), rows[:hi]))
+		merged = heapq.merge(*selected)
+		if type is not None:
+			merged = (item for item in merged if item[-1].type == type)
+		return [item[-1] for item in islice(merged, n)]
+
+class _PivotRow(object):
+	""" A row of the --pivot output, with a field per region """
+
+	def __init__(self, values):
+		self.__dict__.update(values)
+
+def _matrix_column(row):
+	if row.__class__ is OnDemandPrice:
+		return row.os
+	return "%s/%s/%s" % (row.os, row.reservation, row.term)
+
+class PriceMatrix(object):
+	""" Dense region x type x column array of hourly prices (numpy float64, NaN where there is no price).
+	Columns are os types for on-demand and spot prices, and "os/reservation/term" for reserved prices.
+	regions, types and columns are sorted numpy arrays of the axis labels. Requires numpy """
+
+	def __init__(self, prices, regions, types, columns):
+		self.prices = prices
+		self.regions = numpy.asarray(regions)
+		self.types = numpy.asarray(types)
+		self.columns = numpy.asarray(columns)
+
+	@classmethod
+	def from_rows(cls, rows, value=effective_hourly_price):
+		""" Build a matrix from OnDemandPrice or ReservedPrice records. value(row) is the price stored,
+		by default the effective hourly price. The first price of a region, type and column is kept """
+		if numpy is None:
+			raise ImportError("PriceMatrix requires numpy")
+		values = {}
+		for row in rows:
+			key = (row.region, row.type, _matrix_column(row))
+			if key not in values:
+				values[key] = value(row)
+		regions = sorted(set([k[0] for k in values]))
+		types = sorted(set([k[1] for k in values]))
+		columns = sorted(set([k[2] for k in values]))
+		prices = numpy.empty((len(regions), len(types), len(columns)))
+		prices.fill(numpy.nan)
+		if values:
+			region_index = dict((v, i) for i, v in enumerate(regions))
+			type_index = dict((v, i) for i, v in enumerate(types))
+			column_index = dict((v, i) for i, v in enumerate(columns))
+			keys = values.keys()
+			prices[[region_index[k[0]] for k in keys], [type_index[k[1]] for k in keys], [column_index[k[2]] for k in keys]] = \
+				[numpy.nan if values[k] is None else values[k] for k in keys]
+		return cls(prices, regions, types, columns)
+
+	@classmethod
+	def from_dict(cls, data, pricing_type, value=effective_hourly_price):
+		""" Build a matrix from the nested structure returned by the getters """
+		return cls.from_rows(_rows_from_dict(data, pricing_type), value)
+
+	def index(self, axis, label):
+		""" Position of label on axis ("regions", "types" or "columns") """
+		labels = getattr(self, axis)
+		i = numpy.searchsorted(labels, label)
+		if i >= len(labels) or labels[i] != label:
+			raise KeyError(label)
+		return int(i)
+
+	def get(self, region, type, column):
+		return self.prices[self.index("regions", region), self.index("types", type), self.index("columns", column)]
+
+	def mask(self, max_price=None, regions=None, types=None, columns=None):
+		""" Boolean array of the prices which are known, at most max_price and in the given regions, types and columns """
+		result = ~numpy.isnan(self.prices)
+		if max_price is not None:
+			with numpy.errstate(invalid="ignore"):
+				result &= self.prices <= max_price
+		for axis, labels in enumerate([regions, types, columns]):
+			if labels is not None:
+				selected = numpy.in1d([self.regions, self.types, self.columns][axis], labels)
+				shape = [1, 1, 1]
+				shape[axis] = -1
+				result &= selected.reshape(shape)
+		return result
+
+	def argmin(self, axis=0):
+		""" Position of the lowest price along axis (0 regions, 1 types, 2 columns), -1 where no price is known """
+		known = ~numpy.isnan(self.prices)
+		result = numpy.where(known, self.prices, numpy.inf).argmin(axis)
+		result[~known.any(axis)] = -1
+		return result
+
+	def cheapest_regions(self):
+		""" A types x columns array of the labels of the cheapest region, None where no price is known """
+		positions = self.argmin(0)
+		result = self.regions.astype(object)[positions]
+		result[positions < 0] = None
+		return result
+
+	def ratios(self, region="us-east-1"):
+		""" Prices divided by the price of the same type and column in region """
+		base = self.prices[self.index("regions", region)]
+		with numpy.errstate(invalid="ignore", divide="ignore"):
+			return self.prices / base[numpy.newaxis]
+
+	def column_ratios(self, column, base_column):
+		""" A regions x types array of the prices of column divided by the prices of base_column,
+		e.g. the Windows premium with column "mswin" and base_column "linux" """
+		with numpy.errstate(invalid="ignore", divide="ignore"):
+			return self.prices[:, :, self.index("columns", column)] / self.prices[:, :, self.index("columns", base_column)]
+
+	def pivot_rows(self):
+		""" Yields a dict per type and column with the price in every region (None when unknown) """
+		for t, _type in enumerate(self.types):
+			for c, column in enumerate(self.columns):
+				prices = self.prices[:, t, c]
+				if numpy.isnan(prices).all():
+					continue
+				row = {"type" : _type, "column" : column}
+				for region, price in izip(self.regions, prices.tolist()):
+					row[region] = None if price != price else price
+				yield row
+
+# Binary snapshot layout (little endian):
+#   header    - magic, version, then (count, offset) of the string table and of the
+#               ondemand, spot and reserved record sections
+#   strings   - count + 1 uint32 offsets into the string data that follows them, strings
+#               are sorted so that string ids compare like the strings themselves
+#   records   - fixed width records of string ids and prices (NaN for unknown prices),
+#               sorted by region, type, os (and reservation, term) for binary search
+_SNAPSHOT_MAGIC = "EC2PRICE"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_SECTIONS = ["ondemand", "spot", "reserved"]
+_SNAPSHOT_HEADER = struct.Struct("<8sII" + "II" * (1 + len(_SNAPSHOT_SECTIONS)))
+_SNAPSHOT_RECORDS = {
+	"ondemand" : struct.Struct("<HHH2xd"),
+	"spot" : struct.Struct("<HHH2xd"),
+	"reserved" : struct.Struct("<HHHHH6xdd")
+}
+_NAN = float("nan")
+
+def _nan_as_none(v):
+	if v != v:
+		return None
+	return v
+
+def _none_as_nan(v):
+	v = _as_float(v)
+	if v is None:
+		return _NAN
+	return v
+
+def save_snapshot(path, ondemand=(), spot=(), reserved=()):
+	""" Write OnDemandPrice records of on-demand and spot prices and ReservedPrice records into a binary
+	snapshot file, which load_snapshot() can query without parsing it. Reserved upfront prices are stored as floats """
+	sections = {"ondemand" : list(ondemand), "spot" : list(spot), "reserved" : list(reserved)}
+
+	strings = set()
+	for name, rows in sections.iteritems():
+		for row in rows:
+			strings.update((row.region, row.type, row.os))
+			if name == "reserved":
+				strings.update((row.reservation, row.term))
+	strings = sorted(s.encode("utf-8") if isinstance(s, unicode) else s for s in strings)
+	if len(strings) > 0xffff:
+		raise ValueError("save_snapshot: too many distinct strings")
+	ids = dict((s, i) for i, s in enumerate(strings))
+
+	packed = {}
+	for name, rows in sections.iteritems():
+		record = _SNAPSHOT_RECORDS[name]
+		if name == "reserved":
+			keys = sorted((ids[r.region], ids[r.type], ids[r.os], ids[r.reservation], ids[r.term], _none_as_nan(r.hourly), _none_as_nan(r.upfront)) for r in rows)
+		else:
+			keys = sorted((ids[r.region], ids[r.type], ids[r.os], _none_as_nan(r.price)) for r in rows)
+		packed[name] = "".join([record.pack(*k) for k in keys])
+
+	offsets = [0]
+	for s in strings:
+		offsets.append(offsets[-1] + len(s))
+	string_table = struct.pack("<%dI" % len(offsets), *offsets) + "".join(strings)
+
+	position = _SNAPSHOT_HEADER.size
+	header = [_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, 0, len(strings), position]
+	position += len(string_table)
+	for name in _SNAPSHOT_SECTIONS:
+		header += [len(packed[name]) / _SNAPSHOT_RECORDS[name].size, position]
+		position += len(packed[name])
+
+	tmp = "%s.%d.tmp" % (path, os.getpid())
+	with open(tmp, "wb") as f:
+		f.write(_SNAPSHOT_HEADER.pack(*header))
+		f.write(string_table)
+		for name in _SNAPSHOT_SECTIONS:
+			f.write(packed[name])
+	os.rename(tmp, path)
+
+class Snapshot(object):
+	""" Read-only view of a snapshot file written by save_snapshot(). The file is memory mapped and
+	records are only decoded when they are looked up or iterated """
+
+	def __init__(self, path):
+		with open(path, "rb") as f:
+			self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		header = _SNAPSHOT_HEADER.unpack_from(self.buffer, 0)
+		if header[0] != _SNAPSHOT_MAGIC or header[1] != _SNAPSHOT_VERSION:
+			raise ValueError("%s is not a pricing snapshot" % path)
+		self.string_count, self.strings_offset = header[3:5]
+		self.string_data_offset = self.strings_offset + 4 * (self.string_count + 1)
+		self.sections = {}
+		for i, name in enumerate(_SNAPSHOT_SECTIONS):
+			self.sections[name] = header[5 + 2 * i : 7 + 2 * i]
+
+	def close(self):
+		self.buffer.close()
+
+	def __len__(self):
+		return sum(count for count, offset in self.sections.itervalues())
+
+	def string(self, i):
+		start, end = struct.unpack_from("<II", self.buffer, self.strings_offset + 4 * i)
+		return self.buffer[self.string_data_offset + start : self.string_data_offset + end]
+
+	def string_id(self, s):
+		""" Binary search of the string table, returns None if s is not in the snapshot """
+		lo, hi = 0, self.string_count
+		while lo < hi:
+			mid = (lo + hi) // 2
+			v = self.string(mid)
+			if v < s:
+				lo = mid + 1
+			elif v > s:
+				hi = mid
+			else:
+				return mid
+		return None
+
+	def _record(self, pricing_type, i):
+		count, offset = self.sections[pricing_type]
+		record = _SNAPSHOT_RECORDS[pricing_type]
+		return record.unpack_from(self.buffer, offset + i * record.size)
+
+	def _decode(self, pricing_type, values):
+		s = self.string
+		if pricing_type == "reserved":
+			return ReservedPrice(s(values[0]), s(values[1]), s(values[2]), s(values[3]), s(values[4]), _nan_as_none(values[5]), _nan_as_none(values[6]))
+		return OnDemandPrice(s(values[0]), s(values[1]), s(values[2]), _nan_as_none(values[3]))
+
+	def _lower_bound(self, pricing_type, key):
+		""" Index of the first record whose leading ids are >= key """
+		lo, hi = 0, self.sections[pricing_type][0]
+		n = len(key)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self._record(pricing_type, mid)[:n] < key:
+				lo = mid + 1
+			else:
+				hi = mid
+		return lo
+
+	def get(self, pricing_type, region, type, os, reservation=None, term=None):
+		""" Get the OnDemandPrice or ReservedPrice record for an instance type or None """
+		names = [region, type, os]
+		if pricing_type == "reserved":
+			names += [reservation, term]
+		key = tuple(self.string_id(n) for n in names)
+		if None in key:
+			return None
+		i = self._lower_bound(pricing_type, key)
+		if i < self.sections[pricing_type][0]:
+			values = self._record(pricing_type, i)
+			if values[:len(key)] == key:
+				return self._decode(pricing_type, values)
+		return None
+
+	def rows(self, pricing_type, filter_region=None, filter_instance_type=None, filter_os_type=None):
+		""" Yields the records of a pricing type, optionally filtered like the getters """
+		count = self.sections[pricing_type][0]
+		start, end = 0, count
+		if filter_region is not None:
+			region = self.string_id(filter_region)
+			if region is None:
+				return
+			start = self._lower_bound(pricing_type, (region,))
+			end = self._lower_bound(pricing_type, (region + 1,))
+		wanted_type = None if filter_instance_type is None else self.string_id(filter_instance_type)
+		wanted_os = None if filter_os_type is None else self.string_id(filter_os_type)
+		if (filter_instance_type is not None and wanted_type is None) or (filter_os_type is not None and wanted_os is None):
+			return
+		for i in xrange(start, end):
+			values = self._record(pricing_type, i)
+			if wanted_type is not None and values[1] != wanted_type:
+				continue
+			if wanted_os is not None and values[2] != wanted_os:
+				continue
+			yield self._decode(pricing_type, values)
+
+	def table(self, pricing_type):
+		""" Get all records of a pricing type as a PriceTable """
+		return PriceTable(pricing_type, list(self.rows(pricing_type)))
+
+def load_snapshot(path):
+	""" Open a snapshot file written by save_snapshot() or --save-snapshot """
+	return Snapshot(path)
+
+
+def _parse_price(v):
+	if v is None or v == "":
+		return None
+	try:
+		return float(v)
+	except ValueError:
+		return v
+
+def _rows_from_dict(data, pricing_type):
+	""" Records of the nested structure returned by the getters (and printed by --format json) """
+	for r in data["regions"]:
+		for it in r["instanceTypes"]:
+			if pricing_type == "reserved":
+				starts_entry = True
+				for term in sorted(it["prices"]):
+					p = it["prices"][term]
+					yield ReservedPrice(r["region"], it["type"], it["os"], it["reservation"], term, p["hourly"], p["upfront"], starts_entry)
+					starts_entry = False
+			else:
+				yield OnDemandPrice(r["region"], it["type"], it["os"], it["price"])
+
+def _row_from_values(values, pricing_type):
+	if pricing_type == "reserved":
+		return ReservedPrice(values["region"], values["type"], values["os"], values["reservation"], values["term"], _parse_price(values["hourly"]), _parse_price(values["upfront"]))
+	return OnDemandPrice(values["region"], values["type"], values["os"], _parse_price(values["price"]))
+
+def load_saved_prices(path, pricing_type):
+	""" Yields the records of a pricing type from a snapshot file or from csv, json, json-rows or ndjson CLI output """
+	with open(path, "rb") as f:
+		magic = f.read(len(_SNAPSHOT_MAGIC))
+	if magic == _SNAPSHOT_MAGIC:
+		snapshot = load_snapshot(path)
+		for row in snapshot.rows(pricing_type):
+			yield row
+		return
+
+	with open(path, "rb") as f:
+		first = f.readline()
+		stripped = first.strip()
+		values = None
+		if stripped.startswith("{"):
+			try:
+				values = json.loads(stripped)
+			except ValueError:
+				pass
+		if isinstance(values, dict) and "region" in values:
+			# ndjson, an object per line
+			for line in chain([first], f):
+				if line.strip():
+					yield _row_from_values(json.loads(line), pricing_type)
+		elif stripped.startswith("{") or stripped.startswith("["):
+			f.seek(0)
+			data = json.load(f)
+			if isinstance(data, dict):
+				for row in _rows_from_dict(data, pricing_type):
+					yield row
+			else:
+				for values in data:
+					yield _row_from_values(values, pricing_type)
+		else:
+			fields = stripped.split(",")
+			if pricing_type == "reserved":
+				fields = ["hourly" if c == "price" else c for c in fields]
+			for line in f:
+				line = line.rstrip("\r\n")
+				if line:
+					yield _row_from_values(dict(izip(fields, line.split(","))), pricing_type)
+
+class PriceChange(object):
+	""" Difference of one instance type price between two price lists. change is "added", "removed" or
+	"changed", old_* and new_* hold the hourly (and for reservations upfront) prices of each side """
+	__slots__ = ("change", "region", "type", "os", "reservation", "term", "old_price", "new_price", "old_upfront", "new_upfront")
+
+	def __init__(self, change, old, new):
+		row = new if new is not None else old
+		self.change = change
+		self.region = row.region
+		self.type = row.type
+		self.os = row.os
+		self.reservation = getattr(row, "reservation", None)
+		self.term = getattr(row, "term", None)
+		self.old_price, self.old_upfront = _price_values(old)
+		self.new_price, self.new_upfront = _price_values(new)
+
+	def __repr__(self):
+		return "PriceChange(%r, %r, %r, %r, %r, %r, %r, %r)" % (self.change, self.region, self.type, self.os, self.reservation, self.term, self.old_price, self.new_price)
+
+ONDEMAND_DIFF_FIELDS = ["change", "region", "type", "os", "old_price", "new_price"]
+RESERVED_DIFF_FIELDS = ["change", "region", "type", "os", "reservation", "term", "old_price", "new_price", "old_upfront", "new_upfront"]
+
+def _price_key(row):
+	if row.__class__ is ReservedPrice:
+		return (row.region, row.type, row.os, row.reservation, row.term)
+	return (row.region, row.type, row.os)
+
+def _price_values(row):
+	if row is None:
+		return None, None
+	if row.__class__ is ReservedPrice:
+		return _as_float(row.hourly), _as_float(row.upfront)
+	return _as_float(row.price), None
+
+def _price_moved(old, new, threshold):
+	if old is None or new is None:
+		return old is not new
+	if old == 0:
+		return new != 0
+	return abs(new - old) > threshold * abs(old)
+
+def _compare_prices(old, new, threshold):
+	old_values = _price_values(old)
+	new_values = _price_values(new)
+	if _price_moved(old_values[0], new_values[0], threshold) or _price_moved(old_values[1], new_values[1], threshold):
+		return PriceChange("changed", old, new)
+	return None
+
+# diff_prices sorts inputs which are not snapshots this many rows at a time,
+# longer inputs are sorted in runs written to temporary files and merged
+DIFF_SORT_ROWS = 250000
+
+def _read_sorted_run(f, run):
+	f.seek(0)
+	n = 0
+	while True:
+		try:
+			values = cPickle.load(f)
+		except EOFError:
+			return
+		row = ReservedPrice(*values) if len(values) == len(ReservedPrice.__slots__) else OnDemandPrice(*values)
+		yield _price_key(row), run, n, row
+		n += 1
+
+def _sort_by_price_key(rows):
+	""" Yields rows sorted by _price_key, holding at most DIFF_SORT_ROWS of them in memory """
+	rows = iter(rows)
+	chunk = sorted(islice(rows, DIFF_SORT_ROWS), key=_price_key)
+	if len(chunk) < DIFF_SORT_ROWS:
+		for row in chunk:
+			yield row
+		return
+
+	files = []
+	try:
+		while chunk:
+			f = tempfile.TemporaryFile()
+			files.append(f)
+			for row in chunk:
+				cPickle.dump(tuple([getattr(row, name) for name in row.__slots__]), f, cPickle.HIGHEST_PROTOCOL)
+			chunk = sorted(islice(rows, DIFF_SORT_ROWS), key=_price_key)
+		for item in heapq.merge(*[_read_sorted_run(f, run) for run, f in enumerate(files)]):
+			yield item[-1]
+	finally:
+		for f in files:
+			f.close()
+
+def _diff_group(old_group, new_group, threshold):
+	""" Changes between the old and new rows of one key. Keys are not unique (a size listed under several
+	families, a reservation in both the current and previous generation documents), so the rows of a key
+	are compared as sorted lists of prices: paired in price order, the extra ones are added or removed """
+	changes = []
+	for old, new in izip_longest(sorted(old_group, key=_price_values), sorted(new_group, key=_price_values)):
+		if new is None:
+			changes.append(PriceChange("removed", old, None))
+		elif old is None:
+			changes.append(PriceChange("added", None, new))
+		else:
+			change = _compare_prices(old, new, threshold)
+			if change is not None:
+				changes.append(change)
+	return changes
+
+def diff_prices(old_rows, new_rows, threshold=0.0, sorted_rows=False):
+	""" Compare two lists of records of the same pricing type joined on (region, type, os[, reservation, term]).
+	Yields a PriceChange for every added or removed instance type and for every price that moved by more
+	than threshold, a fraction of the old price. Rows sharing a key are paired in price order (see _diff_group).
+	Both lists are merged in a single streaming pass in key order. If sorted_rows is True they must already be
+	sorted by that key (as Snapshot.rows() are), otherwise they are sorted first by _sort_by_price_key """
+	if not sorted_rows:
+		old_rows = _sort_by_price_key(old_rows)
+		new_rows = _sort_by_price_key(new_rows)
+	old_groups = groupby(old_rows, _price_key)
+	new_groups = groupby(new_rows, _price_key)
+	old = next(old_groups, None)
+	new = next(new_groups, None)
+	while old is not None or new is not None:
+		# a group is only valid until its iterator advances, _diff_group reads it at once
+		if new is None or (old is not None and old[0] < new[0]):
+			changes = _diff_group(old[1], (), threshold)
+			old = next(old_groups, None)
+		elif old is None or new[0] < old[0]:
+			changes = _diff_group((), new[1], threshold)
+			new = next(new_groups, None)
+		else:
+			changes = _diff_group(old[1], new[1], threshold)
+			old = next(old_groups, None)
+			new = next(new_groups, None)
+		for change in changes:
+			yield change
+
+def lookup_prices(queries, pricing_type="ondemand", concurrency=DEFAULT_CONCURRENCY):
+	""" Look up the prices of many (region, type, os) queries at once. Only the pricing documents some query
+	needs are downloaded, each one once, and the queries are answered from a hash join on the prices.
+	Returns a result per query, in the same order: the OnDemandPrice (None if unknown) of on-demand and
+	spot queries, the list of ReservedPrice records (one per reservation and term) of reserved queries """
+	if pricing_type not in ("ondemand", "reserved", "spot"):
+		raise ValueError("lookup_prices: pricing_type argument must be 'ondemand', 'reserved' or 'spot'")
+	queries = [tuple(q) for q in queries]
+	found = dict((q, []) for q in queries)
+	if not found:
+		return []
+
+	# filter in the normalization loops on what all queries share
+	def shared(i):
+		values = set([q[i] for q in found])
+		return values.pop() if len(values) == 1 else None
+	filter_region, filter_instance_type, filter_os_type = shared(0), shared(1), shared(2)
+	type_os = set([(q[1], q[2]) for q in found])
+	sources = [s for s in PRICING_SOURCES if s.kind == pricing_type and any(_source_skip_reason(s, t, o) is None for t, o in type_os)]
+
+	if pricing_type == "reserved":
+		for region_name, entries in _iter_reserved_regions(filter_region, filter_instance_type, filter_os_type, concurrency, sources):
+			for _type, os_type, reservation, prices in entries:
+				rows = found.get((region_name, _type, os_type))
+				if rows is not None:
+					starts_entry = True
+					for term, hourly, upfront in prices:
+						rows.append(ReservedPrice(region_name, _type, os_type, reservation, term, hourly, upfront, starts_entry))
+						starts_entry = False
+		return [found[q] for q in queries]
+
+	for region_name, entries in _iter_ondemand_regions(filter_region, filter_instance_type, filter_os_type, pricing_type, concurrency, sources):
+		for _type, os_type, price in entries:
+			rows = found.get((region_name, _type, os_type))
+			if rows is not None and not rows:
+				rows.append(OnDemandPrice(region_name, _type, os_type, price))
+	return [found[q][0] if found[q] else None for q in queries]
+
+def load_queries(f):
+	""" Yields a (region, type, os) tuple per "region,type,os" line of a file, skipping a header line """
+	for i, line in enumerate(f):
+		values = tuple([v.strip() for v in line.strip().split(",")])
+		if values == ("",) or (i == 0 and values == ("region", "type", "os")):
+			continue
+		if len(values) != 3:
+			raise ValueError("line %d: expected region,type,os, got %r" % (i + 1, line.strip()))
+		yield values
+
+HOURS_PER_YEAR = 365 * 24
+# Reservations whose hourly price is only charged for the hours an instance runs,
+# the others are charged for every hour of the term
+USAGE_BILLED_RESERVATIONS = frozenset(["light", "medium"])
+
+class FleetLine(object):
+	""" count instances of a type running hours hours a year, a line of a fleet file """
+	__slots__ = ("region", "type", "os", "count", "hours")
+
+	def __init__(self, region, type, os, count, hours=HOURS_PER_YEAR):
+		self.region = region
+		self.type = type
+		self.os = os
+		self.count = count
+		self.hours = hours
+
+class FleetChoice(object):
+	""" Cheapest purchase option of a FleetLine: "ondemand" or "reservation/term", None if no price is known.
+	cost, ondemand_cost and savings are yearly amounts for all instances of the line """
+	__slots__ = ("region", "type", "os", "count", "hours", "option", "cost", "ondemand_cost", "savings")
+
+	def __init__(self, line, option, cost, ondemand_cost):
+		self.region = line.region
+		self.type = line.type
+		self.os = line.os
+		self.count = line.count
+		self.hours = line.hours
+		self.option = option
+		self.cost = None if cost is None else round(cost * line.count, 2)
+		self.ondemand_cost = None if ondemand_cost is None else round(ondemand_cost * line.count, 2)
+		self.savings = None if cost is None or ondemand_cost is None else round(self.ondemand_cost - self.cost, 2)
+
+OPTIMIZE_FIELDS = ["region", "type", "os", "count", "hours", "option", "cost", "ondemand_cost", "savings"]
+
+def load_fleet(path):
+	""" Yields a FleetLine per line of a csv file with region, type, os, count and optional hours
+	(hours a year each instance runs, all year by default) columns """
+	with open(path, "rb") as f:
+		fields = [c.strip() for c in f.readline().strip().split(",")]
+		missing = [c for c in ["region", "type", "os", "count"] if c not in fields]
+		if missing:
+			raise ValueError("%s: missing %s column(s)" % (path, ", ".join(missing)))
+		for line in f:
+			line = line.strip()
+			if line:
+				values = dict(izip(fields, [v.strip() for v in line.split(",")]))
+				hours = values.get("hours") or HOURS_PER_YEAR
+				if hours.__class__ is str:
+					hours = int(hours) if hours.isdigit() else float(hours)
+				yield FleetLine(values["region"], values["type"], values["os"], int(values["count"]), hours)
+
+def _yearly_cost_lines(ondemand_rows, reserved_rows):
+	""" (region, type, os) -> list of (fixed yearly cost, cost per hour run, option) of one instance """
+	result = {}
+	for row in ondemand_rows:
+		if row.price is not None:
+			result.setdefault((row.region, row.type, row.os), []).append((0.0, row.price, "ondemand"))
+	for row in reserved_rows:
+		hourly = _as_float(row.hourly)
+		upfront = _as_float(row.upfront)
+		if (hourly is None and upfront is None) or row.term not in HOURS_PER_TERM:
+			continue
+		fixed = (upfront or 0.0) * HOURS_PER_YEAR / HOURS_PER_TERM[row.term]
+		if row.reservation in USAGE_BILLED_RESERVATIONS:
+			rate = hourly or 0.0
+		else:
+			fixed += (hourly or 0.0) * HOURS_PER_YEAR
+			rate = 0.0
+		result.setdefault((row.region, row.type, row.os), []).append((fixed, rate, "%s/%s" % (row.reservation, row.term)))
+	return result
+
+def _lower_envelope(cost_lines):
+	""" The cost lines which are the cheapest for some number of hours, by decreasing cost per hour,
+	and the numbers of hours from which each one but the first is the cheapest """
+	hull = []
+	for line in sorted(cost_lines, key=lambda l: (-l[1], l[0])):
+		if hull and hull[-1][1] == line[1]:
+			# same cost per hour and a higher fixed cost
+			continue
+		while hull and line[0] <= hull[-1][0]:
+			# cheaper at any number of hours
+			hull.pop()
+		while len(hull) >= 2 and _crossing(hull[-2], line) <= _crossing(hull[-2], hull[-1]):
+			hull.pop()
+		hull.append(line)
+	return hull, [_crossing(a, b) for a, b in izip(hull, hull[1:])]
+
+def _crossing(a, b):
+	""" Hours from which cost line b (lower cost per hour) is cheaper than a """
+	return (b[0] - a[0]) / (a[1] - b[1])
+
+def optimize_fleet(lines, ondemand_rows=None, reserved_rows=None, concurrency=DEFAULT_CONCURRENCY):
+	""" Yields a FleetChoice with the cheapest purchase option of every FleetLine, in order. On-demand and
+	reserved prices are downloaded once unless records are given. The cheapest option of each region, type
+	and os is precomputed as a function of the hours run, so each line costs a dict lookup and a bisection """
+	if ondemand_rows is None:
+		ondemand_rows = iter_ec2_ondemand_instances_prices(concurrency=concurrency)
+	if reserved_rows is None:
+		reserved_rows = iter_ec2_reserved_instances_prices(concurrency=concurrency)
+	cost_lines = _yearly_cost_lines(ondemand_rows, reserved_rows)
+	envelopes = {}
+	for line in lines:
+		key = (line.region, line.type, line.os)
+		envelope = envelopes.get(key)
+		if envelope is None:
+			options = cost_lines.get(key, ())
+			ondemand_rates = [rate for fixed, rate, option in options if option == "ondemand"]
+			envelope = envelopes[key] = _lower_envelope(options) + (ondemand_rates[0] if ondemand_rates else None,)
+		hull, crossings, ondemand_rate = envelope
+		if not hull:
+			yield FleetChoice(line, None, None, None)
+			continue
+		fixed, rate, option = hull[bisect.bisect_right(crossings, line.hours)]
+		yield FleetChoice(line, option, fixed + rate * line.hours, None if ondemand_rate is None else ondemand_rate * line.hours)
+
+def get_ec2_reserved_instances_prices(filter_region=None, filter_instance_type=None, filter_os_type=None, concurrency=DEFAULT_CONCURRENCY, as_records=False):
+	""" Get EC2 reserved instances prices. Results can be filtered by region.
+	Up to concurrency pricing documents are downloaded in parallel.
+	If as_records is True a PriceTable with one ReservedPrice per term is returned instead of nested dicts """
+
+	currency = DEFAULT_CURRENCY
+
+	if as_records:
+		return PriceTable("reserved", list(_reserved_records(_iter_reserved_regions(filter_region, filter_instance_type, filter_os_type, concurrency))), currency)
+
+	result_regions = []
+	result_regions_index = {}
+	result = {
+		"config" : {
+			"currency" : currency,
+		},
+		"regions" : result_regions
+	}
+
+	for region_name, entries in _iter_reserved_regions(filter_region, filter_instance_type, filter_os_type, concurrency):
+		if region_name in result_regions_index:
+			instance_types = result_regions_index[region_name]["instanceTypes"]
+		else:
+			instance_types = []
+			result_regions.append({
+				"region" : region_name,
+				"instanceTypes" : instance_types
+			})
+			result_regions_index[region_name] = result_regions[-1]
+
+		for _type, os_type, reservation, prices in entries:
+			instance_types.append({
+				"type" : _type,
+				"os" : os_type,
+				"reservation" : reservation,
+				"prices" : dict((term, {"hourly" : hourly, "upfront" : upfront}) for term, hourly, upfront in prices)
+			})
+
+	return result
+
+def get_ec2_ondemand_instances_prices(filter_region=None, filter_instance_type=None, filter_os_type=None, pricing_type="ondemand", concurrency=DEFAULT_CONCURRENCY, as_records=False):
+	""" Get EC2 on-demand or spot instances prices. Results can be filtered by region.
+	Up to concurrency pricing documents are downloaded in parallel.
+	If as_records is True a PriceTable of OnDemandPrice records is returned instead of nested dicts """
+
+	currency = DEFAULT_CURRENCY
+
+	if pricing_type != "ondemand" and pricing_type != "spot":
 		raise ValueError("get_ec2_ondemand_instances_prices: pricing_type argument must be 'ondemand' or 'spot'")
 
+	if as_records:
+		return PriceTable(pricing_type, list(_ondemand_records(_iter_ondemand_regions(filter_region, filter_instance_type, filter_os_type, pricing_type, concurrency))), currency)
+
 	result_regions = []
 	result = {
 		"config" : {
@@ -558,73 +2265,153 @@ def get_ec2_ondemand_instances_prices(filter_region=None, filter_instance_type=N
 		"regions" : result_regions
 	}
 
-	for u in urls:
-		os_type = None
-		if pricing_type == "ondemand":
-			os_type = INSTANCES_ONDEMAND_OS_TYPE_BY_URL[u]			
-			if get_specific_os_type and os_type != filter_os_type:
-				continue
-				
-		data = _load_data(u)
-		if "config" in data and data["config"] and "regions" in data["config"] and data["config"]["regions"]:
-			for r in data["config"]["regions"]:
-				if "region" in r and r["region"]:
-					region_name = JSON_NAME_TO_EC2_REGIONS_API[r["region"]]
+	for region_name, entries in _iter_ondemand_regions(filter_region, filter_instance_type, filter_os_type, pricing_type, concurrency):
+		result_regions.append({
+			"region" : region_name,
+			"instanceTypes" : [{"type" : _type, "os" : os_type, "price" : price} for _type, os_type, price in entries]
+		})
 
-					if get_specific_region and filter_region != region_name:
-						continue
-	
-					instance_types = []
-					if "instanceTypes" in r:
-						for it in r["instanceTypes"]:
-							if "sizes" in it:
-								for s in it["sizes"]:
-									_type = re.sub("[^a-z0-9.]*", "", s["size"])
-	
-									for price_data in s["valueColumns"]:
-										price = None
-										os_type_report = None
-										
-										if pricing_type == "spot":
-											os_type_report = price_data["name"]
-											if get_specific_os_type and os_type_report != filter_os_type:
-												continue
-										else:
-											os_type_report = os_type
-											
-										try:
-											price = float(price_data["prices"][currency])
-										except ValueError:
-											price = None
-										except TypeError:
-											price = None
-	
-										if get_specific_instance_type and _type != filter_instance_type:
-											continue
-	
-										instance_types.append({
-											"type" : _type,
-											"os" : os_type_report,
-											"price" : price
-										})
-	
-						result_regions.append({
-							"region" : region_name,
-							"instanceTypes" : instance_types
-						})
-	
 	return result
 
 
-if __name__ == "__main__":
-	def none_as_string(v):
-		if v == 0:
-			return "0"
-		if not v:
-			return ""
+PRICING_TYPES = ["ondemand", "spot", "reserved"]
+
+class PricingData(object):
+	""" On-demand, spot and reserved PriceTables with their PriceIndexes. It is never modified once built,
+	PricingServer replaces it as a whole on refresh """
+
+	def __init__(self, tables):
+		self.tables = tables
+		self.indexes = dict((t, PriceIndex(table)) for t, table in tables.iteritems())
+		self.by_region = {}
+		for t, table in tables.iteritems():
+			by_region = {}
+			for row in table:
+				by_region.setdefault(row.region, []).append(row)
+			self.by_region[t] = by_region
+		self.loaded = time.time()
+
+	def query(self, pricing_type, filter_region=None, filter_instance_type=None, filter_os_type=None, max_price=None, cheapest=None):
+		""" Get the records matching the filters, like the CLI options of the same names """
+		if max_price is not None or cheapest is not None:
+			# the type must be filtered before the top n are taken
+			index = self.indexes[pricing_type]
+			if cheapest is not None:
+				return index.cheapest(cheapest, filter_region, filter_os_type, max_price, type=filter_instance_type)
+			return index.range(filter_region, filter_os_type, max_price=max_price, type=filter_instance_type)
+		if filter_region is not None:
+			rows = self.by_region[pricing_type].get(filter_region, [])
 		else:
-			return v
+			rows = self.tables[pricing_type].rows
+		if filter_instance_type is not None or filter_os_type is not None:
+			rows = [r for r in rows if (filter_instance_type is None or r.type == filter_instance_type) and (filter_os_type is None or r.os == filter_os_type)]
+		return rows
+
+def load_pricing_data(concurrency=DEFAULT_CONCURRENCY, snapshot=None):
+	""" Load all prices into a PricingData, from a snapshot file if given """
+	if snapshot is not None:
+		s = load_snapshot(snapshot)
+		try:
+			return PricingData(dict((t, s.table(t)) for t in PRICING_TYPES))
+		finally:
+			s.close()
+	# reload every document, and don't keep them: the tables hold all the server needs
+	invalidate()
+	return PricingData({
+		"ondemand" : PriceTable("ondemand", list(iter_ec2_ondemand_instances_prices(concurrency=concurrency))),
+		"spot" : PriceTable("spot", list(iter_ec2_ondemand_instances_prices(pricing_type="spot", concurrency=concurrency))),
+		"reserved" : PriceTable("reserved", list(iter_ec2_reserved_instances_prices(concurrency=concurrency)))
+	})
+
+class _PricingRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+	""" GET /prices?type=ondemand&filter-region=...&filter-type=...&filter-os-type=...&max-price=...&cheapest=...&format=...
+	GET /status """
+
+	CONTENT_TYPES = {
+		"json" : "application/json",
+		"json-rows" : "application/json",
+		"ndjson" : "application/x-ndjson",
+		"csv" : "text/csv",
+		"table" : "text/plain"
+	}
 
+	def do_GET(self):
+		# a single read of the reference, so a request never sees two different datasets
+		data = self.server.data
+		url = urlparse.urlparse(self.path)
+		params = dict((k, v[-1]) for k, v in urlparse.parse_qs(url.query).iteritems())
+		if url.path == "/status":
+			self._reply(200, "application/json", json.dumps({
+				"loaded" : data.loaded,
+				"rows" : dict((t, len(table)) for t, table in data.tables.iteritems())
+			}) + "\n")
+		elif url.path == "/prices":
+			try:
+				pricing_type = params.get("type", "ondemand")
+				if pricing_type not in PRICING_TYPES:
+					raise ValueError("type must be one of " + ", ".join(PRICING_TYPES))
+				output_format = params.get("format", "json")
+				if output_format not in self.CONTENT_TYPES:
+					raise ValueError("format must be one of " + ", ".join(sorted(self.CONTENT_TYPES)))
+				max_price = params.get("max-price")
+				cheapest = params.get("cheapest")
+				rows = data.query(pricing_type, params.get("filter-region"), params.get("filter-type"), params.get("filter-os-type"),
+					None if max_price is None else float(max_price), None if cheapest is None else int(cheapest))
+			except ValueError, e:
+				self._reply(400, "text/plain", "%s\n" % e)
+				return
+			self.send_response(200)
+			self.send_header("Content-Type", self.CONTENT_TYPES[output_format])
+			self.end_headers()
+			# json is the same as json-rows, the records can't be put back in the getters' layout
+			writer = ROW_WRITERS["json-rows" if output_format == "json" else output_format](self.wfile, pricing_type)
+			writer.write_all(rows)
+			writer.close()
+		else:
+			self._reply(404, "text/plain", "Not found, use /prices or /status\n")
+
+	def _reply(self, code, content_type, body):
+		self.send_response(code)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		if self.server.verbose:
+			BaseHTTPServer.BaseHTTPRequestHandler.log_message(self, format, *args)
+
+# --serve without a host only listens on the local machine
+DEFAULT_SERVE_HOST = "127.0.0.1"
+
+class PricingServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+	""" HTTP server answering price queries from memory. loader is called to build a PricingData at
+	start and then every refresh_interval seconds in a background thread; the new data replaces the
+	old one with a single reference assignment, so requests never wait for a refresh """
+	daemon_threads = True
+	allow_reuse_address = True
+
+	def __init__(self, address, loader, refresh_interval=3600, verbose=False):
+		BaseHTTPServer.HTTPServer.__init__(self, address, _PricingRequestHandler)
+		self.loader = loader
+		self.refresh_interval = refresh_interval
+		self.verbose = verbose
+		self.data = loader()
+		if refresh_interval:
+			t = threading.Thread(target=self._refresh_loop, name="ec2pricing-refresh")
+			t.daemon = True
+			t.start()
+
+	def _refresh_loop(self):
+		while True:
+			time.sleep(self.refresh_interval)
+			try:
+				self.data = self.loader()
+			except Exception, e:
+				# keep serving the previous data
+				sys.stderr.write("Refresh failed: %s\n" % e)
+
+if __name__ == "__main__":
 	try:
 		import argparse 
 	except ImportError:
@@ -632,77 +2419,168 @@ if __name__ == "__main__":
 
 
 	parser = argparse.ArgumentParser(add_help=True, description="Print out the current prices of EC2 instances")
-	parser.add_argument("--type", "-t", help="Show ondemand, reserved, or spot instances", choices=["ondemand", "reserved", "spot"], required=True)
+	parser.add_argument("--type", "-t", help="Show ondemand, reserved, or spot instances", choices=["ondemand", "reserved", "spot"], default=None)
 	parser.add_argument("--filter-region", "-fr", help="Filter results to a specific region", choices=EC2_REGIONS, default=None)
 	parser.add_argument("--filter-type", "-ft", help="Filter results to a specific instance type", choices=EC2_INSTANCE_TYPES, default=None)
 	parser.add_argument("--filter-os-type", "-fo", help="Filter results to a specific os type", choices=EC2_OS_TYPES, default=None)
-	parser.add_argument("--format", "-f", choices=["json", "table", "csv"], help="Output format", default="table")
+	parser.add_argument("--format", "-f", choices=["json", "table", "csv", "json-rows", "ndjson"], help="Output format. All but json are written while the pricing documents are processed", default="table")
+	parser.add_argument("--table-sample", help="Start writing the table after N rows, sizing the columns from them instead of from all rows", type=int, default=None, metavar="N")
+	parser.add_argument("--concurrency", "-c", help="Number of pricing documents to download in parallel", type=int, default=DEFAULT_CONCURRENCY)
+	parser.add_argument("--cache-dir", help="Cache pricing documents in this directory", default=None)
+	parser.add_argument("--max-age", help="Seconds a cached document is used before it is revalidated", type=int, default=CACHE_MAX_AGE)
+	parser.add_argument("--offline", help="Only use cached documents, never access the network", action="store_true")
+	parser.add_argument("--replay", help="Read pricing documents from DIR/<host>/<path> instead of downloading them", default=None, metavar="DIR")
+	parser.add_argument("--timeout", help="Network timeout in seconds", type=float, default=HTTP_TIMEOUT)
+	parser.add_argument("--explain", help="Print which pricing documents would be fetched and exit", action="store_true")
+	parser.add_argument("--save-snapshot", help="Save on-demand, spot and reserved prices into a binary snapshot file and exit", default=None, metavar="FILE")
+	parser.add_argument("--snapshot", help="Read prices from a snapshot file instead of downloading them", default=None, metavar="FILE")
+	parser.add_argument("--diff", help="Compare two snapshots or saved csv/json/json-rows/ndjson outputs and print what changed", nargs=2, default=None, metavar=("OLD", "NEW"))
+	parser.add_argument("--threshold", help="With --diff, only report prices that moved by more than this percentage", type=float, default=0.0)
+	parser.add_argument("--serve", help="Run an HTTP server answering /prices queries from memory, on %s unless a HOST is given" % DEFAULT_SERVE_HOST, default=None, metavar="[HOST:]PORT")
+	parser.add_argument("--refresh", help="With --serve, reload prices every this many seconds", type=int, default=3600)
+	parser.add_argument("--max-price", help="Only show prices up to this hourly price (reserved prices include the upfront payment spread over the term)", type=float, default=None)
+	parser.add_argument("--cheapest", help="Only show the N cheapest prices", type=int, default=None, metavar="N")
+	parser.add_argument("--lookup", help="Print the prices of the region,type,os lines of a file (- for stdin), in the same order, downloading every needed pricing document once", default=None, metavar="FILE")
+	parser.add_argument("--optimize", help="Find the cheapest purchase option for every line of a fleet csv file (region, type, os, count and optional hours a year columns)", default=None, metavar="FLEET")
+	parser.add_argument("--pivot", help="Print a row per instance type and os (reserved: os/reservation/term) with the effective hourly price in every region. Requires numpy", action="store_true")
+	parser.add_argument("--stats", help="Print download, parse, normalization and output statistics to stderr when done", nargs="?", choices=["table", "json"], const="table", default=None)
 
 	args = parser.parse_args()
 
-	if args.format == "table":
-		try:
-			from prettytable import PrettyTable
-		except ImportError:
-			print "ERROR: Please install 'prettytable' using pip:    pip install prettytable"
+	if args.offline and args.cache_dir is None:
+		parser.error("--offline requires --cache-dir")
+	CACHE_DIR = args.cache_dir
+	CACHE_MAX_AGE = args.max_age
+	OFFLINE = args.offline
+	HTTP_TIMEOUT = args.timeout
+	if args.replay:
+		TRANSPORT = FileTransport(args.replay)
+	# a single run reads every document once, there is nothing to reuse (--serve reloads documents anyway)
+	MEMO_MAX_DOCUMENTS = 0
 
-	data = None
-	if args.type == "ondemand" or args.type == "spot":
-		data = get_ec2_ondemand_instances_prices(args.filter_region, args.filter_type, args.filter_os_type, args.type)
+	if args.stats:
+		STATS = PricingStats()
+		atexit.register(STATS.report, sys.stderr, args.stats)
+
+	if args.save_snapshot:
+		save_snapshot(args.save_snapshot,
+			iter_ec2_ondemand_instances_prices(concurrency=args.concurrency),
+			iter_ec2_ondemand_instances_prices(pricing_type="spot", concurrency=args.concurrency),
+			iter_ec2_reserved_instances_prices(concurrency=args.concurrency))
+		sys.exit(0)
+
+	if args.serve:
+		host, _, port = args.serve.rpartition(":")
+		if not host:
+			host = DEFAULT_SERVE_HOST
+		server = PricingServer((host, int(port)), lambda: load_pricing_data(args.concurrency, args.snapshot), args.refresh)
+		sys.stderr.write("Serving prices on %s:%d\n" % server.server_address)
+		server.serve_forever()
+
+	if args.optimize:
+		if args.snapshot:
+			snapshot = load_snapshot(args.snapshot)
+			choices = optimize_fleet(load_fleet(args.optimize), snapshot.rows("ondemand"), snapshot.rows("reserved"))
+		else:
+			choices = optimize_fleet(load_fleet(args.optimize), concurrency=args.concurrency)
+		writer_class = JsonRowWriter if args.format == "json" else ROW_WRITERS[args.format]
+		writer = writer_class(sys.stdout, None, fields=OPTIMIZE_FIELDS)
+		writer.write_all(choices)
+		writer.close()
+		sys.exit(0)
+
+	if args.type is None:
+		parser.error("argument --type/-t is required")
+
+	if args.explain:
+		print explain_plan(args.type, args.filter_type, args.filter_os_type)
+		sys.exit(0)
+
+	if args.lookup:
+		f = sys.stdin if args.lookup == "-" else open(args.lookup, "rb")
+		queries = list(load_queries(f))
+		rows = []
+		for (region, _type, os_type), result in izip(queries, lookup_prices(queries, args.type, args.concurrency)):
+			if args.type != "reserved":
+				rows.append(result or OnDemandPrice(region, _type, os_type, None))
+			else:
+				rows.extend(result or [ReservedPrice(region, _type, os_type, None, None, None, None)])
+		writer_class = JsonRowWriter if args.format == "json" else ROW_WRITERS[args.format]
+		writer = writer_class(sys.stdout, args.type)
+		writer.write_all(rows)
+		writer.close()
+		sys.exit(0)
+
+	if args.diff:
+		def saved(path):
+			for row in load_saved_prices(path, args.type):
+				if (args.filter_region is None or row.region == args.filter_region) and (args.filter_type is None or row.type == args.filter_type) and (args.filter_os_type is None or row.os == args.filter_os_type):
+					yield row
+		snapshots = all(open(path, "rb").read(len(_SNAPSHOT_MAGIC)) == _SNAPSHOT_MAGIC for path in args.diff)
+		changes = diff_prices(saved(args.diff[0]), saved(args.diff[1]), args.threshold / 100.0, snapshots)
+		fields = RESERVED_DIFF_FIELDS if args.type == "reserved" else ONDEMAND_DIFF_FIELDS
+		writer_class = JsonRowWriter if args.format == "json" else ROW_WRITERS[args.format]
+		writer = writer_class(sys.stdout, args.type, fields=fields)
+		writer.write_all(changes)
+		writer.close()
+		sys.exit(0)
+
+	if args.snapshot:
+		rows = load_snapshot(args.snapshot).rows(args.type, args.filter_region, args.filter_type, args.filter_os_type)
+	elif args.type == "ondemand" or args.type == "spot":
+		rows = iter_ec2_ondemand_instances_prices(args.filter_region, args.filter_type, args.filter_os_type, args.type, args.concurrency)
 	elif args.type == "reserved":
-		data = get_ec2_reserved_instances_prices(args.filter_region, args.filter_type, args.filter_os_type)
+		rows = iter_ec2_reserved_instances_prices(args.filter_region, args.filter_type, args.filter_os_type, args.concurrency)
 
-	if args.format == "json":
-		print json.dumps(data)
-	elif args.format == "table":
-		x = PrettyTable()
+	as_records = args.max_price is not None or args.cheapest is not None
+	if as_records:
+		index = PriceIndex(PriceTable(args.type, list(rows)))
+		if args.cheapest is not None:
+			rows = index.cheapest(args.cheapest, args.filter_region, args.filter_os_type, args.max_price)
+		else:
+			rows = index.range(args.filter_region, args.filter_os_type, max_price=args.max_price)
 
-		if args.type == "ondemand" or args.type == "spot":
-			try:			
-				x.set_field_names(["region", "type", "os", "price"])
-			except AttributeError:
-				x.field_names = ["region", "type", "os", "price"]
+	if args.pivot:
+		if numpy is None:
+			parser.error("--pivot requires numpy")
+		matrix = PriceMatrix.from_rows(rows)
+		writer_class = JsonRowWriter if args.format == "json" else ROW_WRITERS[args.format]
+		writer = writer_class(sys.stdout, args.type, fields=["type", "column"] + matrix.regions.tolist())
+		writer.write_all(_PivotRow(row) for row in matrix.pivot_rows())
+		writer.close()
+		sys.exit(0)
 
-			try:
-				x.aligns[-1] = "l"
-			except AttributeError:
-				x.align["price"] = "l"
-
-			for r in data["regions"]:
-				region_name = r["region"]
-				for it in r["instanceTypes"]:
-					x.add_row([region_name, it["type"], it["os"], none_as_string(it["price"])])
-		elif args.type == "reserved":
-			try:
-				x.set_field_names(["region", "type", "os", "reservation", "term", "price", "upfront"])
-			except AttributeError:
-				x.field_names = ["region", "type", "os", "reservation", "term", "price", "upfront"]
+	# records (from a snapshot, or ranked by --cheapest) can't be put back in the getters' layout,
+	# json is written as a list of rows instead
+	output_format = args.format
+	if output_format == "json" and (as_records or args.snapshot):
+		output_format = "json-rows"
 
-			try:
-				x.aligns[-1] = "l"
-				x.aligns[-2] = "l"
-			except AttributeError:
-				x.align["price"] = "l"
-				x.align["upfront"] = "l"
-			
-			for r in data["regions"]:
-				region_name = r["region"]
-				for it in r["instanceTypes"]:
-					for term in it["prices"]:
-						x.add_row([region_name, it["type"], it["os"], it["reservation"], term, none_as_string(it["prices"][term]["hourly"]), none_as_string(it["prices"][term]["upfront"])])
-
-		print x
-	elif args.format == "csv":
-		if args.type == "ondemand" or args.type == "spot":
-			print "region,type,os,price"
-			for r in data["regions"]:
-				region_name = r["region"]
-				for it in r["instanceTypes"]:
-					print "%s,%s,%s,%s" % (region_name, it["type"], it["os"], none_as_string(it["price"]))
-		elif args.type == "reserved":
-			print "region,type,os,reservation,term,price,upfront"
-			for r in data["regions"]:
-				region_name = r["region"]
-				for it in r["instanceTypes"]:
-					for term in it["prices"]:
-						print "%s,%s,%s,%s,%s,%s,%s" % (region_name, it["type"], it["os"], it["reservation"], term, none_as_string(it["prices"][term]["hourly"]), none_as_string(it["prices"][term]["upfront"]))
+	if output_format in ROW_WRITERS:
+		try:
+			if args.format == "table":
+				writer = TableRowWriter(sys.stdout, args.type, sample=args.table_sample)
+			else:
+				writer = ROW_WRITERS[output_format](sys.stdout, args.type)
+			writer.write_all(rows)
+			writer.close()
+		except IOError, e:
+			# the reader went away, e.g. | head
+			if e.errno != errno.EPIPE:
+				raise
+		finally:
+			# stop and join the fetch workers before the interpreter tears down
+			if hasattr(rows, "close"):
+				rows.close()
+		sys.exit(0)
+
+	data = None
+	if args.type == "ondemand" or args.type == "spot":
+		data = get_ec2_ondemand_instances_prices(args.filter_region, args.filter_type, args.filter_os_type, args.type, args.concurrency)
+	elif args.type == "reserved":
+		data = get_ec2_reserved_instances_prices(args.filter_region, args.filter_type, args.filter_os_type, args.concurrency)
+
+	start = time.time()
+	print json.dumps(data)
+	if STATS is not None:
+		STATS.add(None, output=time.time() - start)
@@ -23,20 +23,32 @@
 #
 import argparse
 import urllib2
-import boto.ec2
 import re
+import sqlite3
 import string
 import sys
-from multiprocessing import Pool
+import threading
+import time
+import urlparse
 import Queue
 
-from BeautifulSoup import BeautifulSoup
+from BeautifulSoup import BeautifulSoup, SoupStrainer
+# boto is only needed to list the images, not to read product pages
+try:
+	import boto.ec2
+except ImportError:
+	boto = None
 try:
 	import simplejson as json
 except ImportError:
 	import json
 
-WORKERS=2
+WORKERS=16
+
+# Requests per second sent to any one host (None or 0 for no limit)
+RATE_LIMIT=10.0
+
+HTTP_TIMEOUT=30
 
 EC2_REGIONS = [
 	"us-east-1",
@@ -80,15 +92,235 @@ DEFAULT_CURRENCY = "USD"
 
 PRODUCT_CACHE = {}
 
+# Persistent product cache, disabled when PRODUCT_STORE_FILE is None
+PRODUCT_STORE_FILE = None
+PRODUCT_STORE_TTL = 7 * 24 * 3600
+PRODUCT_STORE_MAX_ENTRIES = 50000
+# Look every product up again, but still store the results
+REFRESH = False
+
 VERBOSE = False
 
-def get_product_pricing(url):
-	f = urllib2.urlopen(url);
-	marketplace = BeautifulSoup(f.read())
+
+class RateLimiter(object):
+	""" Spaces requests to the same host at least 1 / RATE_LIMIT seconds apart """
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.next_slot = {}
+
+	def wait(self, host):
+		rate = RATE_LIMIT
+		if not rate:
+			return
+		self.lock.acquire()
+		try:
+			now = time.time()
+			slot = max(now, self.next_slot.get(host, 0))
+			self.next_slot[host] = slot + 1.0 / rate
+		finally:
+			self.lock.release()
+		if slot > now:
+			time.sleep(slot - now)
+
+RATE_LIMITER = RateLimiter()
+
+
+class ProductStore(object):
+	""" SQLite file keeping the product url and get_product_pricing() result of every product code.
+	Entries older than ttl seconds are not returned, and only the max_entries most recently
+	fetched ones are kept """
+
+	def __init__(self, path, ttl=None, max_entries=None):
+		self.ttl = ttl if ttl is not None else PRODUCT_STORE_TTL
+		self.max_entries = max_entries if max_entries is not None else PRODUCT_STORE_MAX_ENTRIES
+		self.lock = threading.Lock()
+		self.db = sqlite3.connect(path, check_same_thread=False)
+		self.db.execute("CREATE TABLE IF NOT EXISTS products (code TEXT PRIMARY KEY, url TEXT, pricing TEXT, fetched REAL)")
+		self.db.commit()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, code):
+		""" Returns (url, pricing) or None when code is unknown or expired. url and pricing
+		are None for products that could not be found """
+		self.lock.acquire()
+		try:
+			row = self.db.execute("SELECT url, pricing, fetched FROM products WHERE code = ?", (code,)).fetchone()
+		finally:
+			self.lock.release()
+		if row is None or REFRESH or time.time() - row[2] >= self.ttl:
+			self.misses += 1
+			return None
+		self.hits += 1
+		pricing = row[1]
+		if pricing is not None:
+			pricing = json.loads(pricing)
+		return row[0], pricing
+
+	def put(self, code, url, pricing):
+		if pricing is not None:
+			pricing = json.dumps(pricing)
+		self.lock.acquire()
+		try:
+			self.db.execute("INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?)", (code, url, pricing, time.time()))
+			self.db.commit()
+		finally:
+			self.lock.release()
+
+	def close(self):
+		self.lock.acquire()
+		try:
+			self.db.execute("DELETE FROM products WHERE fetched < ?", (time.time() - self.ttl,))
+			self.db.execute("DELETE FROM products WHERE code NOT IN (SELECT code FROM products ORDER BY fetched DESC LIMIT ?)", (self.max_entries,))
+			self.db.commit()
+			self.db.close()
+		finally:
+			self.lock.release()
+
+
+def urlopen(url):
+	RATE_LIMITER.wait(urlparse.urlsplit(url).netloc)
+	return urllib2.urlopen(url, timeout=HTTP_TIMEOUT)
+
+
+class LookupPipeline(object):
+	""" Runs calls on a pool of threads with at most `window` of them in flight.
+	next() returns results in the order they complete, not the order they were submitted """
+
+	def __init__(self, window=None):
+		self.window = window or WORKERS
+		self.tasks = Queue.Queue()
+		self.done = Queue.Queue()
+		self.pending = 0
+		self.threads = []
+		for i in range(self.window):
+			t = threading.Thread(target=self._work)
+			t.daemon = True
+			t.start()
+			self.threads.append(t)
+
+	def _work(self):
+		while True:
+			task = self.tasks.get()
+			if task is None:
+				return
+			fn, args = task
+			try:
+				self.done.put((True, fn(*args)))
+			except Exception:
+				self.done.put((False, sys.exc_info()))
+
+	def full(self):
+		return self.pending >= self.window
+
+	def empty(self):
+		return self.pending == 0
+
+	def submit(self, fn, *args):
+		self.pending += 1
+		self.tasks.put((fn, args))
+
+	def next(self):
+		ok, value = self.done.get()
+		self.pending -= 1
+		if not ok:
+			raise value[0], value[1], value[2]
+		return value
+
+	def close(self):
+		""" Drops the calls not started yet and stops the threads once their current call returns """
+		try:
+			while True:
+				self.tasks.get_nowait()
+		except Queue.Empty:
+			pass
+		for t in self.threads:
+			self.tasks.put(None)
+
+
+PRICE_PER_HOUR = re.compile(r"\$([0-9]+\.[0-9]+)/hr")
+
+# Single pass over the raw page: the monthly fee and every <region>-pricing-matrix table
+_PRODUCT_PAGE_PARTS = re.compile(r"""<span\b[^>]*(?<![\w-])id\s*=\s*["']?monthly-fee-text["'\s>][^>]*>(.*?)</span\s*>"""
+	r"""|<table\b[^>]*(?<![\w-])id\s*=\s*["']?([\w-]+)-pricing-matrix["'\s>][^>]*>(.*?)</table\s*>""", re.S | re.I)
+_HEADER = re.compile(r"<th\b([^>]*)>", re.I)
+_ROW = re.compile(r"<tr\b([^>]*)>(.*?)</tr\s*>", re.S | re.I)
+_CELL = re.compile(r"<td\b[^>]*>(.*?)</td\s*>", re.S | re.I)
+_ID_ATTRIBUTE = re.compile(r"""(?<![\w-])id\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_CLASS_ATTRIBUTE = re.compile(r"""(?<![\w-])class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_TAG = re.compile(r"<[^>]*>")
+
+# Fallback for pages the scan cannot read: only the same parts are parsed by BeautifulSoup
+PRODUCT_PAGE_PARTS = SoupStrainer(["span", "table"], {"id" : re.compile(r"^monthly-fee-text$|-pricing-matrix$")})
+
+def _attribute(pattern, attributes):
+	match = pattern.search(attributes)
+	if match:
+		return match.group(match.lastindex)
+	return None
+
+def _text(html):
+	""" Text of an html fragment, every piece stripped like BeautifulSoup's Tag.text """
+	return u"".join([piece.strip() for piece in _TAG.split(html)])
+
+def _scan_product_page(page):
+	""" Returns the monthly fee text (None when there is none) and, per pricing table id prefix,
+	the header classes and the cell texts of every row by row id. None when no pricing table is found """
+	monthly = None
+	tables = {}
+	for match in _PRODUCT_PAGE_PARTS.finditer(page):
+		if match.group(2) is None:
+			if monthly is None:
+				monthly = _text(match.group(1))
+			continue
+		if match.group(2) in tables:
+			continue
+		table = match.group(3)
+		headers = [_attribute(_CLASS_ATTRIBUTE, attributes) for attributes in _HEADER.findall(table)]
+		rows = {}
+		for attributes, row in _ROW.findall(table):
+			row_id = _attribute(_ID_ATTRIBUTE, attributes)
+			if row_id is not None and row_id not in rows:
+				rows[row_id] = [_text(cell) for cell in _CELL.findall(row)]
+		tables[match.group(2)] = (headers, rows)
+	if not tables:
+		return None
+	return monthly, tables
+
+def _soup_product_page(page):
+	""" Same as _scan_product_page, using BeautifulSoup """
+	marketplace = BeautifulSoup(page, parseOnlyThese=PRODUCT_PAGE_PARTS)
 	monthly = marketplace.find('span', attrs={'id':'monthly-fee-text'})
+	if monthly:
+		monthly = monthly.text
+	tables = {}
+	for table in marketplace.findAll('table', recursive=False):
+		region = table['id'][:-len('-pricing-matrix')]
+		if region in tables:
+			continue
+		rows = {}
+		for row in table.findAll('tr', id=True):
+			if row['id'] not in rows:
+				rows[row['id']] = [v.text for v in row.findAll('td')]
+		tables[region] = ([th.get('class') for th in table.findAll('th')], rows)
+	return monthly, tables
+
+def get_product_pricing(url):
+	f = urlopen(url);
+	return parse_product_pricing(f.read(), url)
+
+def parse_product_pricing(page, url=None):
+	""" Extracts the monthly fee and the price table of every region from a product page """
+	if isinstance(page, str):
+		page = page.decode("utf-8", "replace")
+	parts = _scan_product_page(page)
+	if parts is None:
+		parts = _soup_product_page(page)
+	monthly, tables = parts
 	m = 0
 	if monthly:
-		m = string.replace(monthly.text, "$", "")
+		m = string.replace(monthly, "$", "")
 	result = { 
 			"monthly" : m,
 			"regions" : {}
@@ -98,38 +330,33 @@ def get_product_pricing(url):
 	for region in EC2_REGIONS:
 		region_result = []
 		result["regions"][region] = region_result
-		region_table = marketplace.find('table', {'id': (region + '-pricing-matrix')})
+		region_table = tables.get(region)
 
 		if region_table:
-			headers = region_table.findAll('th')
+			headers, rows = region_table
 				
 			for instance in EC2_INSTANCE_TYPES:
-				row = region_table.find('tr', {'id' : region + "-" + EC2_INSTANCE_TYPES[instance] + "-row"})
-				if row :
+				values = rows.get(region + "-" + EC2_INSTANCE_TYPES[instance] + "-row")
+				if values is not None :
 					price_data = {}
 					region_result.append(price_data)
-					values = row.findAll('td')
 					if values :
-						i = 0
 						price_data["instance"] = instance
-						for v in values:
-							hdr = headers[i]['class']
-							text = v.text
-							match = re.search("\$([0-9]+\.[0-9]+)/hr", text)
+						for i, text in enumerate(values):
+							match = PRICE_PER_HOUR.search(text)
 							if match :
-								price_data[hdr] = match.group(1)
+								price_data[headers[i]] = match.group(1)
 							else :
-								price_data[hdr] = text
-							i = i + 1
-							pricecount = pricecount + 1
+								price_data[headers[i]] = text
+						pricecount = pricecount + len(values)
 	if pricecount == 0:
-		verbose("Warning: no prices extracted from " + url)
+		verbose("Warning: no prices extracted from " + str(url))
 	return result
 
 
 
 def search_product(code):
-	f = urllib2.urlopen("https://aws.amazon.com/marketplace/search/results?searchTerms=" + code)
+	f = urlopen("https://aws.amazon.com/marketplace/search/results?searchTerms=" + code)
 	search = BeautifulSoup(f.read())
 	div = search.find("div", {"class":"product-title"})
 	if div :
@@ -139,67 +366,103 @@ def search_product(code):
 	return None
 
 
-def prepare_product(code, image):
+def prepare_product(code):
 	url = search_product(code)
 	if url :
 		result = get_product_pricing(url)
-		return [result, image, code]
+		return [result, code, url]
 	else :
 		verbose("Could not find product " + code )
-		return [None, image, code]
-		
+		return [None, code, None]
+
+
+def list_region_images(region):
+	if boto is None:
+		raise ImportError("listing marketplace images requires boto")
+	verbose("Connecting to " + region)
+	ec2 = boto.ec2.connect_to_region(region)
+
+	verbose("Getting images in " + region)
+	return [region, ec2.get_all_images(owners=["aws-marketplace"])]
+
 def get_ec2_marketplace_prices(filter_region=None, filter_instance_type=None):
 	get_specific_region = (filter_region is not None)
-	pool = Pool(processes=WORKERS)
-	queue = Queue.Queue(maxsize=WORKERS)
+	regions = [region for region in EC2_REGIONS if not get_specific_region or filter_region == region]
+	# Images waiting on each product lookup in flight, as (region, image) pairs
+	waiting = {}
+	lookups = 0
+	duplicates = 0
+	store = None
+	if PRODUCT_STORE_FILE is not None:
+		store = ProductStore(PRODUCT_STORE_FILE)
+	# Images of all regions are listed at once, and all regions share the product lookups
+	listings = LookupPipeline(len(regions))
+	pipeline = LookupPipeline()
 	
-	result = {
-			"regions" : {}
-			}
+	try:
+		result = {
+				"regions" : {}
+				}
 	
-	for region in EC2_REGIONS:
-		if get_specific_region and filter_region != region :
-			continue
-		if not region in result["regions"] :
+		for region in regions:
 			result["regions"][region] = []
+			listings.submit(list_region_images, region)
+
+		while not listings.empty():
+			region, images = listings.next()
 		
-		verbose("Connecting to " + region)
-		ec2 = boto.ec2.connect_to_region(region)
-		
-		verbose("Getting images")
-		images = ec2.get_all_images(owners=["aws-marketplace"])
-		
-		totalCount = len(images)
-		currentImage = 1
+			totalCount = len(images)
+			currentImage = 1
 		
-		region_result = result["regions"][region]
+			region_result = result["regions"][region]
 		
-		for image in images :
-			verbose("Processing " + image.id + " [" + str(currentImage) + "/" + str(totalCount) + "]")
-			currentImage = currentImage + 1			
-			match = re.search(r".*-([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-ami.*", image.location)
-			if queue.full():
-				process_image(queue, region, region_result, filter_instance_type)
-			if match:
-				code = match.group(1)
-				if code in PRODUCT_CACHE:
-					process_image2(region, PRODUCT_CACHE[code], image, region_result, filter_instance_type)
-				else:
-					queue.put(pool.apply_async(prepare_product, [code, image]))
-		while not queue.empty() :
-			process_image(queue, region, region_result, filter_instance_type)
-			
+			for image in images :
+				verbose("Processing " + region + " " + image.id + " [" + str(currentImage) + "/" + str(totalCount) + "]")
+				currentImage = currentImage + 1			
+				match = re.search(r".*-([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-ami.*", image.location)
+				if pipeline.full():
+					process_image(pipeline, result, waiting, filter_instance_type, store)
+				if match:
+					code = match.group(1)
+					if code in waiting:
+						waiting[code].append((region, image))
+						duplicates = duplicates + 1
+						continue
+					if code not in PRODUCT_CACHE and store is not None:
+						stored = store.get(code)
+						if stored is not None:
+							PRODUCT_CACHE[code] = stored[1]
+					if code in PRODUCT_CACHE:
+						process_image2(region, PRODUCT_CACHE[code], image, region_result, filter_instance_type)
+					else:
+						waiting[code] = [(region, image)]
+						lookups = lookups + 1
+						pipeline.submit(prepare_product, code)
+		while not pipeline.empty() :
+			process_image(pipeline, result, waiting, filter_instance_type, store)
+
+		verbose("Product lookups: " + str(lookups) + ", duplicate lookups avoided: " + str(duplicates))
+		if store is not None:
+			verbose("Product store: " + str(store.hits) + " hits, " + str(store.misses) + " misses")
+	finally:
+		# also when a listing or lookup failed, so that no worker thread or database handle is left behind
+		listings.close()
+		pipeline.close()
+		if store is not None:
+			store.close()
 	return result
 
 
-def process_image(queue, region, region_result, filter_instance_type=None):
-	records = queue.get().get()
+def process_image(pipeline, result, waiting, filter_instance_type=None, store=None):
+	records = pipeline.next()
 	if records:
 		product = records[0]
-		image = records[1]
-		code = records[2]
+		code = records[1]
 		PRODUCT_CACHE[code] = product
-		process_image2(region, product, image, region_result, filter_instance_type)
+		if store is not None:
+			store.put(code, records[2], product)
+		for region, image in waiting.pop(code):
+			process_image2(region, product, image, result["regions"][region], filter_instance_type)
 
 
 def process_image2(region, product, image, region_result, filter_instance_type=None):
@@ -239,13 +502,25 @@ if __name__ == "__main__":
 	parser.add_argument("--filter-region", "-fr", help="Filter results to a specific region", choices=EC2_REGIONS, default=None)
 	parser.add_argument("--filter-type", "-ft", help="Filter results to a specific instance type", choices=EC2_INSTANCE_TYPES, default=None)
 	parser.add_argument("--verbose", "-v", help="Verbose output to stderr", action="store_true")
-	parser.add_argument("--workers", "-w", help="Number of workers", default=2)
+	parser.add_argument("--workers", "-w", help="Number of product lookups in flight", default=WORKERS)
+	parser.add_argument("--rate-limit", help="Maximum requests per second to any one host (0 for no limit)", type=float, default=RATE_LIMIT)
+	parser.add_argument("--cache-file", help="Keep product pricing in this SQLite file across runs", default=None)
+	parser.add_argument("--cache-ttl", help="Seconds a stored product is used before it is looked up again", type=int, default=PRODUCT_STORE_TTL)
+	parser.add_argument("--cache-size", help="Maximum number of products kept in the cache file", type=int, default=PRODUCT_STORE_MAX_ENTRIES)
+	parser.add_argument("--refresh", help="Look up every product again, ignoring the cache file", action="store_true")
 	parser.add_argument("--format", "-f", choices=["json", "table", "csv"], help="Output format", default="table")
 
 	args = parser.parse_args()
+	if boto is None:
+		parser.error("boto is required to list marketplace images")
 	
 	VERBOSE = args.verbose
 	WORKERS = int(args.workers)
+	RATE_LIMIT = args.rate_limit
+	PRODUCT_STORE_FILE = args.cache_file
+	PRODUCT_STORE_TTL = args.cache_ttl
+	PRODUCT_STORE_MAX_ENTRIES = args.cache_size
+	REFRESH = args.refresh
 	
 	verbose("Using " + str(WORKERS) + " workers")
 	
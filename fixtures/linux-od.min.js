@@ -0,0 +1,6 @@
+/*
+ * This file is intended for use only on aws.amazon.com. We do not guarantee its availability or accuracy.
+ *
+ * Copyright 2017 Amazon.com, Inc. or its affiliates. All rights reserved.
+ */
+callback({vers:0.01,config:{rate:"perhr",valueColumns:["vCPU","ECU","memoryGiB","storageGB","linux"],currencies:["USD"],regions:[{region:"us-east-1",instanceTypes:[{type:"generalCurrentGen",sizes:[{size:"t2.nano",vCPU:"1",ECU:"variable",memoryGiB:"0.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0059"}}]},{size:"t2.micro",vCPU:"1",ECU:"variable",memoryGiB:"1",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0116"}}]},{size:"t2.small",vCPU:"1",ECU:"variable",memoryGiB:"2",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.023"}}]},{size:"t2.medium",vCPU:"2",ECU:"variable",memoryGiB:"4",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0464"}}]},{size:"t2.large",vCPU:"2",ECU:"variable",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0928"}}]},{size:"m4.large",vCPU:"2",ECU:"6.5",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1"}}]},{size:"m4.xlarge",vCPU:"4",ECU:"13",memoryGiB:"16",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.2"}}]},{size:"m4.2xlarge",vCPU:"8",ECU:"26",memoryGiB:"32",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.4"}}]},{size:"m4.4xlarge",vCPU:"16",ECU:"53.5",memoryGiB:"64",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.8"}}]},{size:"m4.10xlarge",vCPU:"40",ECU:"124.5",memoryGiB:"160",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"2.000"}}]},{size:"m4.16xlarge",vCPU:"64",ECU:"188",memoryGiB:"256",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"3.200"}}]},{size:"m3.medium",vCPU:"1",ECU:"3",memoryGiB:"3.75",storageGB:"1 x 4 SSD",valueColumns:[{name:"linux",prices:{USD:"0.067"}}]},{size:"m3.large",vCPU:"2",ECU:"6.5",memoryGiB:"7.5",storageGB:"1 x 32 SSD",valueColumns:[{name:"linux",prices:{USD:"0.133"}}]}]},{type:"computeCurrentGen",sizes:[{size:"c4.large",vCPU:"2",ECU:"8",memoryGiB:"3.75",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1"}}]},{size:"c4.xlarge",vCPU:"4",ECU:"16",memoryGiB:"7.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.199"}}]},{size:"c4.2xlarge",vCPU:"8",ECU:"31",memoryGiB:"15",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.398"}}]},{size:"c4.4xlarge",vCPU:"16",ECU:"62",memoryGiB:"30",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.796"}}]},{size:"c4.8xlarge",vCPU:"36",ECU:"132",memoryGiB:"60",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"1.591"}}]}]},{type:"memoryCurrentGen",sizes:[{size:"r4.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.133"}}]},{size:"r4.xlarge",vCPU:"4",ECU:"13.5",memoryGiB:"30.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.266"}}]},{size:"r4.2xlarge",vCPU:"8",ECU:"27",memoryGiB:"61",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.532"}}]},{size:"x1.16xlarge",vCPU:"64",ECU:"174.5",memoryGiB:"976",storageGB:"1 x 1920 SSD",valueColumns:[{name:"linux",prices:{USD:"6.669"}}]}]},{type:"storageCurrentGen",sizes:[{size:"i3.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"1 x 475 NVMe SSD",valueColumns:[{name:"linux",prices:{USD:"0.156"}}]},{size:"d2.xlarge",vCPU:"4",ECU:"14",memoryGiB:"30.5",storageGB:"3 x 2000 HDD",valueColumns:[{name:"linux",prices:{USD:"0.69"}}]}]}]},{region:"us-west-2",instanceTypes:[{type:"generalCurrentGen",sizes:[{size:"t2.nano",vCPU:"1",ECU:"variable",memoryGiB:"0.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0059"}}]},{size:"t2.micro",vCPU:"1",ECU:"variable",memoryGiB:"1",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0116"}}]},{size:"t2.small",vCPU:"1",ECU:"variable",memoryGiB:"2",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.023"}}]},{size:"t2.medium",vCPU:"2",ECU:"variable",memoryGiB:"4",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0464"}}]},{size:"t2.large",vCPU:"2",ECU:"variable",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0928"}}]},{size:"m4.large",vCPU:"2",ECU:"6.5",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1"}}]},{size:"m4.xlarge",vCPU:"4",ECU:"13",memoryGiB:"16",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.2"}}]},{size:"m4.2xlarge",vCPU:"8",ECU:"26",memoryGiB:"32",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.4"}}]},{size:"m4.4xlarge",vCPU:"16",ECU:"53.5",memoryGiB:"64",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.8"}}]},{size:"m4.10xlarge",vCPU:"40",ECU:"124.5",memoryGiB:"160",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"2.000"}}]},{size:"m4.16xlarge",vCPU:"64",ECU:"188",memoryGiB:"256",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"3.200"}}]},{size:"m3.medium",vCPU:"1",ECU:"3",memoryGiB:"3.75",storageGB:"1 x 4 SSD",valueColumns:[{name:"linux",prices:{USD:"0.067"}}]},{size:"m3.large",vCPU:"2",ECU:"6.5",memoryGiB:"7.5",storageGB:"1 x 32 SSD",valueColumns:[{name:"linux",prices:{USD:"0.133"}}]}]},{type:"computeCurrentGen",sizes:[{size:"c4.large",vCPU:"2",ECU:"8",memoryGiB:"3.75",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1"}}]},{size:"c4.xlarge",vCPU:"4",ECU:"16",memoryGiB:"7.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.199"}}]},{size:"c4.2xlarge",vCPU:"8",ECU:"31",memoryGiB:"15",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.398"}}]},{size:"c4.4xlarge",vCPU:"16",ECU:"62",memoryGiB:"30",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.796"}}]},{size:"c4.8xlarge",vCPU:"36",ECU:"132",memoryGiB:"60",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"1.591"}}]}]},{type:"memoryCurrentGen",sizes:[{size:"r4.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.133"}}]},{size:"r4.xlarge",vCPU:"4",ECU:"13.5",memoryGiB:"30.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.266"}}]},{size:"r4.2xlarge",vCPU:"8",ECU:"27",memoryGiB:"61",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.532"}}]},{size:"x1.16xlarge",vCPU:"64",ECU:"174.5",memoryGiB:"976",storageGB:"1 x 1920 SSD",valueColumns:[{name:"linux",prices:{USD:"6.669"}}]}]},{type:"storageCurrentGen",sizes:[{size:"i3.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"1 x 475 NVMe SSD",valueColumns:[{name:"linux",prices:{USD:"0.156"}}]},{size:"d2.xlarge",vCPU:"4",ECU:"14",memoryGiB:"30.5",storageGB:"3 x 2000 HDD",valueColumns:[{name:"linux",prices:{USD:"0.69"}}]}]}]},{region:"eu-west-1",instanceTypes:[{type:"generalCurrentGen",sizes:[{size:"t2.nano",vCPU:"1",ECU:"variable",memoryGiB:"0.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0065"}}]},{size:"t2.micro",vCPU:"1",ECU:"variable",memoryGiB:"1",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0128"}}]},{size:"t2.small",vCPU:"1",ECU:"variable",memoryGiB:"2",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0253"}}]},{size:"t2.medium",vCPU:"2",ECU:"variable",memoryGiB:"4",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.051"}}]},{size:"t2.large",vCPU:"2",ECU:"variable",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1021"}}]},{size:"m4.large",vCPU:"2",ECU:"6.5",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.11"}}]},{size:"m4.xlarge",vCPU:"4",ECU:"13",memoryGiB:"16",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.22"}}]},{size:"m4.2xlarge",vCPU:"8",ECU:"26",memoryGiB:"32",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.44"}}]},{size:"m4.4xlarge",vCPU:"16",ECU:"53.5",memoryGiB:"64",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.88"}}]},{size:"m4.10xlarge",vCPU:"40",ECU:"124.5",memoryGiB:"160",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"2.200"}}]},{size:"m4.16xlarge",vCPU:"64",ECU:"188",memoryGiB:"256",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"3.520"}}]},{size:"m3.medium",vCPU:"1",ECU:"3",memoryGiB:"3.75",storageGB:"1 x 4 SSD",valueColumns:[{name:"linux",prices:{USD:"0.0737"}}]},{size:"m3.large",vCPU:"2",ECU:"6.5",memoryGiB:"7.5",storageGB:"1 x 32 SSD",valueColumns:[{name:"linux",prices:{USD:"0.1463"}}]}]},{type:"computeCurrentGen",sizes:[{size:"c4.large",vCPU:"2",ECU:"8",memoryGiB:"3.75",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.11"}}]},{size:"c4.xlarge",vCPU:"4",ECU:"16",memoryGiB:"7.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.2189"}}]},{size:"c4.2xlarge",vCPU:"8",ECU:"31",memoryGiB:"15",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.4378"}}]},{size:"c4.4xlarge",vCPU:"16",ECU:"62",memoryGiB:"30",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.8756"}}]},{size:"c4.8xlarge",vCPU:"36",ECU:"132",memoryGiB:"60",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"1.750"}}]}]},{type:"memoryCurrentGen",sizes:[{size:"r4.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1463"}}]},{size:"r4.xlarge",vCPU:"4",ECU:"13.5",memoryGiB:"30.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.2926"}}]},{size:"r4.2xlarge",vCPU:"8",ECU:"27",memoryGiB:"61",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.5852"}}]},{size:"x1.16xlarge",vCPU:"64",ECU:"174.5",memoryGiB:"976",storageGB:"1 x 1920 SSD",valueColumns:[{name:"linux",prices:{USD:"7.336"}}]}]},{type:"storageCurrentGen",sizes:[{size:"i3.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"1 x 475 NVMe SSD",valueColumns:[{name:"linux",prices:{USD:"0.1716"}}]},{size:"d2.xlarge",vCPU:"4",ECU:"14",memoryGiB:"30.5",storageGB:"3 x 2000 HDD",valueColumns:[{name:"linux",prices:{USD:"0.759"}}]}]}]},{region:"ap-northeast-1",instanceTypes:[{type:"generalCurrentGen",sizes:[{size:"t2.nano",vCPU:"1",ECU:"variable",memoryGiB:"0.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0076"}}]},{size:"t2.micro",vCPU:"1",ECU:"variable",memoryGiB:"1",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.015"}}]},{size:"t2.small",vCPU:"1",ECU:"variable",memoryGiB:"2",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0297"}}]},{size:"t2.medium",vCPU:"2",ECU:"variable",memoryGiB:"4",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.0599"}}]},{size:"t2.large",vCPU:"2",ECU:"variable",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1197"}}]},{size:"m4.large",vCPU:"2",ECU:"6.5",memoryGiB:"8",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.129"}}]},{size:"m4.xlarge",vCPU:"4",ECU:"13",memoryGiB:"16",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.258"}}]},{size:"m4.2xlarge",vCPU:"8",ECU:"26",memoryGiB:"32",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.516"}}]},{size:"m4.4xlarge",vCPU:"16",ECU:"53.5",memoryGiB:"64",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"1.032"}}]},{size:"m4.10xlarge",vCPU:"40",ECU:"124.5",memoryGiB:"160",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"2.580"}}]},{size:"m4.16xlarge",vCPU:"64",ECU:"188",memoryGiB:"256",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"4.128"}}]},{size:"m3.medium",vCPU:"1",ECU:"3",memoryGiB:"3.75",storageGB:"1 x 4 SSD",valueColumns:[{name:"linux",prices:{USD:"0.0864"}}]},{size:"m3.large",vCPU:"2",ECU:"6.5",memoryGiB:"7.5",storageGB:"1 x 32 SSD",valueColumns:[{name:"linux",prices:{USD:"0.1716"}}]}]},{type:"computeCurrentGen",sizes:[{size:"c4.large",vCPU:"2",ECU:"8",memoryGiB:"3.75",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.129"}}]},{size:"c4.xlarge",vCPU:"4",ECU:"16",memoryGiB:"7.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.2567"}}]},{size:"c4.2xlarge",vCPU:"8",ECU:"31",memoryGiB:"15",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.5134"}}]},{size:"c4.4xlarge",vCPU:"16",ECU:"62",memoryGiB:"30",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"1.027"}}]},{size:"c4.8xlarge",vCPU:"36",ECU:"132",memoryGiB:"60",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"2.052"}}]}]},{type:"memoryCurrentGen",sizes:[{size:"r4.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.1716"}}]},{size:"r4.xlarge",vCPU:"4",ECU:"13.5",memoryGiB:"30.5",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.3431"}}]},{size:"r4.2xlarge",vCPU:"8",ECU:"27",memoryGiB:"61",storageGB:"ebsonly",valueColumns:[{name:"linux",prices:{USD:"0.6863"}}]},{size:"x1.16xlarge",vCPU:"64",ECU:"174.5",memoryGiB:"976",storageGB:"1 x 1920 SSD",valueColumns:[{name:"linux",prices:{USD:"8.603"}}]}]},{type:"storageCurrentGen",sizes:[{size:"i3.large",vCPU:"2",ECU:"7",memoryGiB:"15.25",storageGB:"1 x 475 NVMe SSD",valueColumns:[{name:"linux",prices:{USD:"0.2012"}}]},{size:"d2.xlarge",vCPU:"4",ECU:"14",memoryGiB:"30.5",storageGB:"3 x 2000 HDD",valueColumns:[{name:"linux",prices:{USD:"0.8901"}}]}]}]}]}});
\ No newline at end of file
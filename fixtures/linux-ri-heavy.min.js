@@ -0,0 +1,6 @@
+/*
+ * This file is intended for use only on aws.amazon.com. We do not guarantee its availability or accuracy.
+ *
+ * Copyright 2014 Amazon.com, Inc. or its affiliates. All rights reserved.
+ */
+callback({vers:0.01,config:{currency:"USD",regions:[{region:"us-east",instanceTypes:[{type:"stdResI",sizes:[{size:"sm",valueColumns:[{name:"yrTerm1",prices:{USD:"169"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.014"}},{name:"yrTerm3",prices:{USD:"257"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.012"}}]},{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"338"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.028"}},{name:"yrTerm3",prices:{USD:"514"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.024"}}]},{size:"lg",valueColumns:[{name:"yrTerm1",prices:{USD:"676"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.056"}},{name:"yrTerm3",prices:{USD:"1028"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.048"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1352"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.112"}},{name:"yrTerm3",prices:{USD:"2056"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.096"}}]}]},{type:"secgenstdResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1489"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.124"}},{name:"yrTerm3",prices:{USD:"2280"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.105"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"2978"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.248"}},{name:"yrTerm3",prices:{USD:"4560"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.21"}}]}]},{type:"uResI",sizes:[{size:"u",valueColumns:[{name:"yrTerm1",prices:{USD:"62"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.005"}},{name:"yrTerm3",prices:{USD:"100"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.005"}}]}]},{type:"hiMemResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1088"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.09"}},{name:"yrTerm3",prices:{USD:"1651"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.074"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"2176"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.18"}},{name:"yrTerm3",prices:{USD:"3302"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.148"}}]},{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"4352"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.36"}},{name:"yrTerm3",prices:{USD:"6604"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.296"}}]}]},{type:"hiCPUResI",sizes:[{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"429"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.036"}},{name:"yrTerm3",prices:{USD:"672"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.029"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1716"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.144"}},{name:"yrTerm3",prices:{USD:"2688"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.116"}}]}]},{type:"clusterGPUResI",sizes:[{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"N/A"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"N/A"}},{name:"yrTerm3",prices:{USD:"N/A"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"N/A"}}]}]}]},{region:"us-west-2",instanceTypes:[{type:"stdResI",sizes:[{size:"sm",valueColumns:[{name:"yrTerm1",prices:{USD:"169"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.014"}},{name:"yrTerm3",prices:{USD:"257"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.012"}}]},{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"338"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.028"}},{name:"yrTerm3",prices:{USD:"514"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.024"}}]},{size:"lg",valueColumns:[{name:"yrTerm1",prices:{USD:"676"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.056"}},{name:"yrTerm3",prices:{USD:"1028"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.048"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1352"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.112"}},{name:"yrTerm3",prices:{USD:"2056"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.096"}}]}]},{type:"secgenstdResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1489"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.124"}},{name:"yrTerm3",prices:{USD:"2280"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.105"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"2978"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.248"}},{name:"yrTerm3",prices:{USD:"4560"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.21"}}]}]},{type:"uResI",sizes:[{size:"u",valueColumns:[{name:"yrTerm1",prices:{USD:"62"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.005"}},{name:"yrTerm3",prices:{USD:"100"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.005"}}]}]},{type:"hiMemResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1088"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.09"}},{name:"yrTerm3",prices:{USD:"1651"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.074"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"2176"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.18"}},{name:"yrTerm3",prices:{USD:"3302"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.148"}}]},{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"4352"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.36"}},{name:"yrTerm3",prices:{USD:"6604"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.296"}}]}]},{type:"hiCPUResI",sizes:[{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"429"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.036"}},{name:"yrTerm3",prices:{USD:"672"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.029"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1716"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.144"}},{name:"yrTerm3",prices:{USD:"2688"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.116"}}]}]},{type:"clusterGPUResI",sizes:[{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"N/A"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"N/A"}},{name:"yrTerm3",prices:{USD:"N/A"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"N/A"}}]}]}]},{region:"eu-ireland",instanceTypes:[{type:"stdResI",sizes:[{size:"sm",valueColumns:[{name:"yrTerm1",prices:{USD:"184.21"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.015"}},{name:"yrTerm3",prices:{USD:"280.13"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.013"}}]},{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"368.42"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.031"}},{name:"yrTerm3",prices:{USD:"560.26"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.026"}}]},{size:"lg",valueColumns:[{name:"yrTerm1",prices:{USD:"736.84"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.061"}},{name:"yrTerm3",prices:{USD:"1120.52"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.052"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1473.68"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.122"}},{name:"yrTerm3",prices:{USD:"2241.04"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.105"}}]}]},{type:"secgenstdResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1623.01"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.135"}},{name:"yrTerm3",prices:{USD:"2485.2"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.114"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"3246.02"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.27"}},{name:"yrTerm3",prices:{USD:"4970.4"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.229"}}]}]},{type:"uResI",sizes:[{size:"u",valueColumns:[{name:"yrTerm1",prices:{USD:"67.58"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.005"}},{name:"yrTerm3",prices:{USD:"109"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.005"}}]}]},{type:"hiMemResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1185.92"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.098"}},{name:"yrTerm3",prices:{USD:"1799.59"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.081"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"2371.84"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.196"}},{name:"yrTerm3",prices:{USD:"3599.18"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.161"}}]},{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"4743.68"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.392"}},{name:"yrTerm3",prices:{USD:"7198.36"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.323"}}]}]},{type:"hiCPUResI",sizes:[{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"467.61"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.039"}},{name:"yrTerm3",prices:{USD:"732.48"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.032"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1870.44"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.157"}},{name:"yrTerm3",prices:{USD:"2929.92"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.126"}}]}]},{type:"clusterGPUResI",sizes:[{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"N/A"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"N/A"}},{name:"yrTerm3",prices:{USD:"N/A"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"N/A"}}]}]}]},{region:"apac-tokyo",instanceTypes:[{type:"stdResI",sizes:[{size:"sm",valueColumns:[{name:"yrTerm1",prices:{USD:"211.25"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.018"}},{name:"yrTerm3",prices:{USD:"321.25"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.015"}}]},{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"422.5"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.035"}},{name:"yrTerm3",prices:{USD:"642.5"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.03"}}]},{size:"lg",valueColumns:[{name:"yrTerm1",prices:{USD:"845"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.07"}},{name:"yrTerm3",prices:{USD:"1285"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.06"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1690"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.14"}},{name:"yrTerm3",prices:{USD:"2570"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.12"}}]}]},{type:"secgenstdResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1861.25"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.155"}},{name:"yrTerm3",prices:{USD:"2850"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.131"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"3722.5"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.31"}},{name:"yrTerm3",prices:{USD:"5700"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.263"}}]}]},{type:"uResI",sizes:[{size:"u",valueColumns:[{name:"yrTerm1",prices:{USD:"77.5"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.006"}},{name:"yrTerm3",prices:{USD:"125"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.006"}}]}]},{type:"hiMemResI",sizes:[{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"1360"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.112"}},{name:"yrTerm3",prices:{USD:"2063.75"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.092"}}]},{size:"xxl",valueColumns:[{name:"yrTerm1",prices:{USD:"2720"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.225"}},{name:"yrTerm3",prices:{USD:"4127.5"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.185"}}]},{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"5440"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.45"}},{name:"yrTerm3",prices:{USD:"8255"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.37"}}]}]},{type:"hiCPUResI",sizes:[{size:"med",valueColumns:[{name:"yrTerm1",prices:{USD:"536.25"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.045"}},{name:"yrTerm3",prices:{USD:"840"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.036"}}]},{size:"xl",valueColumns:[{name:"yrTerm1",prices:{USD:"2145"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"0.18"}},{name:"yrTerm3",prices:{USD:"3360"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"0.145"}}]}]},{type:"clusterGPUResI",sizes:[{size:"xxxxl",valueColumns:[{name:"yrTerm1",prices:{USD:"N/A"}},{name:"yrTerm1Hourly",rate:"perhr",prices:{USD:"N/A"}},{name:"yrTerm3",prices:{USD:"N/A"}},{name:"yrTerm3Hourly",rate:"perhr",prices:{USD:"N/A"}}]}]}]}]}});
\ No newline at end of file
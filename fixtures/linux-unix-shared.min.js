@@ -0,0 +1,6 @@
+/*
+ * This file is intended for use only on aws.amazon.com. We do not guarantee its availability or accuracy.
+ *
+ * Copyright 2017 Amazon.com, Inc. or its affiliates. All rights reserved.
+ */
+callback({vers:0.01,config:{currency:"USD",regions:[{region:"us-east-1",instanceTypes:[{type:"t2.nano",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.67"}},{name:"effectiveHourly",prices:{USD:"0.0037"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"16"}},{name:"monthlyStar",prices:{USD:"1.32"}},{name:"effectiveHourly",prices:{USD:"0.0036"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"31"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0036"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1.81"}},{name:"effectiveHourly",prices:{USD:"0.0025"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"32"}},{name:"monthlyStar",prices:{USD:"0.90"}},{name:"effectiveHourly",prices:{USD:"0.0025"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"64"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0024"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.10"}},{name:"effectiveHourly",prices:{USD:"0.0042"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"18"}},{name:"monthlyStar",prices:{USD:"1.54"}},{name:"effectiveHourly",prices:{USD:"0.0042"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"36"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0042"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.28"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"41"}},{name:"monthlyStar",prices:{USD:"1.13"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"81"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]}]}]},{type:"t2.micro",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"5.25"}},{name:"effectiveHourly",prices:{USD:"0.0072"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"31"}},{name:"monthlyStar",prices:{USD:"2.60"}},{name:"effectiveHourly",prices:{USD:"0.0071"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"62"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0070"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.56"}},{name:"effectiveHourly",prices:{USD:"0.0049"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"63"}},{name:"monthlyStar",prices:{USD:"1.76"}},{name:"effectiveHourly",prices:{USD:"0.0048"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"125"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0048"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"6.10"}},{name:"effectiveHourly",prices:{USD:"0.0084"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"36"}},{name:"monthlyStar",prices:{USD:"3.02"}},{name:"effectiveHourly",prices:{USD:"0.0083"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"72"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0082"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"4.49"}},{name:"effectiveHourly",prices:{USD:"0.0061"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"80"}},{name:"monthlyStar",prices:{USD:"2.22"}},{name:"effectiveHourly",prices:{USD:"0.0061"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"158"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0060"}}]}]}]},{type:"t2.small",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"10.41"}},{name:"effectiveHourly",prices:{USD:"0.0143"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"62"}},{name:"monthlyStar",prices:{USD:"5.15"}},{name:"effectiveHourly",prices:{USD:"0.0141"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"122"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0140"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"7.05"}},{name:"effectiveHourly",prices:{USD:"0.0097"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"126"}},{name:"monthlyStar",prices:{USD:"3.49"}},{name:"effectiveHourly",prices:{USD:"0.0096"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"249"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0095"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"12.09"}},{name:"effectiveHourly",prices:{USD:"0.0166"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"72"}},{name:"monthlyStar",prices:{USD:"5.98"}},{name:"effectiveHourly",prices:{USD:"0.0164"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"142"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0162"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"8.90"}},{name:"effectiveHourly",prices:{USD:"0.0122"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"159"}},{name:"monthlyStar",prices:{USD:"4.40"}},{name:"effectiveHourly",prices:{USD:"0.0121"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"314"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0119"}}]}]}]},{type:"t2.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"21.00"}},{name:"effectiveHourly",prices:{USD:"0.0288"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"125"}},{name:"monthlyStar",prices:{USD:"10.40"}},{name:"effectiveHourly",prices:{USD:"0.0285"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"247"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0282"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"14.23"}},{name:"effectiveHourly",prices:{USD:"0.0195"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"254"}},{name:"monthlyStar",prices:{USD:"7.04"}},{name:"effectiveHourly",prices:{USD:"0.0193"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"502"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0191"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"24.39"}},{name:"effectiveHourly",prices:{USD:"0.0334"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"145"}},{name:"monthlyStar",prices:{USD:"12.07"}},{name:"effectiveHourly",prices:{USD:"0.0331"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"287"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0327"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"17.95"}},{name:"effectiveHourly",prices:{USD:"0.0246"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"320"}},{name:"monthlyStar",prices:{USD:"8.89"}},{name:"effectiveHourly",prices:{USD:"0.0243"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"633"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0241"}}]}]}]},{type:"t2.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"42.00"}},{name:"effectiveHourly",prices:{USD:"0.0575"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"249"}},{name:"monthlyStar",prices:{USD:"20.79"}},{name:"effectiveHourly",prices:{USD:"0.0570"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"494"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0564"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"28.45"}},{name:"effectiveHourly",prices:{USD:"0.0390"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"507"}},{name:"monthlyStar",prices:{USD:"14.08"}},{name:"effectiveHourly",prices:{USD:"0.0386"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,004"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0382"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"48.78"}},{name:"effectiveHourly",prices:{USD:"0.0668"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"290"}},{name:"monthlyStar",prices:{USD:"24.14"}},{name:"effectiveHourly",prices:{USD:"0.0661"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"574"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0655"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"35.90"}},{name:"effectiveHourly",prices:{USD:"0.0492"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"640"}},{name:"monthlyStar",prices:{USD:"17.77"}},{name:"effectiveHourly",prices:{USD:"0.0487"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,267"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0482"}}]}]}]},{type:"m4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"45.26"}},{name:"effectiveHourly",prices:{USD:"0.0620"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"269"}},{name:"monthlyStar",prices:{USD:"22.40"}},{name:"effectiveHourly",prices:{USD:"0.0614"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"532"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0608"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"30.66"}},{name:"effectiveHourly",prices:{USD:"0.0420"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"546"}},{name:"monthlyStar",prices:{USD:"15.18"}},{name:"effectiveHourly",prices:{USD:"0.0416"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,082"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0412"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.56"}},{name:"effectiveHourly",prices:{USD:"0.0720"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"312"}},{name:"monthlyStar",prices:{USD:"26.02"}},{name:"effectiveHourly",prices:{USD:"0.0713"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"618"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"38.69"}},{name:"effectiveHourly",prices:{USD:"0.0530"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"689"}},{name:"monthlyStar",prices:{USD:"19.15"}},{name:"effectiveHourly",prices:{USD:"0.0525"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,365"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0519"}}]}]}]},{type:"m4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.52"}},{name:"effectiveHourly",prices:{USD:"0.1240"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"538"}},{name:"monthlyStar",prices:{USD:"44.81"}},{name:"effectiveHourly",prices:{USD:"0.1228"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,065"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1215"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"61.32"}},{name:"effectiveHourly",prices:{USD:"0.0840"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,093"}},{name:"monthlyStar",prices:{USD:"30.35"}},{name:"effectiveHourly",prices:{USD:"0.0832"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,163"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0823"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"105.12"}},{name:"effectiveHourly",prices:{USD:"0.1440"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"624"}},{name:"monthlyStar",prices:{USD:"52.03"}},{name:"effectiveHourly",prices:{USD:"0.1426"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,236"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1411"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"77.38"}},{name:"effectiveHourly",prices:{USD:"0.1060"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,379"}},{name:"monthlyStar",prices:{USD:"38.30"}},{name:"effectiveHourly",prices:{USD:"0.1049"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,730"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1039"}}]}]}]},{type:"m4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"181.04"}},{name:"effectiveHourly",prices:{USD:"0.2480"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,075"}},{name:"monthlyStar",prices:{USD:"89.61"}},{name:"effectiveHourly",prices:{USD:"0.2455"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,129"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2430"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"122.64"}},{name:"effectiveHourly",prices:{USD:"0.1680"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,185"}},{name:"monthlyStar",prices:{USD:"60.71"}},{name:"effectiveHourly",prices:{USD:"0.1663"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"4,327"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1646"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"210.24"}},{name:"effectiveHourly",prices:{USD:"0.2880"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,249"}},{name:"monthlyStar",prices:{USD:"104.07"}},{name:"effectiveHourly",prices:{USD:"0.2851"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,472"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2822"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"154.76"}},{name:"effectiveHourly",prices:{USD:"0.2120"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,758"}},{name:"monthlyStar",prices:{USD:"76.61"}},{name:"effectiveHourly",prices:{USD:"0.2099"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,460"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2078"}}]}]}]},{type:"m4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"362.08"}},{name:"effectiveHourly",prices:{USD:"0.4960"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,151"}},{name:"monthlyStar",prices:{USD:"179.23"}},{name:"effectiveHourly",prices:{USD:"0.4910"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,258"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4861"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"245.28"}},{name:"effectiveHourly",prices:{USD:"0.3360"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,371"}},{name:"monthlyStar",prices:{USD:"121.41"}},{name:"effectiveHourly",prices:{USD:"0.3326"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"8,653"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3293"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"420.48"}},{name:"effectiveHourly",prices:{USD:"0.5760"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,498"}},{name:"monthlyStar",prices:{USD:"208.14"}},{name:"effectiveHourly",prices:{USD:"0.5702"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,945"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5645"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"309.52"}},{name:"effectiveHourly",prices:{USD:"0.4240"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,516"}},{name:"monthlyStar",prices:{USD:"153.21"}},{name:"effectiveHourly",prices:{USD:"0.4198"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,920"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4155"}}]}]}]},{type:"m4.10xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"905.20"}},{name:"effectiveHourly",prices:{USD:"1.2400"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"5,377"}},{name:"monthlyStar",prices:{USD:"448.07"}},{name:"effectiveHourly",prices:{USD:"1.2276"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"10,645"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.2152"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"613.20"}},{name:"effectiveHourly",prices:{USD:"0.8400"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"10,927"}},{name:"monthlyStar",prices:{USD:"303.53"}},{name:"effectiveHourly",prices:{USD:"0.8316"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"21,634"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.8232"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,051.20"}},{name:"effectiveHourly",prices:{USD:"1.4400"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"6,244"}},{name:"monthlyStar",prices:{USD:"520.34"}},{name:"effectiveHourly",prices:{USD:"1.4256"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"12,362"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.4112"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"773.80"}},{name:"effectiveHourly",prices:{USD:"1.0600"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"13,789"}},{name:"monthlyStar",prices:{USD:"383.03"}},{name:"effectiveHourly",prices:{USD:"1.0494"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"27,300"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.0388"}}]}]}]},{type:"m4.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,448.32"}},{name:"effectiveHourly",prices:{USD:"1.9840"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"8,603"}},{name:"monthlyStar",prices:{USD:"716.92"}},{name:"effectiveHourly",prices:{USD:"1.9642"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"17,032"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.9443"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"981.12"}},{name:"effectiveHourly",prices:{USD:"1.3440"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"17,484"}},{name:"monthlyStar",prices:{USD:"485.65"}},{name:"effectiveHourly",prices:{USD:"1.3306"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"34,614"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.3171"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,681.92"}},{name:"effectiveHourly",prices:{USD:"2.3040"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"9,991"}},{name:"monthlyStar",prices:{USD:"832.55"}},{name:"effectiveHourly",prices:{USD:"2.2810"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"19,779"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.2579"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,238.08"}},{name:"effectiveHourly",prices:{USD:"1.6960"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"22,063"}},{name:"monthlyStar",prices:{USD:"612.85"}},{name:"effectiveHourly",prices:{USD:"1.6790"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"43,679"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.6621"}}]}]}]},{type:"m3.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"30.32"}},{name:"effectiveHourly",prices:{USD:"0.0415"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"180"}},{name:"monthlyStar",prices:{USD:"15.01"}},{name:"effectiveHourly",prices:{USD:"0.0411"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"357"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0407"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"20.54"}},{name:"effectiveHourly",prices:{USD:"0.0281"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"366"}},{name:"monthlyStar",prices:{USD:"10.17"}},{name:"effectiveHourly",prices:{USD:"0.0279"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"725"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0276"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"35.22"}},{name:"effectiveHourly",prices:{USD:"0.0482"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"209"}},{name:"monthlyStar",prices:{USD:"17.43"}},{name:"effectiveHourly",prices:{USD:"0.0478"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"414"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0473"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"25.92"}},{name:"effectiveHourly",prices:{USD:"0.0355"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"462"}},{name:"monthlyStar",prices:{USD:"12.83"}},{name:"effectiveHourly",prices:{USD:"0.0352"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"915"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0348"}}]}]}]},{type:"m3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"60.20"}},{name:"effectiveHourly",prices:{USD:"0.0825"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"358"}},{name:"monthlyStar",prices:{USD:"29.80"}},{name:"effectiveHourly",prices:{USD:"0.0816"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"708"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0808"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"40.78"}},{name:"effectiveHourly",prices:{USD:"0.0559"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"727"}},{name:"monthlyStar",prices:{USD:"20.19"}},{name:"effectiveHourly",prices:{USD:"0.0553"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,439"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0547"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"69.90"}},{name:"effectiveHourly",prices:{USD:"0.0958"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"415"}},{name:"monthlyStar",prices:{USD:"34.60"}},{name:"effectiveHourly",prices:{USD:"0.0948"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"822"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0938"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"51.46"}},{name:"effectiveHourly",prices:{USD:"0.0705"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"917"}},{name:"monthlyStar",prices:{USD:"25.47"}},{name:"effectiveHourly",prices:{USD:"0.0698"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,815"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0691"}}]}]}]},{type:"c4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"45.26"}},{name:"effectiveHourly",prices:{USD:"0.0620"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"269"}},{name:"monthlyStar",prices:{USD:"22.40"}},{name:"effectiveHourly",prices:{USD:"0.0614"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"532"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0608"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"30.66"}},{name:"effectiveHourly",prices:{USD:"0.0420"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"546"}},{name:"monthlyStar",prices:{USD:"15.18"}},{name:"effectiveHourly",prices:{USD:"0.0416"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,082"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0412"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.56"}},{name:"effectiveHourly",prices:{USD:"0.0720"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"312"}},{name:"monthlyStar",prices:{USD:"26.02"}},{name:"effectiveHourly",prices:{USD:"0.0713"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"618"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"38.69"}},{name:"effectiveHourly",prices:{USD:"0.0530"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"689"}},{name:"monthlyStar",prices:{USD:"19.15"}},{name:"effectiveHourly",prices:{USD:"0.0525"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,365"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0519"}}]}]}]},{type:"c4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.07"}},{name:"effectiveHourly",prices:{USD:"0.1234"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"535"}},{name:"monthlyStar",prices:{USD:"44.58"}},{name:"effectiveHourly",prices:{USD:"0.1221"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,059"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1209"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"61.01"}},{name:"effectiveHourly",prices:{USD:"0.0836"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,087"}},{name:"monthlyStar",prices:{USD:"30.20"}},{name:"effectiveHourly",prices:{USD:"0.0827"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,153"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0819"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"104.59"}},{name:"effectiveHourly",prices:{USD:"0.1433"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"621"}},{name:"monthlyStar",prices:{USD:"51.77"}},{name:"effectiveHourly",prices:{USD:"0.1418"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,230"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1404"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"76.99"}},{name:"effectiveHourly",prices:{USD:"0.1055"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,372"}},{name:"monthlyStar",prices:{USD:"38.11"}},{name:"effectiveHourly",prices:{USD:"0.1044"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,716"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1034"}}]}]}]},{type:"c4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"180.13"}},{name:"effectiveHourly",prices:{USD:"0.2468"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,070"}},{name:"monthlyStar",prices:{USD:"89.17"}},{name:"effectiveHourly",prices:{USD:"0.2443"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,118"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2418"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"122.03"}},{name:"effectiveHourly",prices:{USD:"0.1672"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,175"}},{name:"monthlyStar",prices:{USD:"60.40"}},{name:"effectiveHourly",prices:{USD:"0.1655"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"4,305"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1638"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"209.19"}},{name:"effectiveHourly",prices:{USD:"0.2866"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,243"}},{name:"monthlyStar",prices:{USD:"103.55"}},{name:"effectiveHourly",prices:{USD:"0.2837"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,460"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2808"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"153.99"}},{name:"effectiveHourly",prices:{USD:"0.2109"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,744"}},{name:"monthlyStar",prices:{USD:"76.22"}},{name:"effectiveHourly",prices:{USD:"0.2088"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,433"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2067"}}]}]}]},{type:"c4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"360.27"}},{name:"effectiveHourly",prices:{USD:"0.4935"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,140"}},{name:"monthlyStar",prices:{USD:"178.33"}},{name:"effectiveHourly",prices:{USD:"0.4886"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,237"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4836"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"244.05"}},{name:"effectiveHourly",prices:{USD:"0.3343"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,349"}},{name:"monthlyStar",prices:{USD:"120.81"}},{name:"effectiveHourly",prices:{USD:"0.3310"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"8,610"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3276"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"418.38"}},{name:"effectiveHourly",prices:{USD:"0.5731"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,485"}},{name:"monthlyStar",prices:{USD:"207.10"}},{name:"effectiveHourly",prices:{USD:"0.5674"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,920"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5617"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"307.97"}},{name:"effectiveHourly",prices:{USD:"0.4219"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,488"}},{name:"monthlyStar",prices:{USD:"152.45"}},{name:"effectiveHourly",prices:{USD:"0.4177"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,865"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4134"}}]}]}]},{type:"c4.8xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"720.09"}},{name:"effectiveHourly",prices:{USD:"0.9864"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,277"}},{name:"monthlyStar",prices:{USD:"356.44"}},{name:"effectiveHourly",prices:{USD:"0.9766"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"8,468"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.9667"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"487.80"}},{name:"effectiveHourly",prices:{USD:"0.6682"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"8,693"}},{name:"monthlyStar",prices:{USD:"241.46"}},{name:"effectiveHourly",prices:{USD:"0.6615"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"17,210"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6549"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"836.23"}},{name:"effectiveHourly",prices:{USD:"1.1455"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,967"}},{name:"monthlyStar",prices:{USD:"413.93"}},{name:"effectiveHourly",prices:{USD:"1.1341"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"9,834"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.1226"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"615.56"}},{name:"effectiveHourly",prices:{USD:"0.8432"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,969"}},{name:"monthlyStar",prices:{USD:"304.70"}},{name:"effectiveHourly",prices:{USD:"0.8348"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"21,717"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.8264"}}]}]}]},{type:"r4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"60.20"}},{name:"effectiveHourly",prices:{USD:"0.0825"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"358"}},{name:"monthlyStar",prices:{USD:"29.80"}},{name:"effectiveHourly",prices:{USD:"0.0816"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"708"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0808"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"40.78"}},{name:"effectiveHourly",prices:{USD:"0.0559"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"727"}},{name:"monthlyStar",prices:{USD:"20.19"}},{name:"effectiveHourly",prices:{USD:"0.0553"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,439"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0547"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"69.90"}},{name:"effectiveHourly",prices:{USD:"0.0958"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"415"}},{name:"monthlyStar",prices:{USD:"34.60"}},{name:"effectiveHourly",prices:{USD:"0.0948"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"822"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0938"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"51.46"}},{name:"effectiveHourly",prices:{USD:"0.0705"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"917"}},{name:"monthlyStar",prices:{USD:"25.47"}},{name:"effectiveHourly",prices:{USD:"0.0698"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,815"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0691"}}]}]}]},{type:"r4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"120.39"}},{name:"effectiveHourly",prices:{USD:"0.1649"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"715"}},{name:"monthlyStar",prices:{USD:"59.59"}},{name:"effectiveHourly",prices:{USD:"0.1633"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,416"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1616"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"81.56"}},{name:"effectiveHourly",prices:{USD:"0.1117"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,453"}},{name:"monthlyStar",prices:{USD:"40.37"}},{name:"effectiveHourly",prices:{USD:"0.1106"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,877"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1095"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"139.81"}},{name:"effectiveHourly",prices:{USD:"0.1915"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"830"}},{name:"monthlyStar",prices:{USD:"69.21"}},{name:"effectiveHourly",prices:{USD:"0.1896"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,644"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1877"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"102.92"}},{name:"effectiveHourly",prices:{USD:"0.1410"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,834"}},{name:"monthlyStar",prices:{USD:"50.94"}},{name:"effectiveHourly",prices:{USD:"0.1396"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,631"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1382"}}]}]}]},{type:"r4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"240.78"}},{name:"effectiveHourly",prices:{USD:"0.3298"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,430"}},{name:"monthlyStar",prices:{USD:"119.19"}},{name:"effectiveHourly",prices:{USD:"0.3265"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,832"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3232"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"163.11"}},{name:"effectiveHourly",prices:{USD:"0.2234"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,907"}},{name:"monthlyStar",prices:{USD:"80.74"}},{name:"effectiveHourly",prices:{USD:"0.2212"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"5,755"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2190"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"279.62"}},{name:"effectiveHourly",prices:{USD:"0.3830"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,661"}},{name:"monthlyStar",prices:{USD:"138.41"}},{name:"effectiveHourly",prices:{USD:"0.3792"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,288"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3754"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"205.83"}},{name:"effectiveHourly",prices:{USD:"0.2820"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,668"}},{name:"monthlyStar",prices:{USD:"101.89"}},{name:"effectiveHourly",prices:{USD:"0.2791"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,262"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2763"}}]}]}]},{type:"x1.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,018.39"}},{name:"effectiveHourly",prices:{USD:"4.1348"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"17,929"}},{name:"monthlyStar",prices:{USD:"1,494.10"}},{name:"effectiveHourly",prices:{USD:"4.0934"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"35,496"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"4.0521"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,044.72"}},{name:"effectiveHourly",prices:{USD:"2.8010"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"36,437"}},{name:"monthlyStar",prices:{USD:"1,012.13"}},{name:"effectiveHourly",prices:{USD:"2.7730"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"72,138"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.7450"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,505.23"}},{name:"effectiveHourly",prices:{USD:"4.8017"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"20,821"}},{name:"monthlyStar",prices:{USD:"1,735.09"}},{name:"effectiveHourly",prices:{USD:"4.7537"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"41,221"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"4.7056"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,580.24"}},{name:"effectiveHourly",prices:{USD:"3.5346"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"45,980"}},{name:"monthlyStar",prices:{USD:"1,277.22"}},{name:"effectiveHourly",prices:{USD:"3.4992"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"91,031"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"3.4639"}}]}]}]},{type:"i3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"70.61"}},{name:"effectiveHourly",prices:{USD:"0.0967"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"419"}},{name:"monthlyStar",prices:{USD:"34.95"}},{name:"effectiveHourly",prices:{USD:"0.0958"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"830"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0948"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"47.83"}},{name:"effectiveHourly",prices:{USD:"0.0655"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"852"}},{name:"monthlyStar",prices:{USD:"23.68"}},{name:"effectiveHourly",prices:{USD:"0.0649"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,687"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0642"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"81.99"}},{name:"effectiveHourly",prices:{USD:"0.1123"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"487"}},{name:"monthlyStar",prices:{USD:"40.59"}},{name:"effectiveHourly",prices:{USD:"0.1112"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"964"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1101"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"60.36"}},{name:"effectiveHourly",prices:{USD:"0.0827"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,076"}},{name:"monthlyStar",prices:{USD:"29.88"}},{name:"effectiveHourly",prices:{USD:"0.0819"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,129"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0810"}}]}]}]},{type:"d2.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"312.29"}},{name:"effectiveHourly",prices:{USD:"0.4278"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,855"}},{name:"monthlyStar",prices:{USD:"154.59"}},{name:"effectiveHourly",prices:{USD:"0.4235"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"3,673"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4192"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"211.55"}},{name:"effectiveHourly",prices:{USD:"0.2898"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"3,770"}},{name:"monthlyStar",prices:{USD:"104.72"}},{name:"effectiveHourly",prices:{USD:"0.2869"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"7,464"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2840"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"362.66"}},{name:"effectiveHourly",prices:{USD:"0.4968"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,154"}},{name:"monthlyStar",prices:{USD:"179.52"}},{name:"effectiveHourly",prices:{USD:"0.4918"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,265"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4869"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"266.96"}},{name:"effectiveHourly",prices:{USD:"0.3657"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"4,757"}},{name:"monthlyStar",prices:{USD:"132.15"}},{name:"effectiveHourly",prices:{USD:"0.3620"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"9,418"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3584"}}]}]}]}]},{region:"us-west-2",instanceTypes:[{type:"t2.nano",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.67"}},{name:"effectiveHourly",prices:{USD:"0.0037"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"16"}},{name:"monthlyStar",prices:{USD:"1.32"}},{name:"effectiveHourly",prices:{USD:"0.0036"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"31"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0036"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1.81"}},{name:"effectiveHourly",prices:{USD:"0.0025"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"32"}},{name:"monthlyStar",prices:{USD:"0.90"}},{name:"effectiveHourly",prices:{USD:"0.0025"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"64"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0024"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.10"}},{name:"effectiveHourly",prices:{USD:"0.0042"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"18"}},{name:"monthlyStar",prices:{USD:"1.54"}},{name:"effectiveHourly",prices:{USD:"0.0042"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"36"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0042"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0059"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.28"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"41"}},{name:"monthlyStar",prices:{USD:"1.13"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"81"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]}]}]},{type:"t2.micro",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"5.25"}},{name:"effectiveHourly",prices:{USD:"0.0072"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"31"}},{name:"monthlyStar",prices:{USD:"2.60"}},{name:"effectiveHourly",prices:{USD:"0.0071"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"62"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0070"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.56"}},{name:"effectiveHourly",prices:{USD:"0.0049"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"63"}},{name:"monthlyStar",prices:{USD:"1.76"}},{name:"effectiveHourly",prices:{USD:"0.0048"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"125"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0048"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"6.10"}},{name:"effectiveHourly",prices:{USD:"0.0084"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"36"}},{name:"monthlyStar",prices:{USD:"3.02"}},{name:"effectiveHourly",prices:{USD:"0.0083"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"72"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0082"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0116"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"4.49"}},{name:"effectiveHourly",prices:{USD:"0.0061"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"80"}},{name:"monthlyStar",prices:{USD:"2.22"}},{name:"effectiveHourly",prices:{USD:"0.0061"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"158"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0060"}}]}]}]},{type:"t2.small",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"10.41"}},{name:"effectiveHourly",prices:{USD:"0.0143"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"62"}},{name:"monthlyStar",prices:{USD:"5.15"}},{name:"effectiveHourly",prices:{USD:"0.0141"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"122"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0140"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"7.05"}},{name:"effectiveHourly",prices:{USD:"0.0097"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"126"}},{name:"monthlyStar",prices:{USD:"3.49"}},{name:"effectiveHourly",prices:{USD:"0.0096"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"249"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0095"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"12.09"}},{name:"effectiveHourly",prices:{USD:"0.0166"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"72"}},{name:"monthlyStar",prices:{USD:"5.98"}},{name:"effectiveHourly",prices:{USD:"0.0164"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"142"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0162"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.023"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"8.90"}},{name:"effectiveHourly",prices:{USD:"0.0122"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"159"}},{name:"monthlyStar",prices:{USD:"4.40"}},{name:"effectiveHourly",prices:{USD:"0.0121"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"314"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0119"}}]}]}]},{type:"t2.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"21.00"}},{name:"effectiveHourly",prices:{USD:"0.0288"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"125"}},{name:"monthlyStar",prices:{USD:"10.40"}},{name:"effectiveHourly",prices:{USD:"0.0285"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"247"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0282"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"14.23"}},{name:"effectiveHourly",prices:{USD:"0.0195"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"254"}},{name:"monthlyStar",prices:{USD:"7.04"}},{name:"effectiveHourly",prices:{USD:"0.0193"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"502"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0191"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"24.39"}},{name:"effectiveHourly",prices:{USD:"0.0334"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"145"}},{name:"monthlyStar",prices:{USD:"12.07"}},{name:"effectiveHourly",prices:{USD:"0.0331"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"287"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0327"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0464"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"17.95"}},{name:"effectiveHourly",prices:{USD:"0.0246"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"320"}},{name:"monthlyStar",prices:{USD:"8.89"}},{name:"effectiveHourly",prices:{USD:"0.0243"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"633"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0241"}}]}]}]},{type:"t2.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"42.00"}},{name:"effectiveHourly",prices:{USD:"0.0575"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"249"}},{name:"monthlyStar",prices:{USD:"20.79"}},{name:"effectiveHourly",prices:{USD:"0.0570"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"494"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0564"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"28.45"}},{name:"effectiveHourly",prices:{USD:"0.0390"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"507"}},{name:"monthlyStar",prices:{USD:"14.08"}},{name:"effectiveHourly",prices:{USD:"0.0386"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,004"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0382"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"48.78"}},{name:"effectiveHourly",prices:{USD:"0.0668"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"290"}},{name:"monthlyStar",prices:{USD:"24.14"}},{name:"effectiveHourly",prices:{USD:"0.0661"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"574"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0655"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0928"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"35.90"}},{name:"effectiveHourly",prices:{USD:"0.0492"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"640"}},{name:"monthlyStar",prices:{USD:"17.77"}},{name:"effectiveHourly",prices:{USD:"0.0487"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,267"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0482"}}]}]}]},{type:"m4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"45.26"}},{name:"effectiveHourly",prices:{USD:"0.0620"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"269"}},{name:"monthlyStar",prices:{USD:"22.40"}},{name:"effectiveHourly",prices:{USD:"0.0614"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"532"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0608"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"30.66"}},{name:"effectiveHourly",prices:{USD:"0.0420"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"546"}},{name:"monthlyStar",prices:{USD:"15.18"}},{name:"effectiveHourly",prices:{USD:"0.0416"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,082"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0412"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.56"}},{name:"effectiveHourly",prices:{USD:"0.0720"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"312"}},{name:"monthlyStar",prices:{USD:"26.02"}},{name:"effectiveHourly",prices:{USD:"0.0713"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"618"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"38.69"}},{name:"effectiveHourly",prices:{USD:"0.0530"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"689"}},{name:"monthlyStar",prices:{USD:"19.15"}},{name:"effectiveHourly",prices:{USD:"0.0525"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,365"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0519"}}]}]}]},{type:"m4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.52"}},{name:"effectiveHourly",prices:{USD:"0.1240"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"538"}},{name:"monthlyStar",prices:{USD:"44.81"}},{name:"effectiveHourly",prices:{USD:"0.1228"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,065"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1215"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"61.32"}},{name:"effectiveHourly",prices:{USD:"0.0840"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,093"}},{name:"monthlyStar",prices:{USD:"30.35"}},{name:"effectiveHourly",prices:{USD:"0.0832"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,163"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0823"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"105.12"}},{name:"effectiveHourly",prices:{USD:"0.1440"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"624"}},{name:"monthlyStar",prices:{USD:"52.03"}},{name:"effectiveHourly",prices:{USD:"0.1426"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,236"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1411"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"77.38"}},{name:"effectiveHourly",prices:{USD:"0.1060"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,379"}},{name:"monthlyStar",prices:{USD:"38.30"}},{name:"effectiveHourly",prices:{USD:"0.1049"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,730"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1039"}}]}]}]},{type:"m4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"181.04"}},{name:"effectiveHourly",prices:{USD:"0.2480"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,075"}},{name:"monthlyStar",prices:{USD:"89.61"}},{name:"effectiveHourly",prices:{USD:"0.2455"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,129"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2430"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"122.64"}},{name:"effectiveHourly",prices:{USD:"0.1680"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,185"}},{name:"monthlyStar",prices:{USD:"60.71"}},{name:"effectiveHourly",prices:{USD:"0.1663"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"4,327"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1646"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"210.24"}},{name:"effectiveHourly",prices:{USD:"0.2880"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,249"}},{name:"monthlyStar",prices:{USD:"104.07"}},{name:"effectiveHourly",prices:{USD:"0.2851"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,472"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2822"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"154.76"}},{name:"effectiveHourly",prices:{USD:"0.2120"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,758"}},{name:"monthlyStar",prices:{USD:"76.61"}},{name:"effectiveHourly",prices:{USD:"0.2099"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,460"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2078"}}]}]}]},{type:"m4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"362.08"}},{name:"effectiveHourly",prices:{USD:"0.4960"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,151"}},{name:"monthlyStar",prices:{USD:"179.23"}},{name:"effectiveHourly",prices:{USD:"0.4910"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,258"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4861"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"245.28"}},{name:"effectiveHourly",prices:{USD:"0.3360"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,371"}},{name:"monthlyStar",prices:{USD:"121.41"}},{name:"effectiveHourly",prices:{USD:"0.3326"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"8,653"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3293"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"420.48"}},{name:"effectiveHourly",prices:{USD:"0.5760"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,498"}},{name:"monthlyStar",prices:{USD:"208.14"}},{name:"effectiveHourly",prices:{USD:"0.5702"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,945"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5645"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"309.52"}},{name:"effectiveHourly",prices:{USD:"0.4240"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,516"}},{name:"monthlyStar",prices:{USD:"153.21"}},{name:"effectiveHourly",prices:{USD:"0.4198"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,920"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4155"}}]}]}]},{type:"m4.10xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"905.20"}},{name:"effectiveHourly",prices:{USD:"1.2400"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"5,377"}},{name:"monthlyStar",prices:{USD:"448.07"}},{name:"effectiveHourly",prices:{USD:"1.2276"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"10,645"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.2152"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"613.20"}},{name:"effectiveHourly",prices:{USD:"0.8400"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"10,927"}},{name:"monthlyStar",prices:{USD:"303.53"}},{name:"effectiveHourly",prices:{USD:"0.8316"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"21,634"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.8232"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,051.20"}},{name:"effectiveHourly",prices:{USD:"1.4400"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"6,244"}},{name:"monthlyStar",prices:{USD:"520.34"}},{name:"effectiveHourly",prices:{USD:"1.4256"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"12,362"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.4112"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.000"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"773.80"}},{name:"effectiveHourly",prices:{USD:"1.0600"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"13,789"}},{name:"monthlyStar",prices:{USD:"383.03"}},{name:"effectiveHourly",prices:{USD:"1.0494"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"27,300"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.0388"}}]}]}]},{type:"m4.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,448.32"}},{name:"effectiveHourly",prices:{USD:"1.9840"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"8,603"}},{name:"monthlyStar",prices:{USD:"716.92"}},{name:"effectiveHourly",prices:{USD:"1.9642"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"17,032"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.9443"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"981.12"}},{name:"effectiveHourly",prices:{USD:"1.3440"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"17,484"}},{name:"monthlyStar",prices:{USD:"485.65"}},{name:"effectiveHourly",prices:{USD:"1.3306"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"34,614"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.3171"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,681.92"}},{name:"effectiveHourly",prices:{USD:"2.3040"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"9,991"}},{name:"monthlyStar",prices:{USD:"832.55"}},{name:"effectiveHourly",prices:{USD:"2.2810"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"19,779"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.2579"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,238.08"}},{name:"effectiveHourly",prices:{USD:"1.6960"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"22,063"}},{name:"monthlyStar",prices:{USD:"612.85"}},{name:"effectiveHourly",prices:{USD:"1.6790"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"43,679"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.6621"}}]}]}]},{type:"m3.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"30.32"}},{name:"effectiveHourly",prices:{USD:"0.0415"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"180"}},{name:"monthlyStar",prices:{USD:"15.01"}},{name:"effectiveHourly",prices:{USD:"0.0411"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"357"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0407"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"20.54"}},{name:"effectiveHourly",prices:{USD:"0.0281"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"366"}},{name:"monthlyStar",prices:{USD:"10.17"}},{name:"effectiveHourly",prices:{USD:"0.0279"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"725"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0276"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"35.22"}},{name:"effectiveHourly",prices:{USD:"0.0482"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"209"}},{name:"monthlyStar",prices:{USD:"17.43"}},{name:"effectiveHourly",prices:{USD:"0.0478"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"414"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0473"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.067"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"25.92"}},{name:"effectiveHourly",prices:{USD:"0.0355"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"462"}},{name:"monthlyStar",prices:{USD:"12.83"}},{name:"effectiveHourly",prices:{USD:"0.0352"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"915"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0348"}}]}]}]},{type:"m3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"60.20"}},{name:"effectiveHourly",prices:{USD:"0.0825"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"358"}},{name:"monthlyStar",prices:{USD:"29.80"}},{name:"effectiveHourly",prices:{USD:"0.0816"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"708"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0808"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"40.78"}},{name:"effectiveHourly",prices:{USD:"0.0559"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"727"}},{name:"monthlyStar",prices:{USD:"20.19"}},{name:"effectiveHourly",prices:{USD:"0.0553"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,439"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0547"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"69.90"}},{name:"effectiveHourly",prices:{USD:"0.0958"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"415"}},{name:"monthlyStar",prices:{USD:"34.60"}},{name:"effectiveHourly",prices:{USD:"0.0948"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"822"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0938"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"51.46"}},{name:"effectiveHourly",prices:{USD:"0.0705"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"917"}},{name:"monthlyStar",prices:{USD:"25.47"}},{name:"effectiveHourly",prices:{USD:"0.0698"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,815"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0691"}}]}]}]},{type:"c4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"45.26"}},{name:"effectiveHourly",prices:{USD:"0.0620"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"269"}},{name:"monthlyStar",prices:{USD:"22.40"}},{name:"effectiveHourly",prices:{USD:"0.0614"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"532"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0608"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"30.66"}},{name:"effectiveHourly",prices:{USD:"0.0420"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"546"}},{name:"monthlyStar",prices:{USD:"15.18"}},{name:"effectiveHourly",prices:{USD:"0.0416"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,082"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0412"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.56"}},{name:"effectiveHourly",prices:{USD:"0.0720"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"312"}},{name:"monthlyStar",prices:{USD:"26.02"}},{name:"effectiveHourly",prices:{USD:"0.0713"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"618"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"38.69"}},{name:"effectiveHourly",prices:{USD:"0.0530"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"689"}},{name:"monthlyStar",prices:{USD:"19.15"}},{name:"effectiveHourly",prices:{USD:"0.0525"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,365"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0519"}}]}]}]},{type:"c4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.07"}},{name:"effectiveHourly",prices:{USD:"0.1234"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"535"}},{name:"monthlyStar",prices:{USD:"44.58"}},{name:"effectiveHourly",prices:{USD:"0.1221"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,059"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1209"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"61.01"}},{name:"effectiveHourly",prices:{USD:"0.0836"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,087"}},{name:"monthlyStar",prices:{USD:"30.20"}},{name:"effectiveHourly",prices:{USD:"0.0827"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,153"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0819"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"104.59"}},{name:"effectiveHourly",prices:{USD:"0.1433"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"621"}},{name:"monthlyStar",prices:{USD:"51.77"}},{name:"effectiveHourly",prices:{USD:"0.1418"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,230"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1404"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.199"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"76.99"}},{name:"effectiveHourly",prices:{USD:"0.1055"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,372"}},{name:"monthlyStar",prices:{USD:"38.11"}},{name:"effectiveHourly",prices:{USD:"0.1044"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,716"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1034"}}]}]}]},{type:"c4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"180.13"}},{name:"effectiveHourly",prices:{USD:"0.2468"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,070"}},{name:"monthlyStar",prices:{USD:"89.17"}},{name:"effectiveHourly",prices:{USD:"0.2443"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,118"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2418"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"122.03"}},{name:"effectiveHourly",prices:{USD:"0.1672"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,175"}},{name:"monthlyStar",prices:{USD:"60.40"}},{name:"effectiveHourly",prices:{USD:"0.1655"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"4,305"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1638"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"209.19"}},{name:"effectiveHourly",prices:{USD:"0.2866"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,243"}},{name:"monthlyStar",prices:{USD:"103.55"}},{name:"effectiveHourly",prices:{USD:"0.2837"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,460"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2808"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.398"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"153.99"}},{name:"effectiveHourly",prices:{USD:"0.2109"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,744"}},{name:"monthlyStar",prices:{USD:"76.22"}},{name:"effectiveHourly",prices:{USD:"0.2088"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,433"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2067"}}]}]}]},{type:"c4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"360.27"}},{name:"effectiveHourly",prices:{USD:"0.4935"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,140"}},{name:"monthlyStar",prices:{USD:"178.33"}},{name:"effectiveHourly",prices:{USD:"0.4886"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,237"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4836"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"244.05"}},{name:"effectiveHourly",prices:{USD:"0.3343"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,349"}},{name:"monthlyStar",prices:{USD:"120.81"}},{name:"effectiveHourly",prices:{USD:"0.3310"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"8,610"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3276"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"418.38"}},{name:"effectiveHourly",prices:{USD:"0.5731"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,485"}},{name:"monthlyStar",prices:{USD:"207.10"}},{name:"effectiveHourly",prices:{USD:"0.5674"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,920"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5617"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.796"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"307.97"}},{name:"effectiveHourly",prices:{USD:"0.4219"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,488"}},{name:"monthlyStar",prices:{USD:"152.45"}},{name:"effectiveHourly",prices:{USD:"0.4177"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,865"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4134"}}]}]}]},{type:"c4.8xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"720.09"}},{name:"effectiveHourly",prices:{USD:"0.9864"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,277"}},{name:"monthlyStar",prices:{USD:"356.44"}},{name:"effectiveHourly",prices:{USD:"0.9766"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"8,468"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.9667"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"487.80"}},{name:"effectiveHourly",prices:{USD:"0.6682"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"8,693"}},{name:"monthlyStar",prices:{USD:"241.46"}},{name:"effectiveHourly",prices:{USD:"0.6615"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"17,210"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6549"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"836.23"}},{name:"effectiveHourly",prices:{USD:"1.1455"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,967"}},{name:"monthlyStar",prices:{USD:"413.93"}},{name:"effectiveHourly",prices:{USD:"1.1341"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"9,834"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.1226"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.591"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"615.56"}},{name:"effectiveHourly",prices:{USD:"0.8432"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,969"}},{name:"monthlyStar",prices:{USD:"304.70"}},{name:"effectiveHourly",prices:{USD:"0.8348"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"21,717"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.8264"}}]}]}]},{type:"r4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"60.20"}},{name:"effectiveHourly",prices:{USD:"0.0825"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"358"}},{name:"monthlyStar",prices:{USD:"29.80"}},{name:"effectiveHourly",prices:{USD:"0.0816"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"708"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0808"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"40.78"}},{name:"effectiveHourly",prices:{USD:"0.0559"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"727"}},{name:"monthlyStar",prices:{USD:"20.19"}},{name:"effectiveHourly",prices:{USD:"0.0553"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,439"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0547"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"69.90"}},{name:"effectiveHourly",prices:{USD:"0.0958"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"415"}},{name:"monthlyStar",prices:{USD:"34.60"}},{name:"effectiveHourly",prices:{USD:"0.0948"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"822"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0938"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.133"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"51.46"}},{name:"effectiveHourly",prices:{USD:"0.0705"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"917"}},{name:"monthlyStar",prices:{USD:"25.47"}},{name:"effectiveHourly",prices:{USD:"0.0698"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,815"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0691"}}]}]}]},{type:"r4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"120.39"}},{name:"effectiveHourly",prices:{USD:"0.1649"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"715"}},{name:"monthlyStar",prices:{USD:"59.59"}},{name:"effectiveHourly",prices:{USD:"0.1633"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,416"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1616"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"81.56"}},{name:"effectiveHourly",prices:{USD:"0.1117"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,453"}},{name:"monthlyStar",prices:{USD:"40.37"}},{name:"effectiveHourly",prices:{USD:"0.1106"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,877"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1095"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"139.81"}},{name:"effectiveHourly",prices:{USD:"0.1915"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"830"}},{name:"monthlyStar",prices:{USD:"69.21"}},{name:"effectiveHourly",prices:{USD:"0.1896"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,644"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1877"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.266"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"102.92"}},{name:"effectiveHourly",prices:{USD:"0.1410"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,834"}},{name:"monthlyStar",prices:{USD:"50.94"}},{name:"effectiveHourly",prices:{USD:"0.1396"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,631"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1382"}}]}]}]},{type:"r4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"240.78"}},{name:"effectiveHourly",prices:{USD:"0.3298"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,430"}},{name:"monthlyStar",prices:{USD:"119.19"}},{name:"effectiveHourly",prices:{USD:"0.3265"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,832"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3232"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"163.11"}},{name:"effectiveHourly",prices:{USD:"0.2234"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,907"}},{name:"monthlyStar",prices:{USD:"80.74"}},{name:"effectiveHourly",prices:{USD:"0.2212"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"5,755"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2190"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"279.62"}},{name:"effectiveHourly",prices:{USD:"0.3830"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,661"}},{name:"monthlyStar",prices:{USD:"138.41"}},{name:"effectiveHourly",prices:{USD:"0.3792"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,288"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3754"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.532"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"205.83"}},{name:"effectiveHourly",prices:{USD:"0.2820"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,668"}},{name:"monthlyStar",prices:{USD:"101.89"}},{name:"effectiveHourly",prices:{USD:"0.2791"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,262"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2763"}}]}]}]},{type:"x1.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,018.39"}},{name:"effectiveHourly",prices:{USD:"4.1348"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"17,929"}},{name:"monthlyStar",prices:{USD:"1,494.10"}},{name:"effectiveHourly",prices:{USD:"4.0934"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"35,496"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"4.0521"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,044.72"}},{name:"effectiveHourly",prices:{USD:"2.8010"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"36,437"}},{name:"monthlyStar",prices:{USD:"1,012.13"}},{name:"effectiveHourly",prices:{USD:"2.7730"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"72,138"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.7450"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,505.23"}},{name:"effectiveHourly",prices:{USD:"4.8017"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"20,821"}},{name:"monthlyStar",prices:{USD:"1,735.09"}},{name:"effectiveHourly",prices:{USD:"4.7537"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"41,221"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"4.7056"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"6.669"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,580.24"}},{name:"effectiveHourly",prices:{USD:"3.5346"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"45,980"}},{name:"monthlyStar",prices:{USD:"1,277.22"}},{name:"effectiveHourly",prices:{USD:"3.4992"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"91,031"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"3.4639"}}]}]}]},{type:"i3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"70.61"}},{name:"effectiveHourly",prices:{USD:"0.0967"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"419"}},{name:"monthlyStar",prices:{USD:"34.95"}},{name:"effectiveHourly",prices:{USD:"0.0958"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"830"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0948"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"47.83"}},{name:"effectiveHourly",prices:{USD:"0.0655"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"852"}},{name:"monthlyStar",prices:{USD:"23.68"}},{name:"effectiveHourly",prices:{USD:"0.0649"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,687"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0642"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"81.99"}},{name:"effectiveHourly",prices:{USD:"0.1123"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"487"}},{name:"monthlyStar",prices:{USD:"40.59"}},{name:"effectiveHourly",prices:{USD:"0.1112"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"964"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1101"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.156"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"60.36"}},{name:"effectiveHourly",prices:{USD:"0.0827"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,076"}},{name:"monthlyStar",prices:{USD:"29.88"}},{name:"effectiveHourly",prices:{USD:"0.0819"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,129"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0810"}}]}]}]},{type:"d2.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"312.29"}},{name:"effectiveHourly",prices:{USD:"0.4278"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,855"}},{name:"monthlyStar",prices:{USD:"154.59"}},{name:"effectiveHourly",prices:{USD:"0.4235"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"3,673"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4192"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"211.55"}},{name:"effectiveHourly",prices:{USD:"0.2898"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"3,770"}},{name:"monthlyStar",prices:{USD:"104.72"}},{name:"effectiveHourly",prices:{USD:"0.2869"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"7,464"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2840"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"362.66"}},{name:"effectiveHourly",prices:{USD:"0.4968"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,154"}},{name:"monthlyStar",prices:{USD:"179.52"}},{name:"effectiveHourly",prices:{USD:"0.4918"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,265"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4869"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.69"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"266.96"}},{name:"effectiveHourly",prices:{USD:"0.3657"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"4,757"}},{name:"monthlyStar",prices:{USD:"132.15"}},{name:"effectiveHourly",prices:{USD:"0.3620"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"9,418"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3584"}}]}]}]}]},{region:"eu-west-1",instanceTypes:[{type:"t2.nano",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0065"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.94"}},{name:"effectiveHourly",prices:{USD:"0.0040"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"17"}},{name:"monthlyStar",prices:{USD:"1.45"}},{name:"effectiveHourly",prices:{USD:"0.0040"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"35"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0039"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0065"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1.99"}},{name:"effectiveHourly",prices:{USD:"0.0027"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"35"}},{name:"monthlyStar",prices:{USD:"0.98"}},{name:"effectiveHourly",prices:{USD:"0.0027"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"70"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0027"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0065"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.41"}},{name:"effectiveHourly",prices:{USD:"0.0047"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"20"}},{name:"monthlyStar",prices:{USD:"1.69"}},{name:"effectiveHourly",prices:{USD:"0.0046"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"40"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0046"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0065"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.51"}},{name:"effectiveHourly",prices:{USD:"0.0034"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"45"}},{name:"monthlyStar",prices:{USD:"1.24"}},{name:"effectiveHourly",prices:{USD:"0.0034"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"89"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0034"}}]}]}]},{type:"t2.micro",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"5.78"}},{name:"effectiveHourly",prices:{USD:"0.0079"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"34"}},{name:"monthlyStar",prices:{USD:"2.86"}},{name:"effectiveHourly",prices:{USD:"0.0078"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"68"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0078"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.91"}},{name:"effectiveHourly",prices:{USD:"0.0054"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"70"}},{name:"monthlyStar",prices:{USD:"1.94"}},{name:"effectiveHourly",prices:{USD:"0.0053"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"138"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0053"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"6.71"}},{name:"effectiveHourly",prices:{USD:"0.0092"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"40"}},{name:"monthlyStar",prices:{USD:"3.32"}},{name:"effectiveHourly",prices:{USD:"0.0091"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"79"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0090"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"4.94"}},{name:"effectiveHourly",prices:{USD:"0.0068"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"88"}},{name:"monthlyStar",prices:{USD:"2.44"}},{name:"effectiveHourly",prices:{USD:"0.0067"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"174"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0066"}}]}]}]},{type:"t2.small",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0253"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"11.45"}},{name:"effectiveHourly",prices:{USD:"0.0157"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"68"}},{name:"monthlyStar",prices:{USD:"5.67"}},{name:"effectiveHourly",prices:{USD:"0.0155"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"135"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0154"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0253"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"7.76"}},{name:"effectiveHourly",prices:{USD:"0.0106"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"138"}},{name:"monthlyStar",prices:{USD:"3.84"}},{name:"effectiveHourly",prices:{USD:"0.0105"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"274"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0104"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0253"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"13.30"}},{name:"effectiveHourly",prices:{USD:"0.0182"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"79"}},{name:"monthlyStar",prices:{USD:"6.58"}},{name:"effectiveHourly",prices:{USD:"0.0180"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"156"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0179"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0253"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"9.79"}},{name:"effectiveHourly",prices:{USD:"0.0134"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"174"}},{name:"monthlyStar",prices:{USD:"4.85"}},{name:"effectiveHourly",prices:{USD:"0.0133"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"345"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0131"}}]}]}]},{type:"t2.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.051"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"23.10"}},{name:"effectiveHourly",prices:{USD:"0.0316"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"137"}},{name:"monthlyStar",prices:{USD:"11.43"}},{name:"effectiveHourly",prices:{USD:"0.0313"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"272"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0310"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.051"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"15.65"}},{name:"effectiveHourly",prices:{USD:"0.0214"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"279"}},{name:"monthlyStar",prices:{USD:"7.75"}},{name:"effectiveHourly",prices:{USD:"0.0212"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"552"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0210"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.051"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"26.83"}},{name:"effectiveHourly",prices:{USD:"0.0367"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"159"}},{name:"monthlyStar",prices:{USD:"13.28"}},{name:"effectiveHourly",prices:{USD:"0.0364"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"315"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0360"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.051"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"19.75"}},{name:"effectiveHourly",prices:{USD:"0.0271"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"352"}},{name:"monthlyStar",prices:{USD:"9.77"}},{name:"effectiveHourly",prices:{USD:"0.0268"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"697"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0265"}}]}]}]},{type:"t2.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1021"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"46.20"}},{name:"effectiveHourly",prices:{USD:"0.0633"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"274"}},{name:"monthlyStar",prices:{USD:"22.87"}},{name:"effectiveHourly",prices:{USD:"0.0627"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"543"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0620"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1021"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"31.30"}},{name:"effectiveHourly",prices:{USD:"0.0429"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"558"}},{name:"monthlyStar",prices:{USD:"15.49"}},{name:"effectiveHourly",prices:{USD:"0.0424"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,104"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0420"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1021"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"53.65"}},{name:"effectiveHourly",prices:{USD:"0.0735"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"319"}},{name:"monthlyStar",prices:{USD:"26.56"}},{name:"effectiveHourly",prices:{USD:"0.0728"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"631"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0720"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1021"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"39.49"}},{name:"effectiveHourly",prices:{USD:"0.0541"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"704"}},{name:"monthlyStar",prices:{USD:"19.55"}},{name:"effectiveHourly",prices:{USD:"0.0536"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,393"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0530"}}]}]}]},{type:"m4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"49.79"}},{name:"effectiveHourly",prices:{USD:"0.0682"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"296"}},{name:"monthlyStar",prices:{USD:"24.64"}},{name:"effectiveHourly",prices:{USD:"0.0675"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"585"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0668"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"33.73"}},{name:"effectiveHourly",prices:{USD:"0.0462"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"601"}},{name:"monthlyStar",prices:{USD:"16.69"}},{name:"effectiveHourly",prices:{USD:"0.0457"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,190"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0453"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"57.82"}},{name:"effectiveHourly",prices:{USD:"0.0792"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"343"}},{name:"monthlyStar",prices:{USD:"28.62"}},{name:"effectiveHourly",prices:{USD:"0.0784"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"680"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0776"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"42.56"}},{name:"effectiveHourly",prices:{USD:"0.0583"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"758"}},{name:"monthlyStar",prices:{USD:"21.07"}},{name:"effectiveHourly",prices:{USD:"0.0577"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,501"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0571"}}]}]}]},{type:"m4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.22"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"99.57"}},{name:"effectiveHourly",prices:{USD:"0.1364"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"591"}},{name:"monthlyStar",prices:{USD:"49.29"}},{name:"effectiveHourly",prices:{USD:"0.1350"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,171"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1337"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.22"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"67.45"}},{name:"effectiveHourly",prices:{USD:"0.0924"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,202"}},{name:"monthlyStar",prices:{USD:"33.39"}},{name:"effectiveHourly",prices:{USD:"0.0915"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,380"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0906"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.22"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"115.63"}},{name:"effectiveHourly",prices:{USD:"0.1584"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"687"}},{name:"monthlyStar",prices:{USD:"57.24"}},{name:"effectiveHourly",prices:{USD:"0.1568"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,360"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1552"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.22"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"85.12"}},{name:"effectiveHourly",prices:{USD:"0.1166"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,517"}},{name:"monthlyStar",prices:{USD:"42.13"}},{name:"effectiveHourly",prices:{USD:"0.1154"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,003"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1143"}}]}]}]},{type:"m4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.44"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"199.14"}},{name:"effectiveHourly",prices:{USD:"0.2728"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,183"}},{name:"monthlyStar",prices:{USD:"98.58"}},{name:"effectiveHourly",prices:{USD:"0.2701"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,342"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2673"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.44"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"134.90"}},{name:"effectiveHourly",prices:{USD:"0.1848"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,404"}},{name:"monthlyStar",prices:{USD:"66.78"}},{name:"effectiveHourly",prices:{USD:"0.1830"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"4,759"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1811"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.44"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"231.26"}},{name:"effectiveHourly",prices:{USD:"0.3168"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,374"}},{name:"monthlyStar",prices:{USD:"114.48"}},{name:"effectiveHourly",prices:{USD:"0.3136"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,720"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3105"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.44"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"170.24"}},{name:"effectiveHourly",prices:{USD:"0.2332"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,034"}},{name:"monthlyStar",prices:{USD:"84.27"}},{name:"effectiveHourly",prices:{USD:"0.2309"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"6,006"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2285"}}]}]}]},{type:"m4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.88"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"398.29"}},{name:"effectiveHourly",prices:{USD:"0.5456"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,366"}},{name:"monthlyStar",prices:{USD:"197.15"}},{name:"effectiveHourly",prices:{USD:"0.5401"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,684"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5347"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.88"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"269.81"}},{name:"effectiveHourly",prices:{USD:"0.3696"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,808"}},{name:"monthlyStar",prices:{USD:"133.55"}},{name:"effectiveHourly",prices:{USD:"0.3659"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"9,519"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3622"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.88"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"462.53"}},{name:"effectiveHourly",prices:{USD:"0.6336"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,747"}},{name:"monthlyStar",prices:{USD:"228.95"}},{name:"effectiveHourly",prices:{USD:"0.6273"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"5,439"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6209"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.88"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"340.47"}},{name:"effectiveHourly",prices:{USD:"0.4664"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"6,067"}},{name:"monthlyStar",prices:{USD:"168.53"}},{name:"effectiveHourly",prices:{USD:"0.4617"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"12,012"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4571"}}]}]}]},{type:"m4.10xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"995.72"}},{name:"effectiveHourly",prices:{USD:"1.3640"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"5,915"}},{name:"monthlyStar",prices:{USD:"492.88"}},{name:"effectiveHourly",prices:{USD:"1.3504"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"11,710"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.3367"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"674.52"}},{name:"effectiveHourly",prices:{USD:"0.9240"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"12,020"}},{name:"monthlyStar",prices:{USD:"333.89"}},{name:"effectiveHourly",prices:{USD:"0.9148"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"23,797"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.9055"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,156.32"}},{name:"effectiveHourly",prices:{USD:"1.5840"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"6,869"}},{name:"monthlyStar",prices:{USD:"572.38"}},{name:"effectiveHourly",prices:{USD:"1.5682"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"13,598"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.5523"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.200"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"851.18"}},{name:"effectiveHourly",prices:{USD:"1.1660"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"15,168"}},{name:"monthlyStar",prices:{USD:"421.33"}},{name:"effectiveHourly",prices:{USD:"1.1543"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"30,030"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.1427"}}]}]}]},{type:"m4.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.520"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,593.15"}},{name:"effectiveHourly",prices:{USD:"2.1824"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"9,463"}},{name:"monthlyStar",prices:{USD:"788.61"}},{name:"effectiveHourly",prices:{USD:"2.1606"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"18,735"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.1388"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.520"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,079.23"}},{name:"effectiveHourly",prices:{USD:"1.4784"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"19,232"}},{name:"monthlyStar",prices:{USD:"534.22"}},{name:"effectiveHourly",prices:{USD:"1.4636"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"38,075"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.4488"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.520"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,850.11"}},{name:"effectiveHourly",prices:{USD:"2.5344"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"10,990"}},{name:"monthlyStar",prices:{USD:"915.81"}},{name:"effectiveHourly",prices:{USD:"2.5091"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"21,757"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.4837"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"3.520"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,361.89"}},{name:"effectiveHourly",prices:{USD:"1.8656"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"24,269"}},{name:"monthlyStar",prices:{USD:"674.13"}},{name:"effectiveHourly",prices:{USD:"1.8469"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"48,047"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.8283"}}]}]}]},{type:"m3.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0737"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"33.36"}},{name:"effectiveHourly",prices:{USD:"0.0457"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"198"}},{name:"monthlyStar",prices:{USD:"16.51"}},{name:"effectiveHourly",prices:{USD:"0.0452"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"392"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0448"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0737"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"22.60"}},{name:"effectiveHourly",prices:{USD:"0.0310"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"403"}},{name:"monthlyStar",prices:{USD:"11.19"}},{name:"effectiveHourly",prices:{USD:"0.0306"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"797"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0303"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0737"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"38.74"}},{name:"effectiveHourly",prices:{USD:"0.0531"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"230"}},{name:"monthlyStar",prices:{USD:"19.17"}},{name:"effectiveHourly",prices:{USD:"0.0525"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"456"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0520"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0737"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"28.51"}},{name:"effectiveHourly",prices:{USD:"0.0391"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"508"}},{name:"monthlyStar",prices:{USD:"14.11"}},{name:"effectiveHourly",prices:{USD:"0.0387"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,006"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0383"}}]}]}]},{type:"m3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"66.22"}},{name:"effectiveHourly",prices:{USD:"0.0907"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"393"}},{name:"monthlyStar",prices:{USD:"32.78"}},{name:"effectiveHourly",prices:{USD:"0.0898"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"779"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0889"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"44.86"}},{name:"effectiveHourly",prices:{USD:"0.0614"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"799"}},{name:"monthlyStar",prices:{USD:"22.20"}},{name:"effectiveHourly",prices:{USD:"0.0608"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,583"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0602"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"76.90"}},{name:"effectiveHourly",prices:{USD:"0.1053"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"457"}},{name:"monthlyStar",prices:{USD:"38.06"}},{name:"effectiveHourly",prices:{USD:"0.1043"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"904"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1032"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"56.60"}},{name:"effectiveHourly",prices:{USD:"0.0775"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,009"}},{name:"monthlyStar",prices:{USD:"28.02"}},{name:"effectiveHourly",prices:{USD:"0.0768"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,997"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0760"}}]}]}]},{type:"c4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"49.79"}},{name:"effectiveHourly",prices:{USD:"0.0682"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"296"}},{name:"monthlyStar",prices:{USD:"24.64"}},{name:"effectiveHourly",prices:{USD:"0.0675"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"585"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0668"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"33.73"}},{name:"effectiveHourly",prices:{USD:"0.0462"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"601"}},{name:"monthlyStar",prices:{USD:"16.69"}},{name:"effectiveHourly",prices:{USD:"0.0457"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,190"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0453"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"57.82"}},{name:"effectiveHourly",prices:{USD:"0.0792"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"343"}},{name:"monthlyStar",prices:{USD:"28.62"}},{name:"effectiveHourly",prices:{USD:"0.0784"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"680"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0776"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.11"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"42.56"}},{name:"effectiveHourly",prices:{USD:"0.0583"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"758"}},{name:"monthlyStar",prices:{USD:"21.07"}},{name:"effectiveHourly",prices:{USD:"0.0577"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,501"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0571"}}]}]}]},{type:"c4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2189"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"99.07"}},{name:"effectiveHourly",prices:{USD:"0.1357"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"589"}},{name:"monthlyStar",prices:{USD:"49.04"}},{name:"effectiveHourly",prices:{USD:"0.1344"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,165"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1330"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2189"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"67.11"}},{name:"effectiveHourly",prices:{USD:"0.0919"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,196"}},{name:"monthlyStar",prices:{USD:"33.22"}},{name:"effectiveHourly",prices:{USD:"0.0910"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,368"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0901"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2189"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"115.05"}},{name:"effectiveHourly",prices:{USD:"0.1576"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"683"}},{name:"monthlyStar",prices:{USD:"56.95"}},{name:"effectiveHourly",prices:{USD:"0.1560"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,353"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1545"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2189"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"84.69"}},{name:"effectiveHourly",prices:{USD:"0.1160"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,509"}},{name:"monthlyStar",prices:{USD:"41.92"}},{name:"effectiveHourly",prices:{USD:"0.1149"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,988"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1137"}}]}]}]},{type:"c4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4378"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"198.15"}},{name:"effectiveHourly",prices:{USD:"0.2714"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,177"}},{name:"monthlyStar",prices:{USD:"98.08"}},{name:"effectiveHourly",prices:{USD:"0.2687"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,330"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2660"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4378"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"134.23"}},{name:"effectiveHourly",prices:{USD:"0.1839"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,392"}},{name:"monthlyStar",prices:{USD:"66.44"}},{name:"effectiveHourly",prices:{USD:"0.1820"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"4,736"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1802"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4378"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"230.11"}},{name:"effectiveHourly",prices:{USD:"0.3152"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,367"}},{name:"monthlyStar",prices:{USD:"113.90"}},{name:"effectiveHourly",prices:{USD:"0.3121"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,706"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3089"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.4378"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"169.38"}},{name:"effectiveHourly",prices:{USD:"0.2320"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,018"}},{name:"monthlyStar",prices:{USD:"83.85"}},{name:"effectiveHourly",prices:{USD:"0.2297"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,976"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2274"}}]}]}]},{type:"c4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8756"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"396.30"}},{name:"effectiveHourly",prices:{USD:"0.5429"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,354"}},{name:"monthlyStar",prices:{USD:"196.17"}},{name:"effectiveHourly",prices:{USD:"0.5374"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,660"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5320"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8756"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"268.46"}},{name:"effectiveHourly",prices:{USD:"0.3678"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,784"}},{name:"monthlyStar",prices:{USD:"132.89"}},{name:"effectiveHourly",prices:{USD:"0.3641"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"9,471"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3604"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8756"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"460.22"}},{name:"effectiveHourly",prices:{USD:"0.6304"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,734"}},{name:"monthlyStar",prices:{USD:"227.81"}},{name:"effectiveHourly",prices:{USD:"0.6241"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"5,412"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6178"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8756"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"338.77"}},{name:"effectiveHourly",prices:{USD:"0.4641"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"6,037"}},{name:"monthlyStar",prices:{USD:"167.69"}},{name:"effectiveHourly",prices:{USD:"0.4594"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"11,952"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4548"}}]}]}]},{type:"c4.8xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.750"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"792.10"}},{name:"effectiveHourly",prices:{USD:"1.0851"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,705"}},{name:"monthlyStar",prices:{USD:"392.09"}},{name:"effectiveHourly",prices:{USD:"1.0742"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"9,315"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.0634"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.750"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"536.58"}},{name:"effectiveHourly",prices:{USD:"0.7350"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"9,562"}},{name:"monthlyStar",prices:{USD:"265.61"}},{name:"effectiveHourly",prices:{USD:"0.7277"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"18,931"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.7203"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.750"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"919.85"}},{name:"effectiveHourly",prices:{USD:"1.2601"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"5,464"}},{name:"monthlyStar",prices:{USD:"455.33"}},{name:"effectiveHourly",prices:{USD:"1.2475"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"10,817"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.2349"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.750"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"677.11"}},{name:"effectiveHourly",prices:{USD:"0.9276"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"12,066"}},{name:"monthlyStar",prices:{USD:"335.17"}},{name:"effectiveHourly",prices:{USD:"0.9183"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"23,889"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.9090"}}]}]}]},{type:"r4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"66.22"}},{name:"effectiveHourly",prices:{USD:"0.0907"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"393"}},{name:"monthlyStar",prices:{USD:"32.78"}},{name:"effectiveHourly",prices:{USD:"0.0898"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"779"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0889"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"44.86"}},{name:"effectiveHourly",prices:{USD:"0.0614"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"799"}},{name:"monthlyStar",prices:{USD:"22.20"}},{name:"effectiveHourly",prices:{USD:"0.0608"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,583"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0602"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"76.90"}},{name:"effectiveHourly",prices:{USD:"0.1053"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"457"}},{name:"monthlyStar",prices:{USD:"38.06"}},{name:"effectiveHourly",prices:{USD:"0.1043"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"904"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1032"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1463"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"56.60"}},{name:"effectiveHourly",prices:{USD:"0.0775"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,009"}},{name:"monthlyStar",prices:{USD:"28.02"}},{name:"effectiveHourly",prices:{USD:"0.0768"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,997"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0760"}}]}]}]},{type:"r4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2926"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"132.43"}},{name:"effectiveHourly",prices:{USD:"0.1814"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"787"}},{name:"monthlyStar",prices:{USD:"65.55"}},{name:"effectiveHourly",prices:{USD:"0.1796"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,557"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1778"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2926"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"89.71"}},{name:"effectiveHourly",prices:{USD:"0.1229"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,599"}},{name:"monthlyStar",prices:{USD:"44.41"}},{name:"effectiveHourly",prices:{USD:"0.1217"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"3,165"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1204"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2926"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"153.79"}},{name:"effectiveHourly",prices:{USD:"0.2107"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"914"}},{name:"monthlyStar",prices:{USD:"76.13"}},{name:"effectiveHourly",prices:{USD:"0.2086"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,809"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2065"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2926"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"113.21"}},{name:"effectiveHourly",prices:{USD:"0.1551"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,017"}},{name:"monthlyStar",prices:{USD:"56.04"}},{name:"effectiveHourly",prices:{USD:"0.1535"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,994"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1520"}}]}]}]},{type:"r4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5852"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"264.86"}},{name:"effectiveHourly",prices:{USD:"0.3628"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,573"}},{name:"monthlyStar",prices:{USD:"131.11"}},{name:"effectiveHourly",prices:{USD:"0.3592"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"3,115"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3556"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5852"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"179.42"}},{name:"effectiveHourly",prices:{USD:"0.2458"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"3,197"}},{name:"monthlyStar",prices:{USD:"88.81"}},{name:"effectiveHourly",prices:{USD:"0.2433"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"6,330"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2409"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5852"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"307.58"}},{name:"effectiveHourly",prices:{USD:"0.4213"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,827"}},{name:"monthlyStar",prices:{USD:"152.25"}},{name:"effectiveHourly",prices:{USD:"0.4171"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,617"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4129"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5852"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"226.41"}},{name:"effectiveHourly",prices:{USD:"0.3102"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"4,035"}},{name:"monthlyStar",prices:{USD:"112.07"}},{name:"effectiveHourly",prices:{USD:"0.3071"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,988"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3040"}}]}]}]},{type:"x1.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"7.336"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,320.23"}},{name:"effectiveHourly",prices:{USD:"4.5483"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"19,722"}},{name:"monthlyStar",prices:{USD:"1,643.51"}},{name:"effectiveHourly",prices:{USD:"4.5028"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"39,046"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"4.4573"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"7.336"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,249.19"}},{name:"effectiveHourly",prices:{USD:"3.0811"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"40,081"}},{name:"monthlyStar",prices:{USD:"1,113.35"}},{name:"effectiveHourly",prices:{USD:"3.0503"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"79,351"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"3.0195"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"7.336"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,855.75"}},{name:"effectiveHourly",prices:{USD:"5.2818"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"22,903"}},{name:"monthlyStar",prices:{USD:"1,908.60"}},{name:"effectiveHourly",prices:{USD:"5.2290"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"45,344"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"5.1762"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"7.336"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,838.26"}},{name:"effectiveHourly",prices:{USD:"3.8880"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"50,578"}},{name:"monthlyStar",prices:{USD:"1,404.94"}},{name:"effectiveHourly",prices:{USD:"3.8491"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"100,134"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"3.8103"}}]}]}]},{type:"i3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"77.67"}},{name:"effectiveHourly",prices:{USD:"0.1064"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"461"}},{name:"monthlyStar",prices:{USD:"38.44"}},{name:"effectiveHourly",prices:{USD:"0.1053"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"913"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1043"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.61"}},{name:"effectiveHourly",prices:{USD:"0.0721"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"938"}},{name:"monthlyStar",prices:{USD:"26.04"}},{name:"effectiveHourly",prices:{USD:"0.0714"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,856"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.19"}},{name:"effectiveHourly",prices:{USD:"0.1236"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"536"}},{name:"monthlyStar",prices:{USD:"44.65"}},{name:"effectiveHourly",prices:{USD:"0.1223"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,061"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1211"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"66.39"}},{name:"effectiveHourly",prices:{USD:"0.0909"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,183"}},{name:"monthlyStar",prices:{USD:"32.86"}},{name:"effectiveHourly",prices:{USD:"0.0900"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,342"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0891"}}]}]}]},{type:"d2.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.759"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"343.52"}},{name:"effectiveHourly",prices:{USD:"0.4706"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,041"}},{name:"monthlyStar",prices:{USD:"170.04"}},{name:"effectiveHourly",prices:{USD:"0.4659"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,040"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4612"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.759"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"232.71"}},{name:"effectiveHourly",prices:{USD:"0.3188"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,147"}},{name:"monthlyStar",prices:{USD:"115.19"}},{name:"effectiveHourly",prices:{USD:"0.3156"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"8,210"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3124"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.759"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"398.93"}},{name:"effectiveHourly",prices:{USD:"0.5465"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,370"}},{name:"monthlyStar",prices:{USD:"197.47"}},{name:"effectiveHourly",prices:{USD:"0.5410"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,691"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5356"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.759"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"293.66"}},{name:"effectiveHourly",prices:{USD:"0.4023"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"5,233"}},{name:"monthlyStar",prices:{USD:"145.36"}},{name:"effectiveHourly",prices:{USD:"0.3982"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"10,360"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3942"}}]}]}]}]},{region:"ap-northeast-1",instanceTypes:[{type:"t2.nano",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0076"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3.44"}},{name:"effectiveHourly",prices:{USD:"0.0047"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"20"}},{name:"monthlyStar",prices:{USD:"1.71"}},{name:"effectiveHourly",prices:{USD:"0.0047"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"41"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0046"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0076"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.33"}},{name:"effectiveHourly",prices:{USD:"0.0032"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"42"}},{name:"monthlyStar",prices:{USD:"1.16"}},{name:"effectiveHourly",prices:{USD:"0.0032"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"82"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0031"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0076"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"4.00"}},{name:"effectiveHourly",prices:{USD:"0.0055"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"24"}},{name:"monthlyStar",prices:{USD:"1.98"}},{name:"effectiveHourly",prices:{USD:"0.0054"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"47"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0054"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0076"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2.94"}},{name:"effectiveHourly",prices:{USD:"0.0040"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"52"}},{name:"monthlyStar",prices:{USD:"1.46"}},{name:"effectiveHourly",prices:{USD:"0.0040"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"104"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0040"}}]}]}]},{type:"t2.micro",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.015"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"6.77"}},{name:"effectiveHourly",prices:{USD:"0.0093"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"40"}},{name:"monthlyStar",prices:{USD:"3.35"}},{name:"effectiveHourly",prices:{USD:"0.0092"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"80"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0091"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.015"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"4.59"}},{name:"effectiveHourly",prices:{USD:"0.0063"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"82"}},{name:"monthlyStar",prices:{USD:"2.27"}},{name:"effectiveHourly",prices:{USD:"0.0062"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"162"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0062"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.015"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"7.87"}},{name:"effectiveHourly",prices:{USD:"0.0108"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"47"}},{name:"monthlyStar",prices:{USD:"3.89"}},{name:"effectiveHourly",prices:{USD:"0.0107"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"92"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0106"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.015"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"5.79"}},{name:"effectiveHourly",prices:{USD:"0.0079"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"103"}},{name:"monthlyStar",prices:{USD:"2.87"}},{name:"effectiveHourly",prices:{USD:"0.0079"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"204"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0078"}}]}]}]},{type:"t2.small",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0297"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"13.43"}},{name:"effectiveHourly",prices:{USD:"0.0184"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"80"}},{name:"monthlyStar",prices:{USD:"6.65"}},{name:"effectiveHourly",prices:{USD:"0.0182"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"158"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0180"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0297"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"9.10"}},{name:"effectiveHourly",prices:{USD:"0.0125"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"162"}},{name:"monthlyStar",prices:{USD:"4.50"}},{name:"effectiveHourly",prices:{USD:"0.0123"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"321"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0122"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0297"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"15.59"}},{name:"effectiveHourly",prices:{USD:"0.0214"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"93"}},{name:"monthlyStar",prices:{USD:"7.72"}},{name:"effectiveHourly",prices:{USD:"0.0211"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"183"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0209"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0297"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"11.48"}},{name:"effectiveHourly",prices:{USD:"0.0157"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"205"}},{name:"monthlyStar",prices:{USD:"5.68"}},{name:"effectiveHourly",prices:{USD:"0.0156"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"405"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0154"}}]}]}]},{type:"t2.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0599"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"27.09"}},{name:"effectiveHourly",prices:{USD:"0.0371"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"161"}},{name:"monthlyStar",prices:{USD:"13.41"}},{name:"effectiveHourly",prices:{USD:"0.0367"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"319"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0364"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0599"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"18.35"}},{name:"effectiveHourly",prices:{USD:"0.0251"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"327"}},{name:"monthlyStar",prices:{USD:"9.08"}},{name:"effectiveHourly",prices:{USD:"0.0249"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"647"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0246"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0599"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"31.46"}},{name:"effectiveHourly",prices:{USD:"0.0431"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"187"}},{name:"monthlyStar",prices:{USD:"15.57"}},{name:"effectiveHourly",prices:{USD:"0.0427"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"370"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0422"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0599"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"23.16"}},{name:"effectiveHourly",prices:{USD:"0.0317"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"413"}},{name:"monthlyStar",prices:{USD:"11.46"}},{name:"effectiveHourly",prices:{USD:"0.0314"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"817"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0311"}}]}]}]},{type:"t2.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1197"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"54.18"}},{name:"effectiveHourly",prices:{USD:"0.0742"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"322"}},{name:"monthlyStar",prices:{USD:"26.82"}},{name:"effectiveHourly",prices:{USD:"0.0735"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"637"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0727"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1197"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"36.70"}},{name:"effectiveHourly",prices:{USD:"0.0503"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"654"}},{name:"monthlyStar",prices:{USD:"18.17"}},{name:"effectiveHourly",prices:{USD:"0.0498"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,295"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0493"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1197"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"62.92"}},{name:"effectiveHourly",prices:{USD:"0.0862"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"374"}},{name:"monthlyStar",prices:{USD:"31.15"}},{name:"effectiveHourly",prices:{USD:"0.0853"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"740"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0845"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1197"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"46.32"}},{name:"effectiveHourly",prices:{USD:"0.0634"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"825"}},{name:"monthlyStar",prices:{USD:"22.93"}},{name:"effectiveHourly",prices:{USD:"0.0628"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,634"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0622"}}]}]}]},{type:"m4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"58.39"}},{name:"effectiveHourly",prices:{USD:"0.0800"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"347"}},{name:"monthlyStar",prices:{USD:"28.90"}},{name:"effectiveHourly",prices:{USD:"0.0792"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"687"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0784"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"39.55"}},{name:"effectiveHourly",prices:{USD:"0.0542"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"705"}},{name:"monthlyStar",prices:{USD:"19.58"}},{name:"effectiveHourly",prices:{USD:"0.0536"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,395"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0531"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"67.80"}},{name:"effectiveHourly",prices:{USD:"0.0929"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"403"}},{name:"monthlyStar",prices:{USD:"33.56"}},{name:"effectiveHourly",prices:{USD:"0.0920"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"797"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0910"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"49.91"}},{name:"effectiveHourly",prices:{USD:"0.0684"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"889"}},{name:"monthlyStar",prices:{USD:"24.71"}},{name:"effectiveHourly",prices:{USD:"0.0677"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,761"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0670"}}]}]}]},{type:"m4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.258"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"116.77"}},{name:"effectiveHourly",prices:{USD:"0.1600"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"694"}},{name:"monthlyStar",prices:{USD:"57.80"}},{name:"effectiveHourly",prices:{USD:"0.1584"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,373"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1568"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.258"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"79.10"}},{name:"effectiveHourly",prices:{USD:"0.1084"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,410"}},{name:"monthlyStar",prices:{USD:"39.16"}},{name:"effectiveHourly",prices:{USD:"0.1073"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,791"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1062"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.258"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"135.60"}},{name:"effectiveHourly",prices:{USD:"0.1858"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"805"}},{name:"monthlyStar",prices:{USD:"67.12"}},{name:"effectiveHourly",prices:{USD:"0.1839"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,595"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1820"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.258"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"99.82"}},{name:"effectiveHourly",prices:{USD:"0.1367"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,779"}},{name:"monthlyStar",prices:{USD:"49.41"}},{name:"effectiveHourly",prices:{USD:"0.1354"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,522"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1340"}}]}]}]},{type:"m4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.516"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"233.54"}},{name:"effectiveHourly",prices:{USD:"0.3199"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,387"}},{name:"monthlyStar",prices:{USD:"115.60"}},{name:"effectiveHourly",prices:{USD:"0.3167"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,746"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3135"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.516"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"158.21"}},{name:"effectiveHourly",prices:{USD:"0.2167"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,819"}},{name:"monthlyStar",prices:{USD:"78.31"}},{name:"effectiveHourly",prices:{USD:"0.2146"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"5,581"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2124"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.516"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"271.21"}},{name:"effectiveHourly",prices:{USD:"0.3715"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,611"}},{name:"monthlyStar",prices:{USD:"134.25"}},{name:"effectiveHourly",prices:{USD:"0.3678"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,189"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3641"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.516"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"199.64"}},{name:"effectiveHourly",prices:{USD:"0.2735"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,558"}},{name:"monthlyStar",prices:{USD:"98.82"}},{name:"effectiveHourly",prices:{USD:"0.2707"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,043"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2680"}}]}]}]},{type:"m4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.032"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"467.08"}},{name:"effectiveHourly",prices:{USD:"0.6398"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,774"}},{name:"monthlyStar",prices:{USD:"231.21"}},{name:"effectiveHourly",prices:{USD:"0.6334"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"5,493"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6270"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.032"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"316.41"}},{name:"effectiveHourly",prices:{USD:"0.4334"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"5,638"}},{name:"monthlyStar",prices:{USD:"156.62"}},{name:"effectiveHourly",prices:{USD:"0.4291"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"11,163"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4248"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.032"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"542.42"}},{name:"effectiveHourly",prices:{USD:"0.7430"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,222"}},{name:"monthlyStar",prices:{USD:"268.50"}},{name:"effectiveHourly",prices:{USD:"0.7356"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"6,379"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.7282"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.032"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"399.28"}},{name:"effectiveHourly",prices:{USD:"0.5470"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,115"}},{name:"monthlyStar",prices:{USD:"197.64"}},{name:"effectiveHourly",prices:{USD:"0.5415"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"14,087"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5360"}}]}]}]},{type:"m4.10xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.580"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,167.71"}},{name:"effectiveHourly",prices:{USD:"1.5996"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"6,936"}},{name:"monthlyStar",prices:{USD:"578.02"}},{name:"effectiveHourly",prices:{USD:"1.5836"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"13,732"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.5676"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.580"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"791.03"}},{name:"effectiveHourly",prices:{USD:"1.0836"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"14,096"}},{name:"monthlyStar",prices:{USD:"391.56"}},{name:"effectiveHourly",prices:{USD:"1.0728"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"27,907"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.0619"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.580"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,356.05"}},{name:"effectiveHourly",prices:{USD:"1.8576"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"8,055"}},{name:"monthlyStar",prices:{USD:"671.24"}},{name:"effectiveHourly",prices:{USD:"1.8390"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"15,947"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.8204"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.580"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"998.20"}},{name:"effectiveHourly",prices:{USD:"1.3674"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"17,788"}},{name:"monthlyStar",prices:{USD:"494.11"}},{name:"effectiveHourly",prices:{USD:"1.3537"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"35,217"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.3401"}}]}]}]},{type:"m4.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"4.128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,868.33"}},{name:"effectiveHourly",prices:{USD:"2.5594"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"11,098"}},{name:"monthlyStar",prices:{USD:"924.82"}},{name:"effectiveHourly",prices:{USD:"2.5338"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"21,972"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.5082"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"4.128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,265.64"}},{name:"effectiveHourly",prices:{USD:"1.7338"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"22,554"}},{name:"monthlyStar",prices:{USD:"626.49"}},{name:"effectiveHourly",prices:{USD:"1.7164"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"44,652"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.6991"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"4.128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,169.68"}},{name:"effectiveHourly",prices:{USD:"2.9722"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"12,888"}},{name:"monthlyStar",prices:{USD:"1,073.99"}},{name:"effectiveHourly",prices:{USD:"2.9424"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"25,515"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.9127"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"4.128"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,597.12"}},{name:"effectiveHourly",prices:{USD:"2.1878"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"28,461"}},{name:"monthlyStar",prices:{USD:"790.58"}},{name:"effectiveHourly",prices:{USD:"2.1660"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"56,347"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"2.1441"}}]}]}]},{type:"m3.medium",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0864"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"39.12"}},{name:"effectiveHourly",prices:{USD:"0.0536"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"232"}},{name:"monthlyStar",prices:{USD:"19.36"}},{name:"effectiveHourly",prices:{USD:"0.0531"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"460"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0525"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0864"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"26.50"}},{name:"effectiveHourly",prices:{USD:"0.0363"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"472"}},{name:"monthlyStar",prices:{USD:"13.12"}},{name:"effectiveHourly",prices:{USD:"0.0359"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"935"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0356"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0864"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"45.43"}},{name:"effectiveHourly",prices:{USD:"0.0622"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"270"}},{name:"monthlyStar",prices:{USD:"22.49"}},{name:"effectiveHourly",prices:{USD:"0.0616"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"534"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0610"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.0864"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"33.44"}},{name:"effectiveHourly",prices:{USD:"0.0458"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"596"}},{name:"monthlyStar",prices:{USD:"16.55"}},{name:"effectiveHourly",prices:{USD:"0.0453"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,180"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0449"}}]}]}]},{type:"m3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"77.65"}},{name:"effectiveHourly",prices:{USD:"0.1064"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"461"}},{name:"monthlyStar",prices:{USD:"38.44"}},{name:"effectiveHourly",prices:{USD:"0.1053"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"913"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1042"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.60"}},{name:"effectiveHourly",prices:{USD:"0.0721"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"937"}},{name:"monthlyStar",prices:{USD:"26.04"}},{name:"effectiveHourly",prices:{USD:"0.0713"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,856"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.18"}},{name:"effectiveHourly",prices:{USD:"0.1235"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"536"}},{name:"monthlyStar",prices:{USD:"44.64"}},{name:"effectiveHourly",prices:{USD:"0.1223"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,060"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1211"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"66.38"}},{name:"effectiveHourly",prices:{USD:"0.0909"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,183"}},{name:"monthlyStar",prices:{USD:"32.86"}},{name:"effectiveHourly",prices:{USD:"0.0900"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,342"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0891"}}]}]}]},{type:"c4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"58.39"}},{name:"effectiveHourly",prices:{USD:"0.0800"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"347"}},{name:"monthlyStar",prices:{USD:"28.90"}},{name:"effectiveHourly",prices:{USD:"0.0792"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"687"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0784"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"39.55"}},{name:"effectiveHourly",prices:{USD:"0.0542"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"705"}},{name:"monthlyStar",prices:{USD:"19.58"}},{name:"effectiveHourly",prices:{USD:"0.0536"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,395"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0531"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"67.80"}},{name:"effectiveHourly",prices:{USD:"0.0929"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"403"}},{name:"monthlyStar",prices:{USD:"33.56"}},{name:"effectiveHourly",prices:{USD:"0.0920"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"797"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0910"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.129"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"49.91"}},{name:"effectiveHourly",prices:{USD:"0.0684"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"889"}},{name:"monthlyStar",prices:{USD:"24.71"}},{name:"effectiveHourly",prices:{USD:"0.0677"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,761"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0670"}}]}]}]},{type:"c4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2567"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"116.19"}},{name:"effectiveHourly",prices:{USD:"0.1592"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"690"}},{name:"monthlyStar",prices:{USD:"57.51"}},{name:"effectiveHourly",prices:{USD:"0.1576"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,366"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1560"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2567"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"78.71"}},{name:"effectiveHourly",prices:{USD:"0.1078"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,403"}},{name:"monthlyStar",prices:{USD:"38.96"}},{name:"effectiveHourly",prices:{USD:"0.1067"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,777"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1057"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2567"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"134.93"}},{name:"effectiveHourly",prices:{USD:"0.1848"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"801"}},{name:"monthlyStar",prices:{USD:"66.79"}},{name:"effectiveHourly",prices:{USD:"0.1830"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,587"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1811"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2567"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"99.32"}},{name:"effectiveHourly",prices:{USD:"0.1361"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,770"}},{name:"monthlyStar",prices:{USD:"49.16"}},{name:"effectiveHourly",prices:{USD:"0.1347"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,504"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1333"}}]}]}]},{type:"c4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5134"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"232.37"}},{name:"effectiveHourly",prices:{USD:"0.3183"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,380"}},{name:"monthlyStar",prices:{USD:"115.03"}},{name:"effectiveHourly",prices:{USD:"0.3151"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,733"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3120"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5134"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"157.41"}},{name:"effectiveHourly",prices:{USD:"0.2156"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"2,805"}},{name:"monthlyStar",prices:{USD:"77.92"}},{name:"effectiveHourly",prices:{USD:"0.2135"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"5,554"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2113"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5134"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"269.85"}},{name:"effectiveHourly",prices:{USD:"0.3697"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,603"}},{name:"monthlyStar",prices:{USD:"133.58"}},{name:"effectiveHourly",prices:{USD:"0.3660"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,173"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3623"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.5134"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"198.64"}},{name:"effectiveHourly",prices:{USD:"0.2721"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"3,540"}},{name:"monthlyStar",prices:{USD:"98.33"}},{name:"effectiveHourly",prices:{USD:"0.2694"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,008"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2667"}}]}]}]},{type:"c4.4xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.027"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"464.75"}},{name:"effectiveHourly",prices:{USD:"0.6366"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,761"}},{name:"monthlyStar",prices:{USD:"230.05"}},{name:"effectiveHourly",prices:{USD:"0.6303"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"5,465"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6239"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.027"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"314.83"}},{name:"effectiveHourly",prices:{USD:"0.4313"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"5,610"}},{name:"monthlyStar",prices:{USD:"155.84"}},{name:"effectiveHourly",prices:{USD:"0.4270"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"11,107"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4226"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.027"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"539.71"}},{name:"effectiveHourly",prices:{USD:"0.7393"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"3,206"}},{name:"monthlyStar",prices:{USD:"267.16"}},{name:"effectiveHourly",prices:{USD:"0.7319"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"6,347"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.7245"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"1.027"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"397.28"}},{name:"effectiveHourly",prices:{USD:"0.5442"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"7,080"}},{name:"monthlyStar",prices:{USD:"196.66"}},{name:"effectiveHourly",prices:{USD:"0.5388"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"14,016"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5333"}}]}]}]},{type:"c4.8xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.052"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"928.91"}},{name:"effectiveHourly",prices:{USD:"1.2725"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"5,518"}},{name:"monthlyStar",prices:{USD:"459.81"}},{name:"effectiveHourly",prices:{USD:"1.2598"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"10,924"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.2470"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.052"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"629.26"}},{name:"effectiveHourly",prices:{USD:"0.8620"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"11,213"}},{name:"monthlyStar",prices:{USD:"311.49"}},{name:"effectiveHourly",prices:{USD:"0.8534"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"22,200"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.8448"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.052"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"1,078.74"}},{name:"effectiveHourly",prices:{USD:"1.4777"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"6,408"}},{name:"monthlyStar",prices:{USD:"533.97"}},{name:"effectiveHourly",prices:{USD:"1.4629"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"12,686"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.4482"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"2.052"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"794.07"}},{name:"effectiveHourly",prices:{USD:"1.0878"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"14,150"}},{name:"monthlyStar",prices:{USD:"393.06"}},{name:"effectiveHourly",prices:{USD:"1.0769"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"28,015"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"1.0660"}}]}]}]},{type:"r4.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"77.65"}},{name:"effectiveHourly",prices:{USD:"0.1064"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"461"}},{name:"monthlyStar",prices:{USD:"38.44"}},{name:"effectiveHourly",prices:{USD:"0.1053"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"913"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1042"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"52.60"}},{name:"effectiveHourly",prices:{USD:"0.0721"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"937"}},{name:"monthlyStar",prices:{USD:"26.04"}},{name:"effectiveHourly",prices:{USD:"0.0713"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"1,856"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0706"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"90.18"}},{name:"effectiveHourly",prices:{USD:"0.1235"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"536"}},{name:"monthlyStar",prices:{USD:"44.64"}},{name:"effectiveHourly",prices:{USD:"0.1223"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,060"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1211"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.1716"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"66.38"}},{name:"effectiveHourly",prices:{USD:"0.0909"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,183"}},{name:"monthlyStar",prices:{USD:"32.86"}},{name:"effectiveHourly",prices:{USD:"0.0900"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,342"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0891"}}]}]}]},{type:"r4.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.3431"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"155.31"}},{name:"effectiveHourly",prices:{USD:"0.2127"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"923"}},{name:"monthlyStar",prices:{USD:"76.88"}},{name:"effectiveHourly",prices:{USD:"0.2106"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,826"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2085"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.3431"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"105.21"}},{name:"effectiveHourly",prices:{USD:"0.1441"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,875"}},{name:"monthlyStar",prices:{USD:"52.08"}},{name:"effectiveHourly",prices:{USD:"0.1427"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"3,712"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1412"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.3431"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"180.35"}},{name:"effectiveHourly",prices:{USD:"0.2471"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,071"}},{name:"monthlyStar",prices:{USD:"89.28"}},{name:"effectiveHourly",prices:{USD:"0.2446"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,121"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2421"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.3431"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"132.76"}},{name:"effectiveHourly",prices:{USD:"0.1819"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,366"}},{name:"monthlyStar",prices:{USD:"65.72"}},{name:"effectiveHourly",prices:{USD:"0.1800"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"4,684"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1782"}}]}]}]},{type:"r4.2xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.6863"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"310.61"}},{name:"effectiveHourly",prices:{USD:"0.4255"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,845"}},{name:"monthlyStar",prices:{USD:"153.75"}},{name:"effectiveHourly",prices:{USD:"0.4212"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"3,653"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4170"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.6863"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"210.41"}},{name:"effectiveHourly",prices:{USD:"0.2882"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"3,750"}},{name:"monthlyStar",prices:{USD:"104.15"}},{name:"effectiveHourly",prices:{USD:"0.2854"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"7,423"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.2825"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.6863"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"360.71"}},{name:"effectiveHourly",prices:{USD:"0.4941"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,143"}},{name:"monthlyStar",prices:{USD:"178.55"}},{name:"effectiveHourly",prices:{USD:"0.4892"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"4,242"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4842"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.6863"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"265.52"}},{name:"effectiveHourly",prices:{USD:"0.3637"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"4,732"}},{name:"monthlyStar",prices:{USD:"131.43"}},{name:"effectiveHourly",prices:{USD:"0.3601"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"9,368"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3565"}}]}]}]},{type:"x1.16xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"8.603"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,893.72"}},{name:"effectiveHourly",prices:{USD:"5.3339"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"23,129"}},{name:"monthlyStar",prices:{USD:"1,927.39"}},{name:"effectiveHourly",prices:{USD:"5.2805"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"45,790"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"5.2272"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"8.603"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"2,637.68"}},{name:"effectiveHourly",prices:{USD:"3.6133"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"47,004"}},{name:"monthlyStar",prices:{USD:"1,305.65"}},{name:"effectiveHourly",prices:{USD:"3.5771"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"93,057"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"3.5410"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"8.603"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"4,521.74"}},{name:"effectiveHourly",prices:{USD:"6.1942"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"26,859"}},{name:"monthlyStar",prices:{USD:"2,238.26"}},{name:"effectiveHourly",prices:{USD:"6.1322"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"53,176"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"6.0703"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"8.603"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"3,328.50"}},{name:"effectiveHourly",prices:{USD:"4.5596"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"59,314"}},{name:"monthlyStar",prices:{USD:"1,647.61"}},{name:"effectiveHourly",prices:{USD:"4.5140"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"117,430"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"4.4684"}}]}]}]},{type:"i3.large",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2012"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"91.08"}},{name:"effectiveHourly",prices:{USD:"0.1248"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"541"}},{name:"monthlyStar",prices:{USD:"45.09"}},{name:"effectiveHourly",prices:{USD:"0.1235"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"1,071"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1223"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2012"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"61.70"}},{name:"effectiveHourly",prices:{USD:"0.0845"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"1,099"}},{name:"monthlyStar",prices:{USD:"30.54"}},{name:"effectiveHourly",prices:{USD:"0.0837"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"2,177"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.0828"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2012"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"105.77"}},{name:"effectiveHourly",prices:{USD:"0.1449"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"628"}},{name:"monthlyStar",prices:{USD:"52.36"}},{name:"effectiveHourly",prices:{USD:"0.1434"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"1,244"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1420"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.2012"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"77.86"}},{name:"effectiveHourly",prices:{USD:"0.1067"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"1,387"}},{name:"monthlyStar",prices:{USD:"38.54"}},{name:"effectiveHourly",prices:{USD:"0.1056"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"2,747"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.1045"}}]}]}]},{type:"d2.xlarge",terms:[{term:"yrTerm1Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8901"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"38%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"402.86"}},{name:"effectiveHourly",prices:{USD:"0.5519"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"2,393"}},{name:"monthlyStar",prices:{USD:"199.42"}},{name:"effectiveHourly",prices:{USD:"0.5463"}}]},{purchaseOption:"allUpfront",savingsOverOD:"39%",valueColumns:[{name:"upfront",prices:{USD:"4,738"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.5408"}}]}]},{term:"yrTerm3Standard",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8901"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"272.90"}},{name:"effectiveHourly",prices:{USD:"0.3738"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"58%",valueColumns:[{name:"upfront",prices:{USD:"4,863"}},{name:"monthlyStar",prices:{USD:"135.09"}},{name:"effectiveHourly",prices:{USD:"0.3701"}}]},{purchaseOption:"allUpfront",savingsOverOD:"59%",valueColumns:[{name:"upfront",prices:{USD:"9,628"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.3664"}}]}]},{term:"yrTerm1Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8901"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"28%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"467.84"}},{name:"effectiveHourly",prices:{USD:"0.6409"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"2,779"}},{name:"monthlyStar",prices:{USD:"231.58"}},{name:"effectiveHourly",prices:{USD:"0.6345"}}]},{purchaseOption:"allUpfront",savingsOverOD:"29%",valueColumns:[{name:"upfront",prices:{USD:"5,502"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.6281"}}]}]},{term:"yrTerm3Convertible",onDemandHourly:[{purchaseOption:"ODHourly",rate:"perhr",prices:{USD:"0.8901"}}],purchaseOptions:[{purchaseOption:"noUpfront",savingsOverOD:"47%",valueColumns:[{name:"upfront",prices:{USD:"0"}},{name:"monthlyStar",prices:{USD:"344.38"}},{name:"effectiveHourly",prices:{USD:"0.4718"}}]},{purchaseOption:"partialUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"6,137"}},{name:"monthlyStar",prices:{USD:"170.47"}},{name:"effectiveHourly",prices:{USD:"0.4670"}}]},{purchaseOption:"allUpfront",savingsOverOD:"48%",valueColumns:[{name:"upfront",prices:{USD:"12,150"}},{name:"monthlyStar",prices:{USD:"0.00"}},{name:"effectiveHourly",prices:{USD:"0.4623"}}]}]}]}]}]}});
\ No newline at end of file
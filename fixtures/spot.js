@@ -0,0 +1 @@
+callback({"vers":0.01,"config":{"rate":"perhr","valueColumns":["linux","mswin"],"currencies":["USD"],"regions":[{"region":"us-east","footnotes":{"*":"notAvailableForCCorCGPU"},"instanceTypes":[{"type":"generalCurrentGen","sizes":[{"size":"m3.medium","valueColumns":[{"name":"linux","prices":{"USD":"0.1005"}},{"name":"mswin","prices":{"USD":"0.1465"}}]},{"size":"m3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0495"}},{"name":"mswin","prices":{"USD":"0.0955"}}]},{"size":"m4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.1970"}},{"name":"mswin","prices":{"USD":"0.2430"}}]},{"size":"m4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.0264"}},{"name":"mswin","prices":{"USD":"0.0724"}}]},{"size":"t1.micro","valueColumns":[{"name":"linux","prices":{"USD":"0.1631"}},{"name":"mswin","prices":{"USD":"0.2091"}}]}]},{"type":"computeCurrentGen","sizes":[{"size":"c3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.1129"}},{"name":"mswin","prices":{"USD":"0.1589"}}]},{"size":"c4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0221"}},{"name":"mswin","prices":{"USD":"0.0681"}}]},{"size":"c4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1547"}},{"name":"mswin","prices":{"USD":"0.2007"}}]},{"size":"cc2.8xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.0161"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]},{"type":"gpuCurrentGen","sizes":[{"size":"g2.2xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1329"}},{"name":"mswin","prices":{"USD":"N/A*"}}]},{"size":"p2.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.0256"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]}]},{"region":"us-west-2","footnotes":{"*":"notAvailableForCCorCGPU"},"instanceTypes":[{"type":"generalCurrentGen","sizes":[{"size":"m3.medium","valueColumns":[{"name":"linux","prices":{"USD":"0.0318"}},{"name":"mswin","prices":{"USD":"0.0778"}}]},{"size":"m3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.1302"}},{"name":"mswin","prices":{"USD":"0.1762"}}]},{"size":"m4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.2489"}},{"name":"mswin","prices":{"USD":"0.2949"}}]},{"size":"m4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.0415"}},{"name":"mswin","prices":{"USD":"0.0875"}}]},{"size":"t1.micro","valueColumns":[{"name":"linux","prices":{"USD":"0.0709"}},{"name":"mswin","prices":{"USD":"0.1169"}}]}]},{"type":"computeCurrentGen","sizes":[{"size":"c3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.1901"}},{"name":"mswin","prices":{"USD":"0.2361"}}]},{"size":"c4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.2846"}},{"name":"mswin","prices":{"USD":"0.3306"}}]},{"size":"c4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1752"}},{"name":"mswin","prices":{"USD":"0.2212"}}]},{"size":"cc2.8xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1220"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]},{"type":"gpuCurrentGen","sizes":[{"size":"g2.2xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.2930"}},{"name":"mswin","prices":{"USD":"N/A*"}}]},{"size":"p2.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.0187"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]}]},{"region":"eu-ireland","footnotes":{"*":"notAvailableForCCorCGPU"},"instanceTypes":[{"type":"generalCurrentGen","sizes":[{"size":"m3.medium","valueColumns":[{"name":"linux","prices":{"USD":"0.2841"}},{"name":"mswin","prices":{"USD":"0.3301"}}]},{"size":"m3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0995"}},{"name":"mswin","prices":{"USD":"0.1455"}}]},{"size":"m4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0523"}},{"name":"mswin","prices":{"USD":"0.0983"}}]},{"size":"m4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.0437"}},{"name":"mswin","prices":{"USD":"0.0897"}}]},{"size":"t1.micro","valueColumns":[{"name":"linux","prices":{"USD":"0.1056"}},{"name":"mswin","prices":{"USD":"0.1516"}}]}]},{"type":"computeCurrentGen","sizes":[{"size":"c3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.2703"}},{"name":"mswin","prices":{"USD":"0.3163"}}]},{"size":"c4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0641"}},{"name":"mswin","prices":{"USD":"0.1101"}}]},{"size":"c4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1942"}},{"name":"mswin","prices":{"USD":"0.2402"}}]},{"size":"cc2.8xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.2128"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]},{"type":"gpuCurrentGen","sizes":[{"size":"g2.2xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1263"}},{"name":"mswin","prices":{"USD":"N/A*"}}]},{"size":"p2.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1832"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]}]},{"region":"apac-tokyo","footnotes":{"*":"notAvailableForCCorCGPU"},"instanceTypes":[{"type":"generalCurrentGen","sizes":[{"size":"m3.medium","valueColumns":[{"name":"linux","prices":{"USD":"0.0306"}},{"name":"mswin","prices":{"USD":"0.0766"}}]},{"size":"m3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0294"}},{"name":"mswin","prices":{"USD":"0.0754"}}]},{"size":"m4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.0855"}},{"name":"mswin","prices":{"USD":"0.1315"}}]},{"size":"m4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.2674"}},{"name":"mswin","prices":{"USD":"0.3134"}}]},{"size":"t1.micro","valueColumns":[{"name":"linux","prices":{"USD":"0.1705"}},{"name":"mswin","prices":{"USD":"0.2165"}}]}]},{"type":"computeCurrentGen","sizes":[{"size":"c3.large","valueColumns":[{"name":"linux","prices":{"USD":"0.1270"}},{"name":"mswin","prices":{"USD":"0.1730"}}]},{"size":"c4.large","valueColumns":[{"name":"linux","prices":{"USD":"0.2311"}},{"name":"mswin","prices":{"USD":"0.2771"}}]},{"size":"c4.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1803"}},{"name":"mswin","prices":{"USD":"0.2263"}}]},{"size":"cc2.8xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.1215"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]},{"type":"gpuCurrentGen","sizes":[{"size":"g2.2xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.3111"}},{"name":"mswin","prices":{"USD":"N/A*"}}]},{"size":"p2.xlarge","valueColumns":[{"name":"linux","prices":{"USD":"0.2746"}},{"name":"mswin","prices":{"USD":"N/A*"}}]}]}]}]}})
\ No newline at end of file
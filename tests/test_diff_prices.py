@@ -0,0 +1,95 @@
+#!/usr/bin/python
+"""
+--diff of the same prices saved in different formats must report nothing.
+Run from the top directory with:   python -m unittest discover tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ec2instancespricing
+from benchmark import FIXTURES_DIR, install_fixtures, load_fixtures
+
+def _write(path, writer_class, pricing_type, rows):
+	f = open(path, "w")
+	try:
+		writer = writer_class(f, pricing_type)
+		writer.write_all(rows)
+		writer.close()
+	finally:
+		f.close()
+
+class DiffSavedPricesTest(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		install_fixtures(load_fixtures(FIXTURES_DIR))
+		cls.directory = tempfile.mkdtemp()
+		cls.rows = {
+			"ondemand" : list(ec2instancespricing.iter_ec2_ondemand_instances_prices("us-east-1")),
+			"reserved" : list(ec2instancespricing.iter_ec2_reserved_instances_prices("us-east-1"))
+		}
+		cls.snapshot = os.path.join(cls.directory, "prices.snap")
+		ec2instancespricing.save_snapshot(cls.snapshot, ondemand=cls.rows["ondemand"], reserved=cls.rows["reserved"])
+
+	@classmethod
+	def tearDownClass(cls):
+		shutil.rmtree(cls.directory)
+
+	def _saved(self, pricing_type, writer_class, name):
+		path = os.path.join(self.directory, name)
+		_write(path, writer_class, pricing_type, self.rows[pricing_type])
+		return path
+
+	def _diff(self, pricing_type, old, new):
+		sorted_rows = old == self.snapshot and new == self.snapshot
+		return list(ec2instancespricing.diff_prices(ec2instancespricing.load_saved_prices(old, pricing_type),
+			ec2instancespricing.load_saved_prices(new, pricing_type), sorted_rows=sorted_rows))
+
+	def test_fixtures_have_duplicate_keys(self):
+		keys = [ec2instancespricing._price_key(row) for row in self.rows["reserved"]]
+		self.assertTrue(len(set(keys)) < len(keys))
+
+	def test_same_run_in_every_format(self):
+		for pricing_type in ["ondemand", "reserved"]:
+			csv = self._saved(pricing_type, ec2instancespricing.CsvRowWriter, pricing_type + ".csv")
+			ndjson = self._saved(pricing_type, ec2instancespricing.NdjsonRowWriter, pricing_type + ".ndjson")
+			rows = self._saved(pricing_type, ec2instancespricing.JsonRowWriter, pricing_type + ".json")
+			for old, new in [(self.snapshot, csv), (csv, self.snapshot), (self.snapshot, self.snapshot), (csv, ndjson), (rows, self.snapshot)]:
+				self.assertEqual(self._diff(pricing_type, old, new), [], "%s: %s against %s" % (pricing_type, old, new))
+
+	def test_changed_duplicate_is_reported_once(self):
+		keys = [ec2instancespricing._price_key(row) for row in self.rows["reserved"]]
+		duplicate = [row for row in self.rows["reserved"] if keys.count(ec2instancespricing._price_key(row)) > 1 and row.upfront][0]
+		changed = [ec2instancespricing.ReservedPrice(r.region, r.type, r.os, r.reservation, r.term, r.hourly, float(r.upfront) * 2)
+			if r is duplicate else r for r in self.rows["reserved"]]
+		for sorted_rows in [False, True]:
+			old = sorted(self.rows["reserved"], key=ec2instancespricing._price_key)
+			new = sorted(changed, key=ec2instancespricing._price_key)
+			changes = list(ec2instancespricing.diff_prices(old, new, sorted_rows=sorted_rows))
+			self.assertEqual([c.change for c in changes], ["changed"])
+			self.assertEqual(changes[0].new_upfront, float(duplicate.upfront) * 2)
+
+	def test_sort_spills_to_runs(self):
+		rows = self.rows["reserved"]
+		saved = ec2instancespricing.DIFF_SORT_ROWS
+		ec2instancespricing.DIFF_SORT_ROWS = 100
+		try:
+			spilled = list(ec2instancespricing._sort_by_price_key(reversed(rows)))
+			csv = self._saved("reserved", ec2instancespricing.CsvRowWriter, "spilled.csv")
+			ndjson = self._saved("reserved", ec2instancespricing.NdjsonRowWriter, "spilled.ndjson")
+			self.assertEqual(self._diff("reserved", csv, ndjson), [])
+			self.assertEqual(self._diff("reserved", self.snapshot, csv), [])
+		finally:
+			ec2instancespricing.DIFF_SORT_ROWS = saved
+		self.assertTrue(len(rows) > 100)
+		self.assertEqual([ec2instancespricing._price_key(row) for row in spilled], sorted(ec2instancespricing._price_key(row) for row in rows))
+		self.assertEqual(sorted((ec2instancespricing._price_key(row), row.hourly, row.upfront, row.starts_entry) for row in spilled),
+			sorted((ec2instancespricing._price_key(row), row.hourly, row.upfront, row.starts_entry) for row in rows))
+
+if __name__ == "__main__":
+	unittest.main()
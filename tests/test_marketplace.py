@@ -0,0 +1,159 @@
+#!/usr/bin/python
+"""
+get_ec2_marketplace_prices with a stubbed EC2 connection and stubbed product lookups.
+Requires boto and BeautifulSoup, like ec2marketplace.py itself.
+Run from the top directory with:   python -m unittest discover tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+try:
+	import ec2marketplace
+except ImportError:
+	ec2marketplace = None
+
+CODES = ["%08x-aaaa-bbbb-cccc-%012x" % (i, i) for i in range(6)]
+# a product code that the search does not find
+MISSING = CODES[-1]
+
+# images of each region, as the product code of each image
+IMAGES = {
+	"us-east-1" : [CODES[0], CODES[1], CODES[0], CODES[2], CODES[0], MISSING, CODES[1]],
+	"eu-west-1" : [CODES[1], CODES[3], CODES[1], MISSING],
+	"sa-east-1" : [CODES[4], CODES[0], CODES[4], CODES[4]]
+}
+
+class StubImage(object):
+
+	def __init__(self, id, location):
+		self.id = id
+		self.location = location
+
+class StubConnection(object):
+
+	def __init__(self, region):
+		self.region = region
+
+	def get_all_images(self, owners=None):
+		images = []
+		for i, code in enumerate(IMAGES.get(self.region, [])):
+			images.append(StubImage("ami-%s-%d" % (self.region, i), "aws-marketplace/product-%s-ami-0001.manifest" % code))
+		# a marketplace image that is not a product
+		images.append(StubImage("ami-%s-other" % self.region, "aws-marketplace/other.manifest"))
+		return images
+
+def stub_product(code):
+	""" Pricing of a product in every region: m1.small, plus m1.large for even codes """
+	types = ["m1.small"]
+	if int(code[:8], 16) % 2 == 0:
+		types.append("m1.large")
+	regions = {}
+	for region in ec2marketplace.EC2_REGIONS:
+		regions[region] = [{"instance" : t, "price-software" : "0.10", "price-ec2" : "0.20", "price-total-column" : "0.30"} for t in types]
+	return {"monthly" : "0", "regions" : regions}
+
+def expected_rows(region, filter_instance_type=None):
+	rows = 0
+	for code in IMAGES[region]:
+		if code == MISSING:
+			continue
+		rows += len([p for p in stub_product(code)["regions"][region] if filter_instance_type is None or p["instance"] == filter_instance_type])
+	return rows
+
+@unittest.skipIf(ec2marketplace is None or ec2marketplace.boto is None, "ec2marketplace requires boto and BeautifulSoup")
+class MarketplacePricesTest(unittest.TestCase):
+
+	def setUp(self):
+		self.saved = (ec2marketplace.boto.ec2.connect_to_region, ec2marketplace.prepare_product, ec2marketplace.EC2_REGIONS,
+			ec2marketplace.PRODUCT_STORE_FILE, ec2marketplace.RATE_LIMIT)
+		self.lookups = []
+		self.lock = threading.Lock()
+		ec2marketplace.boto.ec2.connect_to_region = StubConnection
+		ec2marketplace.prepare_product = self.prepare_product
+		ec2marketplace.EC2_REGIONS = sorted(IMAGES)
+		ec2marketplace.PRODUCT_STORE_FILE = None
+		ec2marketplace.RATE_LIMIT = None
+		ec2marketplace.PRODUCT_CACHE.clear()
+		self.failing = None
+
+	def tearDown(self):
+		(ec2marketplace.boto.ec2.connect_to_region, ec2marketplace.prepare_product, ec2marketplace.EC2_REGIONS,
+			ec2marketplace.PRODUCT_STORE_FILE, ec2marketplace.RATE_LIMIT) = self.saved
+		ec2marketplace.PRODUCT_CACHE.clear()
+
+	def prepare_product(self, code):
+		with self.lock:
+			self.lookups.append(code)
+		# long enough for the other images of the product to arrive while it is in flight
+		time.sleep(0.05)
+		if code == self.failing:
+			raise IOError("timed out")
+		if code == MISSING:
+			return [None, code, None]
+		return [stub_product(code), code, "https://aws.amazon.com/marketplace/pp/" + code]
+
+	def test_rows_per_region(self):
+		result = ec2marketplace.get_ec2_marketplace_prices()
+		self.assertEqual(sorted(result["regions"]), sorted(IMAGES))
+		for region in IMAGES:
+			self.assertEqual(len(result["regions"][region]), expected_rows(region), region)
+			amis = set(row["ami"] for row in result["regions"][region])
+			self.assertEqual(amis, set("ami-%s-%d" % (region, i) for i, code in enumerate(IMAGES[region]) if code != MISSING))
+
+	def test_each_product_is_looked_up_once(self):
+		ec2marketplace.get_ec2_marketplace_prices()
+		self.assertEqual(sorted(self.lookups), sorted(set(code for codes in IMAGES.values() for code in codes)))
+
+	def test_filters(self):
+		result = ec2marketplace.get_ec2_marketplace_prices("eu-west-1", "m1.large")
+		self.assertEqual(result["regions"].keys(), ["eu-west-1"])
+		self.assertEqual(len(result["regions"]["eu-west-1"]), expected_rows("eu-west-1", "m1.large"))
+		for row in result["regions"]["eu-west-1"]:
+			self.assertEqual(row["instance"], "m1.large")
+		self.assertEqual(sorted(self.lookups), sorted(set(IMAGES["eu-west-1"])))
+
+	def test_cached_products_are_not_looked_up_again(self):
+		first = ec2marketplace.get_ec2_marketplace_prices()
+		lookups = len(self.lookups)
+		second = ec2marketplace.get_ec2_marketplace_prices()
+		self.assertEqual(len(self.lookups), lookups)
+		for region in IMAGES:
+			self.assertEqual(sorted(first["regions"][region]), sorted(second["regions"][region]))
+
+	def test_failed_lookup_stops_threads_and_closes_store(self):
+		directory = tempfile.mkdtemp()
+		saved_store = ec2marketplace.ProductStore
+		stores = []
+		class Store(saved_store):
+			def __init__(self, *args, **kwargs):
+				saved_store.__init__(self, *args, **kwargs)
+				self.closed = False
+				stores.append(self)
+			def close(self):
+				saved_store.close(self)
+				self.closed = True
+		threads = threading.active_count()
+		self.failing = CODES[1]
+		ec2marketplace.ProductStore = Store
+		ec2marketplace.PRODUCT_STORE_FILE = os.path.join(directory, "products.sqlite")
+		try:
+			self.assertRaises(IOError, ec2marketplace.get_ec2_marketplace_prices)
+			self.assertEqual([store.closed for store in stores], [True])
+			# the workers return once their current lookup is done
+			deadline = time.time() + 5
+			while threading.active_count() > threads and time.time() < deadline:
+				time.sleep(0.01)
+			self.assertEqual(threading.active_count(), threads)
+		finally:
+			ec2marketplace.ProductStore = saved_store
+			shutil.rmtree(directory)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/python
+"""
+Checks of the pricing document parser against the previous regex + eval decoder.
+Run from the top directory with:   python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ec2instancespricing
+from benchmark import FIXTURES, FIXTURES_DIR, legacy_parse
+
+def _read_fixture(name):
+	f = open(os.path.join(FIXTURES_DIR, name))
+	try:
+		return f.read()
+	finally:
+		f.close()
+
+def _region_names(data):
+	return [r["region"] for r in data["config"]["regions"]]
+
+class ParseJsonpTest(unittest.TestCase):
+
+	def test_fixtures_match_legacy_decoder(self):
+		for name, file_name, quote_keys, predicate in FIXTURES:
+			text = _read_fixture(file_name)
+			self.assertEqual(ec2instancespricing._parse_jsonp(text), legacy_parse(text), name)
+
+	def test_fixture_region_selection(self):
+		for name, file_name, quote_keys, predicate in FIXTURES:
+			text = _read_fixture(file_name)
+			full = ec2instancespricing._parse_jsonp(text)
+			wanted = _region_names(full)[-1]
+			selected = ec2instancespricing._parse_jsonp(text, set([wanted]))
+			self.assertEqual(_region_names(selected), [wanted], name)
+			self.assertEqual(selected["config"]["regions"], full["config"]["regions"][-1:], name)
+
+	def test_words_followed_by_colon_inside_strings(self):
+		text = 'callback({vers:0.01,note:"rate: perhr, size:large"});'
+		self.assertEqual(ec2instancespricing._parse_jsonp(text), {"vers" : 0.01, "note" : "rate: perhr, size:large"})
+
+	def test_null_inside_strings(self):
+		text = 'callback({a:null,b:"nullable",c:"null"});'
+		self.assertEqual(ec2instancespricing._parse_jsonp(text), {"a" : None, "b" : "nullable", "c" : "null"})
+
+	def test_leading_comment(self):
+		text = '/*\n * This file is intended for use only on aws.amazon.com. null: x\n */\ncallback({a:1});'
+		self.assertEqual(ec2instancespricing._parse_jsonp(text), {"a" : 1})
+
+	def test_trailing_commas(self):
+		text = 'callback({a:[1,2,],b:{c:"d",},});'
+		self.assertEqual(ec2instancespricing._parse_jsonp(text), {"a" : [1, 2], "b" : {"c" : "d"}})
+
+	def test_single_quoted_strings(self):
+		text = "callback({a:'it\\'s',b:'say \"hi\"'});"
+		self.assertEqual(ec2instancespricing._parse_jsonp(text), {"a" : "it's", "b" : 'say "hi"'})
+
+	def test_unicode_escapes(self):
+		text = 'callback({a:"caf\\u00e9",b:"\\u0041"});'
+		self.assertEqual(ec2instancespricing._parse_jsonp(text), {"a" : "caf\xc3\xa9", "b" : "A"})
+
+	def test_rejects_code(self):
+		self.assertRaises(ValueError, ec2instancespricing._parse_jsonp, 'callback({a:__import__("os")});')
+
+	def test_region_selection_falls_back_when_elements_cannot_be_located(self):
+		text = 'callback({config:{regions:[{region:"a",v:1},{region:"b",note:"{region:\'c\'"},{region:"d",v:2}]}});'
+		self.assertEqual(ec2instancespricing._select_regions(text, set(["d"])), None)
+		data = ec2instancespricing._parse_jsonp(text, set(["d"]))
+		self.assertEqual(_region_names(data), ["a", "b", "d"])
+
+	def test_region_selection_falls_back_when_the_cut_does_not_parse(self):
+		text = 'callback({config:{regions:[{region:"a",v:1},{region:"b",v:2}]}});'
+		select_regions = ec2instancespricing._select_regions
+		ec2instancespricing._select_regions = lambda text, names: text[:-10]
+		try:
+			data = ec2instancespricing._parse_jsonp(text, set(["b"]))
+		finally:
+			ec2instancespricing._select_regions = select_regions
+		self.assertEqual(_region_names(data), ["a", "b"])
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/python
+"""
+Queries of the --serve HTTP server, on prices loaded from the sample documents in fixtures/.
+Run from the top directory with:   python -m unittest discover tests
+"""
+import json
+import os
+import sys
+import threading
+import unittest
+import urllib2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ec2instancespricing
+from benchmark import FIXTURES_DIR, install_fixtures, load_fixtures
+
+class PricingServerTest(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		install_fixtures(load_fixtures(FIXTURES_DIR))
+		ec2instancespricing.MEMO_MAX_DOCUMENTS = 64
+		cls.server = ec2instancespricing.PricingServer(("127.0.0.1", 0), ec2instancespricing.load_pricing_data, refresh_interval=0)
+		cls.memo_size = len(ec2instancespricing._MEMO)
+		cls.thread = threading.Thread(target=cls.server.serve_forever)
+		cls.thread.daemon = True
+		cls.thread.start()
+		cls.base = "http://127.0.0.1:%d" % cls.server.server_address[1]
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.server.shutdown()
+		cls.server.server_close()
+		cls.thread.join()
+
+	def get(self, path):
+		# the server is local, don't go through a proxy set in the environment
+		opener = urllib2.build_opener(urllib2.ProxyHandler({}))
+		return opener.open(self.base + path)
+
+	def get_json(self, path):
+		return json.load(self.get(path))
+
+	def test_status(self):
+		status = self.get_json("/status")
+		data = self.server.data
+		self.assertEqual(status["rows"], dict((t, len(data.tables[t])) for t in ec2instancespricing.PRICING_TYPES))
+		self.assertTrue(status["rows"]["ondemand"] > 0)
+
+	def test_documents_are_not_kept(self):
+		self.assertEqual(self.memo_size, 0)
+
+	def test_filters(self):
+		rows = self.get_json("/prices?type=ondemand&filter-region=us-east-1&filter-os-type=linux")
+		self.assertTrue(rows)
+		for row in rows:
+			self.assertEqual((row["region"], row["os"]), ("us-east-1", "linux"))
+
+	def test_cheapest_with_type(self):
+		expected = [r for r in self.server.data.tables["ondemand"] if (r.region, r.type, r.os) == ("us-east-1", "m4.large", "linux") and r.price is not None]
+		self.assertTrue(expected)
+		rows = self.get_json("/prices?type=ondemand&filter-region=us-east-1&filter-type=m4.large&filter-os-type=linux&cheapest=3")
+		self.assertEqual(len(rows), min(3, len(expected)))
+		prices = [row["price"] for row in rows]
+		self.assertEqual(prices, sorted(prices))
+		self.assertEqual(prices, sorted(r.price for r in expected)[:3])
+		for row in rows:
+			self.assertEqual(row["type"], "m4.large")
+
+	def test_max_price_with_type(self):
+		rows = self.get_json("/prices?type=ondemand&filter-type=m4.large&max-price=1000")
+		self.assertTrue(rows)
+		for row in rows:
+			self.assertEqual(row["type"], "m4.large")
+
+	def test_csv(self):
+		lines = self.get("/prices?type=reserved&filter-region=us-east-1&format=csv").read().splitlines()
+		self.assertEqual(lines[0], ",".join(["price" if f == "hourly" else f for f in ec2instancespricing.RESERVED_FIELDS]))
+		self.assertEqual(len(lines) - 1, len(self.server.data.query("reserved", "us-east-1")))
+
+	def test_bad_request(self):
+		try:
+			self.get("/prices?type=nope")
+		except urllib2.HTTPError, e:
+			self.assertEqual(e.code, 400)
+		else:
+			self.fail("no error for an unknown type")
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/python
+"""
+Stopping the iter_ec2_* generators early, as the CLI does when its output is closed (| head).
+Run from the top directory with:   python -m unittest discover tests
+"""
+import itertools
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ec2instancespricing
+from benchmark import FIXTURES_DIR, install_fixtures, load_fixtures
+
+def fetch_threads():
+	return [t for t in threading.enumerate() if t.name.startswith("ec2pricing-fetch-")]
+
+class StreamingCloseTest(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		install_fixtures(load_fixtures(FIXTURES_DIR))
+
+	def check_close(self, rows):
+		first = list(itertools.islice(rows, 3))
+		self.assertEqual(len(first), 3)
+		# the workers wait for the consumer with documents still to load
+		self.assertTrue(fetch_threads())
+		rows.close()
+		self.assertEqual(fetch_threads(), [])
+
+	def test_close_reserved(self):
+		self.check_close(ec2instancespricing.iter_ec2_reserved_instances_prices(concurrency=2))
+
+	def test_close_ondemand(self):
+		self.check_close(ec2instancespricing.iter_ec2_ondemand_instances_prices(concurrency=2))
+
+	def test_close_keeps_memo_empty(self):
+		ec2instancespricing.MEMO_MAX_DOCUMENTS = 64
+		try:
+			self.check_close(ec2instancespricing.iter_ec2_reserved_instances_prices(concurrency=2))
+			self.assertEqual(len(ec2instancespricing._MEMO), 0)
+		finally:
+			ec2instancespricing.MEMO_MAX_DOCUMENTS = 0
+
+if __name__ == "__main__":
+	unittest.main()